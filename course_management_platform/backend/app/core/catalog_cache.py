@@ -0,0 +1,102 @@
+# backend/app/core/catalog_cache.py
+
+import hashlib
+import os
+import threading
+import time
+from typing import Callable, NamedTuple
+
+# Upper bound (seconds) on how long a cached catalog is served. Writes in this
+# process invalidate immediately; the TTL only bounds staleness for writes
+# handled by another worker process.
+CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", 60))
+
+
+class CatalogEntry(NamedTuple):
+    body: bytes
+    etag: str
+
+
+# ============================================================
+# IN-PROCESS CATALOG CACHE
+# ============================================================
+# Holds the serialized GET /courses response. Every write that can change
+# the approved catalog calls invalidate() after its commit. A rebuild that
+# started before an invalidation is discarded instead of stored, so a slow
+# reader cannot put a pre-commit snapshot back into the cache.
+
+class CatalogCache:
+
+    def __init__(self, ttl: float = CATALOG_CACHE_TTL):
+        self.ttl = ttl
+
+        self._entry: CatalogEntry | None = None
+        self._built_at = 0.0
+        self._version = 0
+        self._lock = threading.Lock()
+
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+        }
+
+    def get(self, build: Callable[[], bytes]) -> CatalogEntry:
+        """Cached entry, or build(), store and return a fresh one"""
+        with self._lock:
+            if self._entry is not None and time.monotonic() - self._built_at < self.ttl:
+                self._stats["hits"] += 1
+                return self._entry
+            self._stats["misses"] += 1
+            version = self._version
+
+        body = build()
+        entry = CatalogEntry(body=body, etag=make_etag(body))
+
+        with self._lock:
+            if version == self._version:
+                self._entry = entry
+                self._built_at = time.monotonic()
+
+        return entry
+
+    def invalidate(self):
+        with self._lock:
+            self._version += 1
+            self._entry = None
+            self._stats["invalidations"] += 1
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "cached": self._entry is not None,
+                "etag": self._entry.etag if self._entry else None,
+                "ttl": self.ttl,
+                **self._stats,
+            }
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag derived from the body, identical across worker processes"""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match check (RFC 9110 weak comparison, handles lists and *)"""
+    if not if_none_match:
+        return False
+
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == opaque for tag in candidates)
+
+
+# Shared cache for the public course catalog
+catalog_cache = CatalogCache()
+
+
+def invalidate_catalog_cache():
+    catalog_cache.invalidate()
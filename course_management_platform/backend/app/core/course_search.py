@@ -0,0 +1,346 @@
+# backend/app/core/course_search.py
+
+import heapq
+import itertools
+import math
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import Counter
+
+# Field weights for BM25F-style scoring: a title hit counts three times a
+# description hit
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "topics": 1.5,
+    "category": 1.0,
+    "level": 1.0,
+    "language": 1.0,
+    "description": 1.0,
+}
+FACET_FIELDS = ("category", "level", "language")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Type-ahead: shortest prefix that is expanded, and how many of the most
+# common matching terms it expands to
+MIN_PREFIX_LENGTH = 2
+MAX_PREFIX_EXPANSIONS = 32
+
+STOPWORDS = frozenset("a an and are as at be by for from in into is it of on or the to with".split())
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str | None) -> list:
+    if not text:
+        return []
+    return [t for t in _TOKEN.findall(text.casefold()) if t not in STOPWORDS]
+
+
+class _Doc:
+    __slots__ = ("course_id", "title", "description", "facets", "terms", "length", "title_key")
+
+    def __init__(self, course_id, title, description, facets, terms, length):
+        self.course_id = course_id
+        self.title = title
+        self.description = description
+        self.facets = facets  # (category, level, language)
+        self.terms = terms
+        self.length = length
+        self.title_key = ((title or "").casefold(), course_id)
+
+
+# ============================================================
+# IN-PROCESS COURSE SEARCH INDEX
+# ============================================================
+# Inverted index over approved courses: title, description, category,
+# level, language and the names of mapped topics. Each posting stores the
+# BM25 term-frequency part of the score ("impact") for one course, so a
+# query only multiplies by the term's idf and adds. Impacts use the
+# average document length at the time the course was indexed; a full
+# rebuild resets that drift.
+#
+# Alongside the postings the index keeps the number of courses per
+# (category, level, language) combination and the courses in title order,
+# so facet counts and the browse listing (empty query) need no scan.
+#
+# Courses are added/removed one at a time by the course and topic write
+# paths; build() replaces everything at once. As with the catalog cache,
+# a build whose snapshot was read before a write landed is discarded.
+
+class CourseSearchIndex:
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+        self._built_at = None
+        self._version = 0
+
+    def _reset(self):
+        self._docs = {}
+        self._postings = {}
+        self._vocabulary = []  # sorted, for prefix lookups
+        self._by_title = []    # sorted title keys, for the browse listing
+        self._facet_combos = Counter()
+        self._total_length = 0.0
+
+    # --------------------------------------------------------
+    # MAINTENANCE
+    # --------------------------------------------------------
+
+    @staticmethod
+    def _make_doc(course, topic_names) -> _Doc:
+        fields = {
+            "title": course.title,
+            "description": course.description,
+            "category": course.category,
+            "level": course.level,
+            "language": course.language,
+            "topics": " ".join(topic_names),
+        }
+
+        terms = Counter()
+        length = 0.0
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            counts = Counter(tokenize(text))
+            for token, n in counts.items():
+                terms[token] += n * weight
+            length += weight * counts.total()
+
+        return _Doc(
+            course.course_id,
+            course.title,
+            course.description,
+            (course.category, course.level, course.language),
+            dict(terms),
+            length
+        )
+
+    def _add(self, doc: _Doc, avg_length: float, incremental: bool = True):
+        """Index one course; build() passes incremental=False and sorts once at the end"""
+        self._docs[doc.course_id] = doc
+        self._total_length += doc.length
+        self._facet_combos[doc.facets] += 1
+        if incremental:
+            insort(self._by_title, doc.title_key)
+
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * doc.length / avg_length) if avg_length else BM25_K1
+        for term, tf in doc.terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                if incremental:
+                    insort(self._vocabulary, term)
+            postings[doc.course_id] = tf * (BM25_K1 + 1) / (tf + norm)
+
+    def _remove(self, course_id: int):
+        doc = self._docs.pop(course_id, None)
+        if doc is None:
+            return
+        self._total_length -= doc.length
+
+        self._facet_combos[doc.facets] -= 1
+        if not self._facet_combos[doc.facets]:
+            del self._facet_combos[doc.facets]
+        del self._by_title[bisect_left(self._by_title, doc.title_key)]
+
+        for term in doc.terms:
+            postings = self._postings[term]
+            del postings[course_id]
+            if not postings:
+                del self._postings[term]
+                del self._vocabulary[bisect_left(self._vocabulary, term)]
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def is_built(self) -> bool:
+        return self._built_at is not None
+
+    def build(self, courses, topic_names: dict, version: int | None = None) -> bool:
+        """
+        Replace the whole index; topic_names maps course_id -> [names].
+        Pass the version read before loading `courses`: if a write has
+        updated the index since, the snapshot is dropped and False returned.
+        """
+        docs = [self._make_doc(c, topic_names.get(c.course_id, [])) for c in courses]
+        avg_length = sum(doc.length for doc in docs) / len(docs) if docs else 0.0
+
+        with self._lock:
+            if version is not None and version != self._version:
+                return False
+            self._reset()
+            for doc in docs:
+                self._add(doc, avg_length, incremental=False)
+            self._vocabulary = sorted(self._postings)
+            self._by_title = sorted(doc.title_key for doc in docs)
+            self._built_at = time.monotonic()
+            return True
+
+    def upsert(self, course, topic_names):
+        doc = self._make_doc(course, topic_names)
+        with self._lock:
+            self._version += 1
+            self._remove(course.course_id)
+            avg_length = (self._total_length + doc.length) / (len(self._docs) + 1)
+            self._add(doc, avg_length)
+
+    def remove(self, course_id: int):
+        with self._lock:
+            self._version += 1
+            self._remove(course_id)
+
+    def clear(self):
+        """Empty the index; the next search rebuilds it"""
+        with self._lock:
+            self._version += 1
+            self._reset()
+            self._built_at = None
+
+    def __contains__(self, course_id: int) -> bool:
+        return course_id in self._docs
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "courses": len(self._docs),
+                "terms": len(self._postings),
+                "age_seconds": None if self._built_at is None else round(time.monotonic() - self._built_at, 1),
+            }
+
+    # --------------------------------------------------------
+    # QUERYING
+    # --------------------------------------------------------
+
+    def _expand_prefix(self, prefix: str) -> list:
+        start = bisect_left(self._vocabulary, prefix)
+        matches = []
+        for term in self._vocabulary[start:]:
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+        if len(matches) > MAX_PREFIX_EXPANSIONS:
+            matches = heapq.nlargest(MAX_PREFIX_EXPANSIONS, matches, key=lambda t: len(self._postings[t]))
+        return matches
+
+    def _idf(self, postings: dict) -> float:
+        df = len(postings)
+        return math.log(1 + (len(self._docs) - df + 0.5) / (df + 0.5))
+
+    def _match(self, alternatives: list) -> dict:
+        """
+        BM25 score of every course matching each group of alternative
+        terms (one group per query word; a prefix word has several terms,
+        of which the best-scoring one counts). The rarest group is scored
+        from its postings; later groups are only probed for the courses
+        still in the running.
+        """
+        groups = sorted(
+            ([(self._idf(p), p) for p in (self._postings.get(t) for t in terms) if p] for terms in alternatives),
+            key=lambda group: sum(len(p) for _, p in group)
+        )
+
+        if not groups[0]:
+            return {}
+        (idf, postings), *others = groups[0]
+        scores = {course_id: idf * impact for course_id, impact in postings.items()}
+        for idf, postings in others:
+            for course_id, impact in postings.items():
+                score = idf * impact
+                if score > scores.get(course_id, 0.0):
+                    scores[course_id] = score
+
+        for group in groups[1:]:
+            if not scores:
+                break
+            matched = {}
+            for course_id, score in scores.items():
+                best = max((idf * p[course_id] for idf, p in group if course_id in p), default=None)
+                if best is not None:
+                    matched[course_id] = score + best
+            scores = matched
+
+        return scores
+
+    def search(
+        self,
+        query: str = "",
+        filters: dict | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        prefix: bool = True
+    ) -> dict:
+        """
+        Ranked courses matching every query word, plus facet counts.
+        With prefix=True the last word also matches longer terms
+        ("pyth" -> "python"). An empty query lists every course by title.
+        Facet counts for a field ignore that field's own filter, so every
+        option keeps its count while it is selected.
+        """
+        wanted = [(i, (filters or {}).get(field)) for i, field in enumerate(FACET_FIELDS)]
+        wanted = [(i, value) for i, value in wanted if value]
+        tokens = tokenize(query)
+
+        def passes(combo, skip=None):
+            return all(combo[i] == value for i, value in wanted if i != skip)
+
+        with self._lock:
+            docs = self._docs
+            # Facet combinations that satisfy every filter
+            allowed = {combo for combo in self._facet_combos if passes(combo)}
+
+            if tokens:
+                alternatives = [[token] for token in tokens]
+                last = tokens[-1]
+                if prefix and not query[-1:].isspace() and len(last) >= MIN_PREFIX_LENGTH:
+                    alternatives[-1] = self._expand_prefix(last)
+
+                scores = self._match(alternatives) if docs else {}
+                combos = Counter([docs[cid].facets for cid in scores])
+
+                matched = [cid for cid in scores if docs[cid].facets in allowed] if wanted else scores
+                top = heapq.nlargest(offset + limit, matched, key=scores.__getitem__)[offset:]
+            else:
+                scores = {}
+                combos = self._facet_combos
+
+                listing = (cid for _, cid in self._by_title)
+                if wanted:
+                    listing = (cid for cid in listing if docs[cid].facets in allowed)
+                top = list(itertools.islice(listing, offset, offset + limit))
+
+            total = sum(n for combo, n in combos.items() if combo in allowed)
+
+            facets = {}
+            for i, field in enumerate(FACET_FIELDS):
+                counts = Counter()
+                for combo, n in combos.items():
+                    if combo[i] and (not wanted or passes(combo, skip=i)):
+                        counts[combo[i]] += n
+                facets[field] = dict(counts.most_common())
+
+            results = [
+                {
+                    "course_id": cid,
+                    "title": docs[cid].title,
+                    "description": docs[cid].description,
+                    **dict(zip(FACET_FIELDS, docs[cid].facets)),
+                    "score": round(scores.get(cid, 0.0), 4),
+                }
+                for cid in top
+            ]
+
+        return {"total": total, "results": results, "facets": facets}
+
+
+# Shared index for the public course catalog
+course_search_index = CourseSearchIndex()
@@ -0,0 +1,160 @@
+# backend/app/core/job_queue.py
+
+import os
+import threading
+import time
+from collections import deque
+
+from app.database import SessionLocal
+
+
+# ============================================================
+# IN-PROCESS BACKGROUND JOB QUEUE
+# ============================================================
+# Jobs are callables taking a fresh DB session as first argument. They run
+# on a small worker pool, off the request path. A job submitted with a key
+# is coalesced with an identical job still waiting in the backlog, so a
+# burst of "recompute course X" requests runs the recompute once.
+
+class JobQueue:
+
+    def __init__(self, session_factory, num_workers: int, max_backlog: int, name: str = "jobs"):
+        self.session_factory = session_factory
+        self.num_workers = num_workers
+        self.max_backlog = max_backlog
+        self.name = name
+
+        self._jobs = deque()
+        self._pending_keys = set()
+        self._cond = threading.Condition()
+        self._workers = []
+        self._running = False
+        self._active = 0
+
+        self._stats = {
+            "submitted": 0,
+            "coalesced": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+        }
+        self._last_error = None
+
+    # --------------------------------------------------------
+    # LIFECYCLE
+    # --------------------------------------------------------
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+
+        for i in range(self.num_workers):
+            worker = threading.Thread(
+                target=self._work,
+                name=f"{self.name}-worker-{i}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Stop accepting jobs, finish the backlog and join the workers.
+        Returns False if the timeout expired before the backlog emptied."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in self._workers:
+            worker.join(None if deadline is None else max(0, deadline - time.monotonic()))
+
+        self._workers = [w for w in self._workers if w.is_alive()]
+        return not self._workers
+
+    # --------------------------------------------------------
+    # SUBMISSION
+    # --------------------------------------------------------
+
+    def submit(self, fn, *args, key=None) -> bool:
+        """
+        Queue fn(db, *args). Returns False when the queue is not running or the
+        backlog is full, in which case the caller should run the work itself.
+        """
+        with self._cond:
+            if not self._running:
+                return False
+
+            if key is not None and key in self._pending_keys:
+                self._stats["coalesced"] += 1
+                return True
+
+            if len(self._jobs) >= self.max_backlog:
+                self._stats["rejected"] += 1
+                return False
+
+            self._jobs.append((key, fn, args))
+            if key is not None:
+                self._pending_keys.add(key)
+            self._stats["submitted"] += 1
+            self._cond.notify()
+
+        return True
+
+    def status(self) -> dict:
+        with self._cond:
+            return {
+                "running": self._running,
+                "workers": len(self._workers),
+                "backlog": len(self._jobs),
+                "max_backlog": self.max_backlog,
+                "in_progress": self._active,
+                **self._stats,
+                "last_error": self._last_error,
+            }
+
+    # --------------------------------------------------------
+    # WORKER LOOP
+    # --------------------------------------------------------
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._jobs and self._running:
+                    self._cond.wait()
+
+                # Shutting down and nothing left to do
+                if not self._jobs:
+                    return
+
+                key, fn, args = self._jobs.popleft()
+                self._pending_keys.discard(key)
+                self._active += 1
+
+            error = None
+            db = self.session_factory()
+            try:
+                fn(db, *args)
+            except Exception as e:
+                db.rollback()
+                error = f"{getattr(fn, '__name__', fn)}: {e}"
+            finally:
+                db.close()
+
+            with self._cond:
+                self._active -= 1
+                if error is None:
+                    self._stats["completed"] += 1
+                else:
+                    self._stats["failed"] += 1
+                    self._last_error = error
+
+
+# Shared queue for statistics maintenance, started/drained by main.py
+statistics_queue = JobQueue(
+    SessionLocal,
+    num_workers=int(os.getenv("STATISTICS_JOB_WORKERS", 2)),
+    max_backlog=int(os.getenv("STATISTICS_JOB_BACKLOG", 1000)),
+    name="statistics"
+)
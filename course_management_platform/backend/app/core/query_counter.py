@@ -0,0 +1,148 @@
+# backend/app/core/query_counter.py
+
+import logging
+import os
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Expose X-DB-* response headers (off by default)
+QUERY_HEADERS_ENABLED = os.getenv("SQL_QUERY_HEADERS", "false").lower() in ("1", "true", "yes")
+
+# Same statement shape executed this many times in one request → likely N+1
+N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", 10))
+
+
+# ============================================================
+# PER-REQUEST QUERY STATS
+# ============================================================
+
+class QueryStats:
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement: str, elapsed_ms: float):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.shapes[statement] += 1
+
+    def repeated_statements(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> dict:
+        """Statement shapes executed at least `threshold` times"""
+        return {sql: n for sql, n in self.shapes.items() if n >= threshold}
+
+
+# The stats object is shared by reference, so statements executed in the
+# threadpool (sync endpoints) are recorded on the request that started them.
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current_stats.get()
+
+
+# ============================================================
+# SQLALCHEMY HOOKS
+# ============================================================
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, (time.perf_counter() - conn.info["query_start"]) * 1000)
+
+
+def instrument_engine(engine: Engine):
+    """Attach the statement counter to a (sync) engine; idempotent."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ============================================================
+# QUERY BUDGETS
+# ============================================================
+
+def query_budget(max_queries: int):
+    """Declare the maximum number of SQL statements an endpoint may issue."""
+    def decorator(endpoint):
+        endpoint.__query_budget__ = max_queries
+        return endpoint
+    return decorator
+
+
+def endpoint_query_budget(endpoint) -> int | None:
+    return getattr(endpoint, "__query_budget__", None)
+
+
+# ============================================================
+# ASGI MIDDLEWARE
+# ============================================================
+
+class QueryCounterMiddleware:
+    """
+    Count SQL statements and DB time per HTTP request.
+    • Warns when a statement shape repeats N_PLUS_ONE_THRESHOLD+ times
+    • Warns when a route exceeds its declared query_budget
+    • With SQL_QUERY_HEADERS=true adds X-DB-Query-Count, X-DB-Time-Ms,
+      X-DB-Repeated-Statements (and X-DB-Query-Budget for budgeted routes)
+      to every response
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start" and QUERY_HEADERS_ENABLED:
+                headers = list(message.get("headers", []))
+                headers += [
+                    (b"x-db-query-count", str(stats.count).encode()),
+                    (b"x-db-time-ms", f"{stats.total_ms:.2f}".encode()),
+                    (b"x-db-repeated-statements", str(len(stats.repeated_statements())).encode()),
+                ]
+                # The router records the matched endpoint on the shared scope
+                budget = endpoint_query_budget(scope.get("endpoint"))
+                if budget is not None:
+                    headers.append((b"x-db-query-budget", str(budget).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current_stats.reset(token)
+            self._report(scope, stats)
+
+    def _report(self, scope, stats: QueryStats):
+        path = scope.get("path")
+
+        for sql, n in stats.repeated_statements().items():
+            logger.warning(
+                "Possible N+1 on %s %s: statement ran %d times: %s",
+                scope.get("method"), path, n, " ".join(sql.split())[:200]
+            )
+
+        budget = endpoint_query_budget(scope.get("endpoint"))
+        if budget is not None and stats.count > budget:
+            logger.warning(
+                "%s %s issued %d SQL statements (budget %d)",
+                scope.get("method"), path, stats.count, budget
+            )
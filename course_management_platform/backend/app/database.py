@@ -1,8 +1,13 @@
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
-from sqlalchemy import create_engine 
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool
 
 # Load .env
 load_dotenv()
@@ -12,11 +17,131 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL not set in .env")
 
+# SQL statement logging (off by default; very noisy under load)
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() in ("1", "true", "yes")
+
+# Connection pool sizing
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+
+def _async_database_url(url: str) -> str:
+    """Map the sync DATABASE_URL onto its asyncio driver"""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _async_database_url(DATABASE_URL)
+
+
+# ------------------------------------------------------------
+# Pool Instrumentation
+# ------------------------------------------------------------
+# Counters survive pool.recreate(), which builds a fresh pool instance.
+
+_pool_metrics = {
+    "checkouts": 0,
+    "checkins": 0,
+    "connects": 0,
+    "waits": 0,
+    "wait_time_ms": 0.0,
+    "max_wait_ms": 0.0,
+    "timeouts": 0,
+}
+_pool_metrics_lock = threading.Lock()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records checkouts which had to wait for a free connection."""
+
+    def _do_get(self):
+        # No idle connection and no overflow headroom → this checkout blocks
+        must_wait = self.checkedin() == 0 and 0 <= self._max_overflow <= self.overflow()
+
+        if not must_wait:
+            return super()._do_get()
+
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with _pool_metrics_lock:
+                _pool_metrics["timeouts"] += 1
+            raise
+        finally:
+            waited_ms = (time.perf_counter() - started) * 1000
+            with _pool_metrics_lock:
+                _pool_metrics["waits"] += 1
+                _pool_metrics["wait_time_ms"] += waited_ms
+                _pool_metrics["max_wait_ms"] = max(_pool_metrics["max_wait_ms"], waited_ms)
+
+
+engine_options = {"echo": DB_ECHO}
+pool_options = {}
+
+# SQLite (used by the service tests) keeps its own single-connection pools
+if not DATABASE_URL.startswith("sqlite"):
+    pool_options = dict(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+    engine_options.update(poolclass=InstrumentedQueuePool, **pool_options)
+
 engine = create_engine(
     DATABASE_URL,
-    echo=True
+    **engine_options
 )
 
+
+def _count(metric):
+    def listener(*args):
+        with _pool_metrics_lock:
+            _pool_metrics[metric] += 1
+    return listener
+
+
+event.listen(engine, "checkout", _count("checkouts"))
+event.listen(engine, "checkin", _count("checkins"))
+event.listen(engine, "connect", _count("connects"))
+
+
+def get_pool_status() -> dict:
+    """Current pool occupancy plus cumulative checkout/wait counters."""
+    pool = engine.pool
+
+    with _pool_metrics_lock:
+        metrics = dict(_pool_metrics)
+    metrics["wait_time_ms"] = round(metrics["wait_time_ms"], 2)
+    metrics["max_wait_ms"] = round(metrics["max_wait_ms"], 2)
+
+    status = {
+        "pool_class": type(pool).__name__,
+        **metrics,
+    }
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+
+    return status
+
+
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
@@ -30,4 +155,36 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# ------------------------------------------------------------
+# Async Stack (runs side by side with the sync engine)
+# ------------------------------------------------------------
+# Needs the asyncio driver (asyncpg for Postgres). Without it the sync stack
+# keeps working and only the async routes fail.
+
+try:
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        echo=DB_ECHO,
+        **pool_options
+    )
+except ImportError:
+    async_engine = None
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+async def get_async_db():
+    if async_engine is None:
+        raise RuntimeError(
+            f"Async database driver for {ASYNC_DATABASE_URL.split('://')[0]} is not installed"
+        )
+    async with AsyncSessionLocal() as db:
+        yield db
+
@@ -2,7 +2,7 @@ from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.database import engine
+from app.database import engine, async_engine, SessionLocal, get_pool_status
 from app.utils.db_utils import sync_postgres_serial_sequences
 
 from app.routers import auth
@@ -20,6 +20,13 @@ from app.routers import analyst
 from app.routers import admin
 from app.routers import moderation
 from app.routers import quiz
+from app.routers import async_reads
+from app.services.statistics_service import start_statistics_reconciler
+from app.services.search_service import start_search_index_refresher
+from app.core.job_queue import statistics_queue
+from app.core.query_counter import QueryCounterMiddleware, instrument_engine
+from app.core.catalog_cache import catalog_cache
+from app.core.course_search import course_search_index
 import uuid
 from datetime import datetime
 
@@ -27,8 +34,42 @@ from datetime import datetime
 SERVER_INSTANCE_ID = str(uuid.uuid4())
 SERVER_STARTED_AT = datetime.utcnow().isoformat()
 
+
+class ServerInstanceHeaderMiddleware:
+    """Stamp every response with X-Server-Instance so clients notice a restart
+    from their normal traffic instead of polling /server/instance."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_instance(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-server-instance", SERVER_INSTANCE_ID.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_instance)
+
+
 app = FastAPI()
 
+app.add_middleware(ServerInstanceHeaderMiddleware)
+
+# ============================================================
+# SQL QUERY COUNTER (per-request statement count / N+1 detection)
+# ============================================================
+instrument_engine(engine)
+if async_engine is not None:
+    instrument_engine(async_engine.sync_engine)
+
+app.add_middleware(QueryCounterMiddleware)
+
 # ============================================================
 # CORS MIDDLEWARE
 # ============================================================
@@ -55,6 +96,32 @@ def on_startup():
 		# swallow errors to avoid preventing app startup
 		pass
 
+	# Background workers for statistics maintenance
+	statistics_queue.start()
+
+	# Periodically recount statistics to correct drift from incremental deltas
+	app.state.statistics_reconciler = start_statistics_reconciler(SessionLocal)
+
+	# Load the course search index off the request path and keep it fresh
+	app.state.search_index_refresher = start_search_index_refresher(SessionLocal)
+
+
+@app.on_event("shutdown")
+def on_shutdown():
+	for name in ("statistics_reconciler", "search_index_refresher"):
+		stop = getattr(app.state, name, None)
+		if stop is not None:
+			stop.set()
+
+	# Finish queued statistics jobs before the process exits
+	statistics_queue.drain(timeout=30)
+
+
+@app.on_event("shutdown")
+async def close_async_engine():
+	if async_engine is not None:
+		await async_engine.dispose()
+
 app.include_router(auth.router)
 app.include_router(course.router)
 app.include_router(topic.router)
@@ -66,6 +133,7 @@ app.include_router(analyst.router)
 app.include_router(admin.router)
 app.include_router(moderation.router)
 app.include_router(quiz.router)
+app.include_router(async_reads.router)
 
 
 @app.get("/server/instance")
@@ -73,6 +141,21 @@ def server_instance():
     """Return current server instance id and start time."""
     return {"instance_id": SERVER_INSTANCE_ID, "started_at": SERVER_STARTED_AT}
 
+@app.get("/server/pool")
+def server_pool():
+    """Return database connection pool occupancy and checkout/wait counters."""
+    return get_pool_status()
+
+@app.get("/server/catalog-cache")
+def server_catalog_cache():
+    """Return course catalog cache state and hit/miss/invalidation counters."""
+    return catalog_cache.status()
+
+@app.get("/server/course-search")
+def server_course_search():
+    """Return course search index size and age."""
+    return course_search_index.status()
+
 @app.get("/")
 def root():
 	return RedirectResponse(url="/docs")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 from datetime import datetime
@@ -6,6 +6,12 @@ from datetime import datetime
 
 class Course(Base):
     __tablename__ = "course"
+    __table_args__ = (
+        # Catalog (Approved) and review queue (Pending)
+        Index("idx_course_approval_status", "approval_status"),
+        # An instructor's own course requests by status
+        Index("idx_course_created_by_approval", "created_by", "approval_status"),
+    )
 
     course_id = Column(Integer, primary_key=True)
 
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, Index
 from app.database import Base
 
 
 class CourseContent(Base):
     __tablename__ = "course_content"
+    __table_args__ = (
+        Index("idx_course_content_course", "course_id"),
+        Index("idx_course_content_topic", "topic_id"),
+    )
 
     content_id = Column(Integer, primary_key=True)
 
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index
 from app.database import Base
 
 
 class CourseTopic(Base):
     __tablename__ = "course_topic"
+    __table_args__ = (
+        # A course's topics in sequence order
+        Index("idx_course_topic_course_sequence", "course_id", "sequence_order"),
+    )
 
     course_id = Column(Integer, ForeignKey("course.course_id", ondelete="CASCADE"), primary_key=True)
     topic_id = Column(Integer, ForeignKey("topic.topic_id", ondelete="CASCADE"), primary_key=True)
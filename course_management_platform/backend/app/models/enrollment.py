@@ -1,9 +1,22 @@
-from sqlalchemy import Column, Integer, Date, String, Text, TIMESTAMP, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, Date, String, Text, TIMESTAMP, ForeignKey, Boolean, Index, text
 from app.database import Base
 
 
 class Enrollment(Base):
     __tablename__ = "enrollment"
+    __table_args__ = (
+        # Per-course enrollment and completion counts (analyst/admin)
+        Index("idx_enrollment_course_completion", "course_id", "completion_status"),
+        # A student's enrollments, newest first
+        Index("idx_enrollment_student_date", "student_user_id", "enrollment_date"),
+        # Public reviews of a course, most recent first
+        Index(
+            "idx_enrollment_public_reviews",
+            "course_id", "rated_at",
+            postgresql_where=text("is_review_public"),
+            sqlite_where=text("is_review_public = 1")
+        ),
+    )
 
     student_user_id = Column(Integer, ForeignKey("student.user_id", ondelete="CASCADE"), primary_key=True)
     course_id = Column(Integer, ForeignKey("course.course_id", ondelete="CASCADE"), primary_key=True)
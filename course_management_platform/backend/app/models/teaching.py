@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, Date, String, ForeignKey
+from sqlalchemy import Column, Integer, Date, String, ForeignKey, Index
 from app.database import Base
 
 
 class Teaching(Base):
     __tablename__ = "teaching"
+    __table_args__ = (
+        # The primary key leads with course_id; this serves lookups by instructor
+        Index("idx_teaching_instructor", "instructor_user_id"),
+    )
 
     course_id = Column(Integer, ForeignKey("course.course_id", ondelete="CASCADE"), primary_key=True)
     instructor_user_id = Column(Integer, ForeignKey("instructor.user_id", ondelete="CASCADE"), primary_key=True)
@@ -1,4 +1,6 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.university import University
 from app.models.course import Course
@@ -42,6 +44,13 @@ def get_all_courses(db: Session):
     ).all()
 
 
+async def get_all_courses_async(db: AsyncSession):
+    result = await db.execute(
+        select(Course).where(Course.approval_status == 'Approved')
+    )
+    return result.scalars().all()
+
+
 def get_approved_courses(db: Session):
     """Get only approved courses"""
     return db.query(Course).filter(
@@ -49,6 +58,19 @@ def get_approved_courses(db: Session):
     ).all()
 
 
+def get_approved_course_topic_names(db: Session):
+    """(course_id, topic name) for every topic mapped to an approved course"""
+    return db.query(CourseTopic.course_id, Topic.name).join(
+        Topic,
+        Topic.topic_id == CourseTopic.topic_id
+    ).join(
+        Course,
+        Course.course_id == CourseTopic.course_id
+    ).filter(
+        Course.approval_status == 'Approved'
+    ).all()
+
+
 def get_pending_courses_by_instructor(db: Session, instructor_user_id: int):
     """Get courses pending approval created by specific instructor"""
     return db.query(Course).filter(
@@ -63,6 +85,13 @@ def get_course_by_id(db: Session, course_id: int):
     ).first()
 
 
+async def get_course_by_id_async(db: AsyncSession, course_id: int):
+    result = await db.execute(
+        select(Course).where(Course.course_id == course_id)
+    )
+    return result.scalars().first()
+
+
 def get_university_by_course(db: Session, course_id: int):
     # Fetch the course and return its related university if present
     course = get_course_by_id(db, course_id)
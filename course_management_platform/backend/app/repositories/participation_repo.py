@@ -1,10 +1,13 @@
+from sqlalchemy import select, func
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 from datetime import date, datetime
 
 from app.models.enrollment import Enrollment
 from app.models.teaching import Teaching
 from app.models.user import User
+from app.models.course import Course
 
 
 # ENROLLMENT OPERATIONS
@@ -120,12 +123,29 @@ def get_instructors_by_course(
     ).all()
 
 
-def get_public_reviews_by_course(
+def get_instructors_by_courses(
     db: Session,
-    course_id: int
+    course_ids: list[int] | None = None
 ):
-    """Fetch all public reviews for a course with student names"""
-    return db.query(
+    """Teaching assignments (with instructor name) for the given courses,
+    or for every course when course_ids is None"""
+    query = db.query(Teaching, User.name).join(
+        User,
+        User.user_id == Teaching.instructor_user_id
+    )
+
+    if course_ids is not None:
+        query = query.filter(Teaching.course_id.in_(course_ids))
+
+    return query.order_by(
+        Teaching.course_id,
+        Teaching.assigned_date,
+        Teaching.instructor_user_id
+    ).all()
+
+
+def _public_reviews_statement(course_id: int):
+    return select(
         User.name.label("student_name"),
         Enrollment.rating,
         Enrollment.review_text,
@@ -133,31 +153,48 @@ def get_public_reviews_by_course(
     ).join(
         User,
         User.user_id == Enrollment.student_user_id
-    ).filter(
+    ).where(
         Enrollment.course_id == course_id,
         Enrollment.is_review_public == True,
         Enrollment.rating.isnot(None)
     ).order_by(
         Enrollment.rated_at.desc()
-    ).all()
+    )
 
 
-def get_student_enrollments(
+def get_public_reviews_by_course(
     db: Session,
-    student_user_id: int
+    course_id: int
 ):
-    """Fetch all enrollments for a student with course details"""
-    from app.models.course import Course
-    
-    enrollments = db.query(Enrollment, Course).join(
+    """Fetch all public reviews for a course with student names"""
+    return db.execute(_public_reviews_statement(course_id)).all()
+
+
+async def get_public_reviews_by_course_async(
+    db: AsyncSession,
+    course_id: int
+):
+    return (await db.execute(_public_reviews_statement(course_id))).all()
+
+
+def _student_enrollments_statement(student_user_id: int, course_ids: list[int] | None = None):
+    query = select(Enrollment, Course).join(
         Course,
         Course.course_id == Enrollment.course_id
-    ).filter(
+    ).where(
         Enrollment.student_user_id == student_user_id
-    ).order_by(
+    )
+
+    # Primary-key lookups of specific enrollments
+    if course_ids is not None:
+        query = query.where(Enrollment.course_id.in_(course_ids))
+
+    return query.order_by(
         Enrollment.enrollment_date.desc()
-    ).all()
-    
+    )
+
+
+def _student_enrollment_rows(enrollments):
     # Transform to dict format for serialization
     result = []
     for enrollment, course in enrollments:
@@ -179,16 +216,70 @@ def get_student_enrollments(
     return result
 
 
+def get_student_enrollments(
+    db: Session,
+    student_user_id: int
+):
+    """Fetch all enrollments for a student with course details"""
+    enrollments = db.execute(_student_enrollments_statement(student_user_id)).all()
+    return _student_enrollment_rows(enrollments)
+
+
+def get_student_enrollments_for_courses(
+    db: Session,
+    student_user_id: int,
+    course_ids: list[int]
+):
+    """Fetch the student's enrollments in the given courses only"""
+    if not course_ids:
+        return []
+    enrollments = db.execute(
+        _student_enrollments_statement(student_user_id, course_ids)
+    ).all()
+    return _student_enrollment_rows(enrollments)
+
+
+async def get_student_enrollments_async(
+    db: AsyncSession,
+    student_user_id: int
+):
+    enrollments = (await db.execute(_student_enrollments_statement(student_user_id))).all()
+    return _student_enrollment_rows(enrollments)
+
+
 def get_courses_by_instructor(
     db: Session,
     instructor_user_id: int
 ):
-    """Fetch all courses taught by an instructor"""
-    from app.models.course import Course
+    """Fetch all courses taught by an instructor, with enrollment counts"""
+    taught_course_ids = select(Teaching.course_id).where(
+        Teaching.instructor_user_id == instructor_user_id
+    )
+    
+    # Enrollment totals for the instructor's courses only, in one grouped scan
+    enrollment_counts = select(
+        Enrollment.course_id.label("course_id"),
+        func.count().label("enrollment_count"),
+        func.count().filter(
+            Enrollment.completion_status == "Completed"
+        ).label("completion_count")
+    ).where(
+        Enrollment.course_id.in_(taught_course_ids)
+    ).group_by(
+        Enrollment.course_id
+    ).subquery()
     
-    teachings = db.query(Teaching, Course).join(
+    teachings = db.query(
+        Teaching,
+        Course,
+        func.coalesce(enrollment_counts.c.enrollment_count, 0),
+        func.coalesce(enrollment_counts.c.completion_count, 0)
+    ).join(
         Course,
         Course.course_id == Teaching.course_id
+    ).outerjoin(
+        enrollment_counts,
+        enrollment_counts.c.course_id == Course.course_id
     ).filter(
         Teaching.instructor_user_id == instructor_user_id
     ).order_by(
@@ -196,20 +287,8 @@ def get_courses_by_instructor(
     ).all()
     
     # Transform to dict format for serialization
-    result = []
-    for teaching, course in teachings:
-        # Get enrollment count for the course
-        enrollment_count = db.query(Enrollment).filter(
-            Enrollment.course_id == course.course_id
-        ).count()
-        
-        # Get completion count
-        completion_count = db.query(Enrollment).filter(
-            Enrollment.course_id == course.course_id,
-            Enrollment.completion_status == "Completed"
-        ).count()
-        
-        result.append({
+    return [
+        {
             'course_id': course.course_id,
             'course_title': course.title,
             'category': course.category,
@@ -220,9 +299,9 @@ def get_courses_by_instructor(
             'assigned_date': teaching.assigned_date,
             'enrollment_count': enrollment_count,
             'completion_count': completion_count
-        })
-    
-    return result
+        }
+        for teaching, course, enrollment_count, completion_count in teachings
+    ]
 
 
 # TOPIC PROGRESSION OPERATIONS
@@ -1,8 +1,12 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, distinct
+from sqlalchemy import func, distinct, update, case, exists, and_, or_, select, cast, Numeric
+from sqlalchemy.dialects import postgresql, sqlite
 
 from app.models.enrollment import Enrollment
 from app.models.teaching import Teaching
+from app.models.course import Course
+from app.models.student import Student
+from app.models.instructor import Instructor
 from app.models.statistics import Statistics
 from app.models.student_statistics import StudentStatistics
 from app.models.instructor_statistics import InstructorStatistics
@@ -64,4 +68,289 @@ def get_instructor_counts(db: Session, instructor_user_id: int):
         Teaching.instructor_user_id == instructor_user_id
     ).scalar()
 
-    return courses, students
\ No newline at end of file
+    return courses, students
+
+
+# INCREMENTAL (DELTA) MAINTENANCE
+# Each helper is a single atomic UPDATE ... SET x = x + delta and returns the
+# number of rows touched, so callers can detect a missing statistics row.
+
+def _completion_rate(total, active):
+    # completed = total - active; stored as a percentage
+    return case(
+        (total > 0, (total - active) * 100.0 / total),
+        else_=0
+    )
+
+
+def apply_course_enrollment_delta(
+    db: Session,
+    course_id: int,
+    total_delta: int,
+    active_delta: int
+) -> int:
+
+    total = func.coalesce(Statistics.total_enrollments, 0) + total_delta
+    active = func.coalesce(Statistics.active_enrollments, 0) + active_delta
+
+    result = db.execute(
+        update(Statistics).where(
+            Statistics.course_id == course_id
+        ).values(
+            total_enrollments=total,
+            active_enrollments=active,
+            completion_rate=_completion_rate(total, active)
+        )
+    )
+
+    return result.rowcount
+
+
+def apply_student_enrollment_delta(
+    db: Session,
+    student_user_id: int,
+    total_delta: int,
+    completed_delta: int
+) -> int:
+
+    total = func.coalesce(StudentStatistics.total_enrollments, 0) + total_delta
+    completed = func.coalesce(StudentStatistics.completed_courses, 0) + completed_delta
+
+    result = db.execute(
+        update(StudentStatistics).where(
+            StudentStatistics.student_user_id == student_user_id
+        ).values(
+            total_enrollments=total,
+            completed_courses=completed,
+            active_courses=total - completed,
+            last_updated=func.now()
+        )
+    )
+
+    return result.rowcount
+
+
+def add_student_to_instructors(
+    db: Session,
+    student_user_id: int,
+    course_id: int
+) -> int:
+    """
+    Count a newly enrolled student for every instructor teaching the course,
+    unless that student already takes another course from the instructor
+    (total_students counts distinct students).
+    """
+
+    other_teaching = Teaching.__table__.alias("other_teaching")
+
+    teaches_course = exists().where(
+        Teaching.course_id == course_id,
+        Teaching.instructor_user_id == InstructorStatistics.instructor_user_id
+    )
+
+    already_counted = exists().where(
+        other_teaching.c.instructor_user_id == InstructorStatistics.instructor_user_id,
+        and_(
+            Enrollment.course_id == other_teaching.c.course_id,
+            Enrollment.student_user_id == student_user_id,
+            Enrollment.course_id != course_id
+        )
+    )
+
+    result = db.execute(
+        update(InstructorStatistics).where(
+            teaches_course,
+            ~already_counted
+        ).values(
+            total_students=func.coalesce(InstructorStatistics.total_students, 0) + 1,
+            last_updated=func.now()
+        ).execution_options(synchronize_session=False)
+    )
+
+    return result.rowcount
+
+
+# BULK (SET-BASED) RECOMPUTE
+# One INSERT ... SELECT ... GROUP BY ... ON CONFLICT DO UPDATE per table.
+# The conflict update only fires for rows whose values actually differ, so
+# the returned rowcount is the number of rows inserted or changed.
+
+def _insert_from_select(db: Session, model, select_stmt, key: str, columns: list[str]):
+
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+
+    return dialect.insert(model).from_select([key] + columns, select_stmt)
+
+
+def _upsert(db: Session, model, select_stmt, key: str, columns: list[str], touch: dict | None = None) -> int:
+
+    stmt = _insert_from_select(db, model, select_stmt, key, columns)
+
+    excluded = stmt.excluded
+    table = model.__table__
+
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[key],
+        set_={**{c: excluded[c] for c in columns}, **(touch or {})},
+        where=or_(*[table.c[c].is_distinct_from(excluded[c]) for c in columns])
+    )
+
+    return db.execute(stmt).rowcount
+
+
+COURSE_STATISTICS_COLUMNS = ["total_enrollments", "active_enrollments", "completion_rate", "average_completion_time"]
+STUDENT_STATISTICS_COLUMNS = ["total_enrollments", "completed_courses", "active_courses"]
+INSTRUCTOR_STATISTICS_COLUMNS = ["total_courses_taught", "total_students"]
+
+
+def _course_statistics_source():
+
+    total = func.count(Enrollment.student_user_id)
+    completed = func.count(Enrollment.student_user_id).filter(
+        Enrollment.completion_status == "Completed"
+    )
+    active = func.count(Enrollment.student_user_id).filter(
+        Enrollment.completion_status != "Completed"
+    )
+
+    return select(
+        Course.course_id,
+        total,
+        active,
+        cast(
+            case((total > 0, completed * 100.0 / total), else_=0),
+            Numeric(5, 2)
+        ),
+        0
+    ).select_from(Course).outerjoin(
+        Enrollment,
+        Enrollment.course_id == Course.course_id
+    ).group_by(
+        Course.course_id
+    )
+
+
+def _student_statistics_source():
+
+    total = func.count(Enrollment.course_id)
+    completed = func.count(Enrollment.course_id).filter(
+        Enrollment.completion_status == "Completed"
+    )
+
+    return select(
+        Student.user_id,
+        total,
+        completed,
+        total - completed
+    ).select_from(Student).outerjoin(
+        Enrollment,
+        Enrollment.student_user_id == Student.user_id
+    ).group_by(
+        Student.user_id
+    )
+
+
+def _instructor_statistics_source():
+
+    return select(
+        Instructor.user_id,
+        func.count(distinct(Teaching.course_id)),
+        func.count(distinct(Enrollment.student_user_id))
+    ).select_from(Instructor).outerjoin(
+        Teaching,
+        Teaching.instructor_user_id == Instructor.user_id
+    ).outerjoin(
+        Enrollment,
+        Enrollment.course_id == Teaching.course_id
+    ).group_by(
+        Instructor.user_id
+    )
+
+
+def bulk_upsert_course_statistics(db: Session) -> int:
+
+    return _upsert(
+        db,
+        Statistics,
+        _course_statistics_source(),
+        "course_id",
+        COURSE_STATISTICS_COLUMNS
+    )
+
+
+def bulk_upsert_student_statistics(db: Session) -> int:
+
+    return _upsert(
+        db,
+        StudentStatistics,
+        _student_statistics_source(),
+        "student_user_id",
+        STUDENT_STATISTICS_COLUMNS,
+        touch={"last_updated": func.now()}
+    )
+
+
+def bulk_upsert_instructor_statistics(db: Session) -> int:
+
+    return _upsert(
+        db,
+        InstructorStatistics,
+        _instructor_statistics_source(),
+        "instructor_user_id",
+        INSTRUCTOR_STATISTICS_COLUMNS,
+        touch={"last_updated": func.now()}
+    )
+
+
+# MISSING-ROW INSERTS
+# INSERT ... SELECT <absolute counts> ... ON CONFLICT DO NOTHING for one
+# course / student / the instructors of one course. When two workers race
+# to create the same row, one insert wins and the other is a no-op, so
+# the row is counted from the enrollment table exactly once. Returns the
+# number of rows created.
+
+def _insert_missing(db: Session, model, select_stmt, key: str, columns: list[str]) -> int:
+
+    stmt = _insert_from_select(
+        db, model, select_stmt, key, columns
+    ).on_conflict_do_nothing(index_elements=[key])
+
+    return db.execute(stmt).rowcount
+
+
+def insert_course_statistics_if_missing(db: Session, course_id: int) -> int:
+
+    return _insert_missing(
+        db,
+        Statistics,
+        _course_statistics_source().where(Course.course_id == course_id),
+        "course_id",
+        COURSE_STATISTICS_COLUMNS
+    )
+
+
+def insert_student_statistics_if_missing(db: Session, student_user_id: int) -> int:
+
+    return _insert_missing(
+        db,
+        StudentStatistics,
+        _student_statistics_source().where(Student.user_id == student_user_id),
+        "student_user_id",
+        STUDENT_STATISTICS_COLUMNS
+    )
+
+
+def insert_course_instructor_statistics_if_missing(db: Session, course_id: int) -> int:
+
+    course_instructors = select(Teaching.instructor_user_id).where(
+        Teaching.course_id == course_id
+    )
+
+    return _insert_missing(
+        db,
+        InstructorStatistics,
+        _instructor_statistics_source().where(Instructor.user_id.in_(course_instructors)),
+        "instructor_user_id",
+        INSTRUCTOR_STATISTICS_COLUMNS
+    )
+
@@ -1,4 +1,6 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.models.student import Student
@@ -24,6 +26,10 @@ def get_user_by_email(db: Session, email: str) -> User | None:
 def get_user_by_id(db: Session, user_id: int) -> User | None:
     return db.query(User).filter(User.user_id == user_id).first()
 
+async def get_user_by_id_async(db: AsyncSession, user_id: int) -> User | None:
+    result = await db.execute(select(User).where(User.user_id == user_id))
+    return result.scalars().first()
+
 # Create Student Subclass
 def create_student(db: Session, user_id: int, data: dict):
     student = Student(user_id=user_id, **data)
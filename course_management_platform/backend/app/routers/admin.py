@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.database import get_db
+from app.core.query_counter import query_budget
 
 # Guards
 from app.core.role_guards import require_admin_level
@@ -19,6 +21,7 @@ from app.services.admin_service import (
     approve_course_service,
     reject_course_service,
     get_course_students_service,
+    stream_course_students_service,
     get_student_profile_service,
     # Senior Admin services
     delete_user_service,
@@ -45,28 +48,42 @@ class RejectCourseRequest(BaseModel):
 # JUNIOR ADMIN: GET ALL COURSES
 # ============================================================
 @router.get("/courses")
+@query_budget(1)
 def get_all_courses(
+    approval_status: str = None,
+    category: str = None,
+    level: str = None,
+    limit: int = Query(None, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
     admin = Depends(require_admin_level(AdminLevel.JUNIOR))
 ):
-    return get_all_courses_admin_service(db)
+    return get_all_courses_admin_service(
+        db, approval_status, category, level, limit, offset
+    )
 
 
 # ============================================================
 # JUNIOR ADMIN: GET PENDING COURSES ONLY
 # ============================================================
 @router.get("/courses/pending/list")
+@query_budget(1)
 def get_pending_courses(
+    category: str = None,
+    level: str = None,
+    limit: int = Query(None, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
     admin = Depends(require_admin_level(AdminLevel.JUNIOR))
 ):
-    return get_pending_courses_service(db)
+    return get_pending_courses_service(db, category, level, limit, offset)
 
 
 # ============================================================
 # JUNIOR ADMIN: GET COURSE DETAILS
 # ============================================================
 @router.get("/courses/{course_id}")
+@query_budget(1)
 def get_course_details(
     course_id: int,
     db: Session = Depends(get_db),
@@ -182,21 +199,45 @@ def remove_instructor(
 # GET STUDENTS ENROLLED IN COURSE → Junior Admin
 # ============================================================
 @router.get("/courses/{course_id}/students")
+@query_budget(3)
 def get_course_students(
+    course_id: int,
+    limit: int = Query(None, ge=1, le=1000),
+    cursor: int = None,
+    db: Session = Depends(get_db),
+    admin = Depends(require_admin_level(AdminLevel.JUNIOR))
+):
+    return get_course_students_service(db, course_id, limit, cursor)
+
+
+# ============================================================
+# EXPORT COURSE STUDENTS (NDJSON STREAM) → Junior Admin
+# ============================================================
+@router.get("/courses/{course_id}/students/export")
+def export_course_students(
     course_id: int,
     db: Session = Depends(get_db),
     admin = Depends(require_admin_level(AdminLevel.JUNIOR))
 ):
-    return get_course_students_service(db, course_id)
+    return StreamingResponse(
+        stream_course_students_service(db, course_id),
+        media_type="application/x-ndjson",
+        headers={
+            "Content-Disposition": f"attachment; filename=course_{course_id}_students.ndjson"
+        }
+    )
 
 
 # ============================================================
 # GET STUDENT PROFILE → Junior Admin
 # ============================================================
 @router.get("/students/{student_user_id}")
+@query_budget(2)
 def get_student_profile(
     student_user_id: int,
+    limit: int = Query(None, ge=1, le=1000),
+    cursor: int = None,
     db: Session = Depends(get_db),
     admin = Depends(require_admin_level(AdminLevel.JUNIOR))
 ):
-    return get_student_profile_service(db, student_user_id)
+    return get_student_profile_service(db, student_user_id, limit, cursor)
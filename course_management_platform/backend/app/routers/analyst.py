@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.core.query_counter import query_budget
 from app.services.analyst_service import (
     get_platform_overview_service,
     get_all_courses_analytics_service,
@@ -18,19 +19,25 @@ router = APIRouter(
 
 # PLATFORM OVERVIEW
 @router.get("/overview")
-def get_platform_overview(db: Session = Depends(get_db)):
-    """Get platform-wide overview statistics"""
-    return get_platform_overview_service(db)
+@query_budget(1)
+def get_platform_overview(
+    cached: bool = False,
+    db: Session = Depends(get_db)
+):
+    """Get platform-wide overview statistics (cached=true serves a TTL-cached copy)"""
+    return get_platform_overview_service(db, cached)
 
 
 # COURSES ANALYTICS
 @router.get("/courses/analytics")
+@query_budget(1)
 def get_courses_analytics(db: Session = Depends(get_db)):
     """Get analytics for all courses"""
     return get_all_courses_analytics_service(db)
 
 
 @router.get("/courses/{course_id}/detailed")
+@query_budget(3)
 def get_course_detailed_analytics(course_id: int, db: Session = Depends(get_db)):
     """Get detailed analytics for a specific course including enrolled students"""
     return get_course_detailed_analytics_service(db, course_id)
@@ -38,13 +45,21 @@ def get_course_detailed_analytics(course_id: int, db: Session = Depends(get_db))
 
 # STUDENTS ANALYTICS
 @router.get("/students/analytics")
-def get_students_analytics(db: Session = Depends(get_db)):
-    """Get analytics for all students on the platform"""
-    return get_all_students_analytics_service(db)
+@query_budget(2)
+def get_students_analytics(
+    limit: int | None = Query(None, ge=1, le=1000),
+    cursor: str | None = None,
+    sort_by: str = "total_enrollments",
+    order: str = "desc",
+    db: Session = Depends(get_db)
+):
+    """Get analytics for all students on the platform (optionally paginated)"""
+    return get_all_students_analytics_service(db, limit, cursor, sort_by, order)
 
 
 # INSTRUCTORS ANALYTICS
 @router.get("/instructors/analytics")
+@query_budget(1)
 def get_instructors_analytics(db: Session = Depends(get_db)):
     """Get analytics for all instructors on the platform"""
     return get_all_instructors_analytics_service(db)
@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.core.job_queue import statistics_queue
+from app.core.query_counter import query_budget
 
 from app.services.statistics_service import (
     get_course_statistics_service,
     get_student_statistics_service,
     get_instructor_statistics_service,
+    get_fresh_student_statistics_service,
+    get_fresh_instructor_statistics_service,
     update_course_statistics_service,
     update_student_statistics_service,
     update_instructor_statistics_service
@@ -15,7 +19,8 @@ from app.services.statistics_service import (
     recompute_all_students_service,
     recompute_all_instructors_service,
     recompute_all_courses_service,
-    recompute_platform_service
+    recompute_platform_service,
+    STATISTICS_MAX_AGE_SECONDS
 )
 
 # Router Config
@@ -53,6 +58,22 @@ def get_student_analytics(
     )
 
 
+@router.get("/students/{student_user_id}/fresh")
+@query_budget(7)
+def get_fresh_student_analytics(
+    student_user_id: int,
+    max_age: int = Query(STATISTICS_MAX_AGE_SECONDS, ge=0),
+    db: Session = Depends(get_db)
+):
+    """Stored student statistics with last_updated; recomputed only when
+    missing or older than max_age seconds."""
+    return get_fresh_student_statistics_service(
+        db,
+        student_user_id,
+        max_age
+    )
+
+
 # ---------------- Instructor Stats ----------------
 
 @router.get("/instructors/{instructor_user_id}")
@@ -66,6 +87,22 @@ def get_instructor_analytics(
     )
 
 
+@router.get("/instructors/{instructor_user_id}/fresh")
+@query_budget(7)
+def get_fresh_instructor_analytics(
+    instructor_user_id: int,
+    max_age: int = Query(STATISTICS_MAX_AGE_SECONDS, ge=0),
+    db: Session = Depends(get_db)
+):
+    """Stored instructor statistics with last_updated; recomputed only when
+    missing or older than max_age seconds."""
+    return get_fresh_instructor_statistics_service(
+        db,
+        instructor_user_id,
+        max_age
+    )
+
+
 # RECOMPUTE ANALYTICS
 
 # ---------------- Course Recompute ----------------
@@ -127,6 +164,14 @@ def recompute_all_courses(db: Session = Depends(get_db)):
 
 
 @router.post('/recompute/platform')
-def recompute_platform(db: Session = Depends(get_db)):
-    """Recompute statistics for the entire platform (students, instructors, courses)."""
-    return recompute_platform_service(db)
\ No newline at end of file
+def recompute_platform(bulk: bool = False, db: Session = Depends(get_db)):
+    """Recompute statistics for the entire platform (students, instructors, courses).
+    bulk=true rebuilds each table with one set-based UPSERT in a single transaction."""
+    return recompute_platform_service(db, bulk)
+
+
+# ---------------- Background Job Queue ----------------
+@router.get('/jobs')
+def get_statistics_jobs_status():
+    """Backlog, worker and outcome counters of the background statistics queue."""
+    return statistics_queue.status()
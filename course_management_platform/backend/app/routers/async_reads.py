@@ -0,0 +1,112 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.core.query_counter import query_budget
+from app.schemas.course_schema import CourseResponse
+from app.schemas.enrollment_schema import (
+    PublicReviewResponse,
+    StudentEnrollmentResponse
+)
+from app.services.course_service import get_all_courses_async_service
+from app.services.participation_service import (
+    get_public_reviews_by_course_async_service,
+    get_student_enrollments_async_service
+)
+from app.services.analyst_service import (
+    get_platform_overview_async_service,
+    get_all_courses_analytics_async_service,
+    get_course_detailed_analytics_async_service,
+    get_all_students_analytics_async_service,
+    get_all_instructors_analytics_async_service
+)
+
+# 🔐 Auth Dependency (JWT Payload)
+from app.core.dependencies import get_current_user
+
+# Router Config
+# Async (AsyncSession) twins of the hot read paths. They return exactly what
+# the sync routes return, so both can be load-tested side by side while the
+# routers migrate incrementally.
+router = APIRouter(
+    prefix="/async",
+    tags=["Async Read Paths"]
+)
+
+
+# ------------------------------------------------------------
+# Courses → OPEN
+# ------------------------------------------------------------
+@router.get(
+    "/courses",
+    response_model=list[CourseResponse]
+)
+@query_budget(1)
+async def get_courses(
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await get_all_courses_async_service(db)
+
+
+# ------------------------------------------------------------
+# Enrollments
+# ------------------------------------------------------------
+@router.get("/enrollments/reviews/{course_id}", response_model=list[PublicReviewResponse])
+@query_budget(2)
+async def get_public_reviews(
+    course_id: int,
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await get_public_reviews_by_course_async_service(db, course_id)
+
+
+@router.get("/enrollments/student/{student_user_id}", response_model=list[StudentEnrollmentResponse])
+@query_budget(2)
+async def get_student_enrollments(
+    student_user_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    return await get_student_enrollments_async_service(db, student_user_id)
+
+
+# ------------------------------------------------------------
+# Data Analyst Dashboard
+# ------------------------------------------------------------
+@router.get("/analyst/overview")
+@query_budget(1)
+async def get_platform_overview(
+    cached: bool = False,
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await get_platform_overview_async_service(db, cached)
+
+
+@router.get("/analyst/courses/analytics")
+@query_budget(1)
+async def get_courses_analytics(db: AsyncSession = Depends(get_async_db)):
+    return await get_all_courses_analytics_async_service(db)
+
+
+@router.get("/analyst/courses/{course_id}/detailed")
+@query_budget(3)
+async def get_course_detailed_analytics(course_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await get_course_detailed_analytics_async_service(db, course_id)
+
+
+@router.get("/analyst/students/analytics")
+@query_budget(2)
+async def get_students_analytics(
+    limit: int | None = Query(None, ge=1, le=1000),
+    cursor: str | None = None,
+    sort_by: str = "total_enrollments",
+    order: str = "desc",
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await get_all_students_analytics_async_service(db, limit, cursor, sort_by, order)
+
+
+@router.get("/analyst/instructors/analytics")
+@query_budget(1)
+async def get_instructors_analytics(db: AsyncSession = Depends(get_async_db)):
+    return await get_all_instructors_analytics_async_service(db)
@@ -1,25 +1,29 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.core.query_counter import query_budget
+from app.core.catalog_cache import etag_matches
 from app.schemas.course_schema import (
     UniversityCreate,
     UniversityResponse,
     CourseCreate,
     CourseResponse,
     InstructorCourseCreate,
-    InstructorCourseResponse
+    InstructorCourseResponse,
+    CourseSearchResponse
 )
 from app.services.course_service import (
     create_university_service,
     get_all_universities_service,
     create_course_service,
-    get_all_courses_service,
+    get_course_catalog_service,
     get_course_by_id_service,
     get_university_by_course_service,
     create_instructor_course_service,
     get_instructor_pending_courses_service
 )
+from app.services.search_service import search_courses_service
 
 # 🔐 Role Guards
 from app.core.role_guards import require_role
@@ -78,14 +82,53 @@ def create_course(
 # ------------------------------------------------------------
 # Get Courses → OPEN
 # ------------------------------------------------------------
+# Served from the in-process catalog cache (0 queries on a hit).
+# Clients revalidate with If-None-Match and get 304 when unchanged.
 @router.get(
     "/courses",
     response_model=list[CourseResponse]
 )
+@query_budget(1)
 def get_courses(
+    db: Session = Depends(get_db),
+    if_none_match: str | None = Header(None)
+):
+    catalog = get_course_catalog_service(db)
+    headers = {"ETag": catalog.etag, "Cache-Control": "no-cache"}
+
+    if etag_matches(if_none_match, catalog.etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=catalog.body,
+        media_type="application/json",
+        headers=headers
+    )
+
+
+# ------------------------------------------------------------
+# Search Courses → OPEN
+# ------------------------------------------------------------
+# Ranked full-text search over approved courses (title, description,
+# category, level, language, topic names) from the in-process index.
+# The last word is matched as a prefix for type-ahead. Queries only hit
+# the database when the index is (re)built.
+@router.get(
+    "/courses/search",
+    response_model=CourseSearchResponse
+)
+@query_budget(2)
+def search_courses(
+    q: str = Query("", max_length=200),
+    category: str = None,
+    level: str = None,
+    language: str = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    prefix: bool = True,
     db: Session = Depends(get_db)
 ):
-    return get_all_courses_service(db)
+    return search_courses_service(db, q, category, level, language, limit, offset, prefix)
 
 
 # ------------------------------------------------------------
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, Body
+from fastapi import APIRouter, Depends, Body, Query
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.core.query_counter import query_budget
 from app.schemas.enrollment_schema import (
     EnrollmentCreate,
     CompletionUpdate,
@@ -17,6 +18,8 @@ from app.services.participation_service import (
     rate_course_service,
     get_public_reviews_by_course_service,
     get_student_enrollments_service,
+    get_student_enrollment_service,
+    get_student_enrollments_batch_service,
     update_topic_progress_service,
     submit_assessment_service
 )
@@ -83,6 +86,7 @@ def rate_course(
 
 # GET PUBLIC REVIEWS FOR A COURSE
 @router.get("/reviews/{course_id}", response_model=list[PublicReviewResponse])
+@query_budget(2)
 def get_public_reviews(
     course_id: int,
     db: Session = Depends(get_db)
@@ -91,6 +95,7 @@ def get_public_reviews(
 
 # GET STUDENT ENROLLMENTS
 @router.get("/student/{student_user_id}", response_model=list[StudentEnrollmentResponse])
+@query_budget(2)
 def get_student_enrollments(
     student_user_id: int,
     db: Session = Depends(get_db),
@@ -98,6 +103,28 @@ def get_student_enrollments(
 ):
     return get_student_enrollments_service(db, student_user_id)
 
+# GET ONE STUDENT ENROLLMENT (by student + course)
+@router.get("/student/{student_user_id}/course/{course_id}", response_model=StudentEnrollmentResponse)
+@query_budget(1)
+def get_student_enrollment(
+    student_user_id: int,
+    course_id: int,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    return get_student_enrollment_service(db, student_user_id, course_id)
+
+# GET STUDENT ENROLLMENTS FOR SEVERAL COURSES (?course_ids=1&course_ids=2)
+@router.get("/student/{student_user_id}/courses", response_model=list[StudentEnrollmentResponse])
+@query_budget(1)
+def get_student_enrollments_batch(
+    student_user_id: int,
+    course_ids: list[int] = Query(...),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    return get_student_enrollments_batch_service(db, student_user_id, course_ids)
+
 # UPDATE TOPIC PROGRESS
 @router.put("/progress/{student_user_id}/{course_id}/{topic_id}")
 def update_topic_progress(
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.core.query_counter import query_budget
 from app.schemas.teaching_schema import TeachingAssign
 from app.services.participation_service import (
     assign_instructor_service,
-    get_instructor_courses_service
+    get_instructor_courses_service,
+    get_instructors_by_courses_service
 )
 from app.repositories.participation_repo import (
     get_instructors_by_course
@@ -53,10 +55,28 @@ def get_instructors(
     )
 
 
+# ------------------------------------------------------------
+# Get Instructors For Many Courses (grouped by course_id) → OPEN
+# ------------------------------------------------------------
+# ?course_ids=1&course_ids=2 limits the lookup; without it every course
+# with an assignment is returned.
+@router.get("/courses")
+@query_budget(1)
+def get_instructors_for_courses(
+    course_ids: list[int] | None = Query(None),
+    db: Session = Depends(get_db)
+):
+    return get_instructors_by_courses_service(
+        db,
+        course_ids
+    )
+
+
 # ------------------------------------------------------------
 # Get Courses By Instructor → OPEN
 # ------------------------------------------------------------
 @router.get("/instructor/{instructor_user_id}")
+@query_budget(2)
 def get_instructor_courses(
     instructor_user_id: int,
     db: Session = Depends(get_db)
@@ -64,6 +64,30 @@ class CourseResponse(BaseModel):
         orm_mode = True
 
 
+# Course Search Schemas
+class CourseSearchResult(BaseModel):
+    course_id: int
+    title: str
+    description: Optional[str]
+    category: Optional[str]
+    level: Optional[str]
+    language: Optional[str]
+    score: float
+
+
+class CourseSearchFacets(BaseModel):
+    category: dict[str, int]
+    level: dict[str, int]
+    language: dict[str, int]
+
+
+class CourseSearchResponse(BaseModel):
+    query: str
+    total: int
+    results: List[CourseSearchResult]
+    facets: CourseSearchFacets
+
+
 # Quiz Question Schema for course creation
 class QuizQuestionCreate(BaseModel):
     question_text: str
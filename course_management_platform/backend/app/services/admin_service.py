@@ -1,9 +1,15 @@
 # backend/app/services/admin_service.py
 
+import json
+
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy import func, case, select
 from datetime import datetime
 
+from app.core.catalog_cache import invalidate_catalog_cache
+from app.services.search_service import reindex_course, remove_course_from_index
+
 # Models
 from app.models.user import User
 from app.models.teaching import Teaching
@@ -18,29 +24,94 @@ from app.models.administrator import Administrator
 from app.models.data_analyst import DataAnalyst
 
 
+# ============================================================
+# LEAD INSTRUCTOR LOOKUP
+# ============================================================
+
+def _lead_instructor_subquery(course_id: int = None):
+    """
+    One row per course with its lead instructor, from a single pass over
+    teaching. The "Lead Instructor" assignment wins; otherwise the earliest
+    assigned instructor is used.
+    """
+    ranked = select(
+        Teaching.course_id,
+        User.user_id.label("instructor_user_id"),
+        User.name.label("instructor_name"),
+        User.email.label("instructor_email"),
+        func.row_number().over(
+            partition_by=Teaching.course_id,
+            order_by=(
+                case((Teaching.role_in_course == "Lead Instructor", 0), else_=1),
+                Teaching.assigned_date,
+                Teaching.instructor_user_id
+            )
+        ).label("rank")
+    ).join(
+        User, User.user_id == Teaching.instructor_user_id
+    )
+
+    if course_id is not None:
+        ranked = ranked.where(Teaching.course_id == course_id)
+
+    ranked = ranked.subquery()
+
+    return select(ranked).where(ranked.c.rank == 1).subquery()
+
+
+def _admin_courses_query(
+    db: Session,
+    approval_status: str = None,
+    category: str = None,
+    level: str = None,
+    limit: int = None,
+    offset: int = 0
+):
+    """Courses joined to their lead instructor, filtered and paged"""
+    lead = _lead_instructor_subquery()
+
+    query = db.query(
+        Course,
+        lead.c.instructor_user_id,
+        lead.c.instructor_name,
+        lead.c.instructor_email
+    ).outerjoin(
+        lead, lead.c.course_id == Course.course_id
+    )
+
+    if approval_status:
+        query = query.filter(Course.approval_status == approval_status)
+    if category:
+        query = query.filter(Course.category == category)
+    if level:
+        query = query.filter(Course.level == level)
+
+    query = query.order_by(Course.course_id).offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+
+    return query
+
+
 # ============================================================
 # JUNIOR ADMIN: GET ALL COURSES (Approved + Pending)
 # ============================================================
 
-def get_all_courses_admin_service(db: Session):
+def get_all_courses_admin_service(
+    db: Session,
+    approval_status: str = None,
+    category: str = None,
+    level: str = None,
+    limit: int = None,
+    offset: int = 0
+):
     """Get all courses (both approved and pending) for admin view"""
-    courses = db.query(Course).all()
-    
-    result = []
-    for course in courses:
-        # Fetch instructor from Teaching table (not course.instructor)
-        instructor_name = "Unknown"
-        teaching = db.query(Teaching).filter(
-            Teaching.course_id == course.course_id
-        ).first()
-        if teaching and teaching.instructor_user_id:
-            instructor = db.query(User).filter(
-                User.user_id == teaching.instructor_user_id
-            ).first()
-            if instructor:
-                instructor_name = f"{instructor.name}"
-        
-        result.append({
+    rows = _admin_courses_query(
+        db, approval_status, category, level, limit, offset
+    ).all()
+    
+    return [
+        {
             "course_id": course.course_id,
             "title": course.title,
             "course_name": course.title,
@@ -49,40 +120,33 @@ def get_all_courses_admin_service(db: Session):
             "difficulty_level": course.level,
             "approval_status": course.approval_status,
             "created_by": course.created_by,
-            "instructor_name": instructor_name,
+            "instructor_name": instructor_name or "Unknown",
             "start_date": course.start_date,
             "duration": course.duration,
             "duration_in_weeks": course.duration,
-        })
-    
-    return result
+        }
+        for course, _, instructor_name, _ in rows
+    ]
 
 
 # ============================================================
 # JUNIOR ADMIN: GET PENDING COURSES ONLY
 # ============================================================
 
-def get_pending_courses_service(db: Session):
+def get_pending_courses_service(
+    db: Session,
+    category: str = None,
+    level: str = None,
+    limit: int = None,
+    offset: int = 0
+):
     """Get only pending courses for admin review"""
-    courses = db.query(Course).filter(
-        Course.approval_status == 'Pending'
+    rows = _admin_courses_query(
+        db, "Pending", category, level, limit, offset
     ).all()
     
-    result = []
-    for course in courses:
-        # Fetch instructor from Teaching table (not course.instructor)
-        instructor_name = "Unknown"
-        teaching = db.query(Teaching).filter(
-            Teaching.course_id == course.course_id
-        ).first()
-        if teaching and teaching.instructor_user_id:
-            instructor = db.query(User).filter(
-                User.user_id == teaching.instructor_user_id
-            ).first()
-            if instructor:
-                instructor_name = f"{instructor.first_name} {instructor.last_name}"
-        
-        result.append({
+    return [
+        {
             "course_id": course.course_id,
             "title": course.title,
             "course_name": course.title,
@@ -94,11 +158,11 @@ def get_pending_courses_service(db: Session):
             "duration": course.duration,
             "duration_in_weeks": course.duration,
             "created_by": course.created_by,
-            "instructor_name": instructor_name,
+            "instructor_name": instructor_name or "Unknown",
             "start_date": course.start_date,
-        })
-    
-    return result
+        }
+        for course, _, instructor_name, _ in rows
+    ]
 
 
 # ============================================================
@@ -107,31 +171,28 @@ def get_pending_courses_service(db: Session):
 
 def get_course_details_admin_service(db: Session, course_id: int):
     """Get detailed course information for admin view"""
-    course = db.query(Course).filter(
+    lead = _lead_instructor_subquery(course_id)
+
+    row = db.query(
+        Course,
+        lead.c.instructor_user_id,
+        lead.c.instructor_name,
+        lead.c.instructor_email
+    ).outerjoin(
+        lead, lead.c.course_id == Course.course_id
+    ).filter(
         Course.course_id == course_id
     ).first()
     
-    if not course:
+    if not row:
         raise HTTPException(
             status_code=404,
             detail="Course not found"
         )
     
-    # Fetch instructor from Teaching table
-    instructor_name = "Unknown"
-    instructor_email = "N/A"
-    instructor_user_id = None
-    teaching = db.query(Teaching).filter(
-        Teaching.course_id == course_id
-    ).first()
-    if teaching and teaching.instructor_user_id:
-        instructor = db.query(User).filter(
-            User.user_id == teaching.instructor_user_id
-        ).first()
-        if instructor:
-            instructor_name = f"{instructor.name}"
-            instructor_email = instructor.email
-            instructor_user_id = instructor.user_id
+    course, instructor_user_id, instructor_name, instructor_email = row
+    instructor_name = instructor_name or "Unknown"
+    instructor_email = instructor_email or "N/A"
     
     return {
         "course_id": course.course_id,
@@ -270,6 +331,7 @@ def approve_course_service(db: Session, course_id: int, admin_user_id: int):
     course.approved_at = datetime.now()
     
     db.commit()
+    invalidate_catalog_cache()
     
     # ================================================================
     # AUTO-ASSIGN INSTRUCTOR TO COURSE
@@ -298,6 +360,7 @@ def approve_course_service(db: Session, course_id: int, admin_user_id: int):
             instructor_assigned = True
     
     db.refresh(course)
+    reindex_course(db, course)
     
     return {
         "message": "Course approved successfully",
@@ -332,6 +395,8 @@ def reject_course_service(db: Session, course_id: int, reason: str = None):
     course.approval_status = 'Rejected'
     
     db.commit()
+    invalidate_catalog_cache()
+    remove_course_from_index(course.course_id)
     db.refresh(course)
     
     return {
@@ -367,6 +432,8 @@ def delete_course_request_service(db: Session, course_id: int):
     course_id_deleted = course.course_id
     db.delete(course)
     db.commit()
+    invalidate_catalog_cache()
+    remove_course_from_index(course_id_deleted)
     
     return {
         "message": "Course request deleted successfully",
@@ -490,8 +557,11 @@ def remove_instructor_service(
 # GET STUDENTS ENROLLED IN COURSE
 # ============================================================
 
-def get_course_students_service(db: Session, course_id: int):
-    """Get all students enrolled in a specific course"""
+# Rows fetched per round trip when streaming a full export
+STUDENT_EXPORT_BATCH_SIZE = 1000
+
+
+def _get_course_or_404(db: Session, course_id: int) -> Course:
     course = db.query(Course).filter(
         Course.course_id == course_id
     ).first()
@@ -502,95 +572,205 @@ def get_course_students_service(db: Session, course_id: int):
             detail="Course not found"
         )
     
-    # Query all enrollments for this course
-    enrollments = db.query(Enrollment).filter(
+    return course
+
+
+def _course_students_statement(course_id: int, after_user_id: int = None):
+    """Enrollments joined to their student, in student_user_id order"""
+    query = select(
+        User.user_id,
+        User.name,
+        User.email,
+        Enrollment.completion_status,
+        Enrollment.enrollment_date,
+        Enrollment.rating,
+        Enrollment.review_text,
+        Enrollment.is_review_public,
+        Enrollment.grade
+    ).join(
+        User, User.user_id == Enrollment.student_user_id
+    ).where(
         Enrollment.course_id == course_id
-    ).all()
+    )
     
-    students_list = []
-    for enrollment in enrollments:
-        student = db.query(User).filter(
-            User.user_id == enrollment.student_user_id
-        ).first()
-        
-        if student:
-            students_list.append({
-                "student_user_id": student.user_id,
-                "student_name": f"{student.name}",
-                "student_email": student.email,
-                "completion_status": enrollment.completion_status,
-                "enrollment_date": enrollment.enrollment_date,
-                "rating": enrollment.rating,
-                "review_text": enrollment.review_text,
-                "is_review_public": enrollment.is_review_public,
-                "grade": enrollment.grade,
-            })
+    if after_user_id is not None:
+        query = query.where(Enrollment.student_user_id > after_user_id)
+    
+    return query.order_by(Enrollment.student_user_id)
+
+
+def _course_student_row(row) -> dict:
+    return {
+        "student_user_id": row.user_id,
+        "student_name": f"{row.name}",
+        "student_email": row.email,
+        "completion_status": row.completion_status,
+        "enrollment_date": row.enrollment_date,
+        "rating": row.rating,
+        "review_text": row.review_text,
+        "is_review_public": row.is_review_public,
+        "grade": row.grade,
+    }
+
+
+def get_course_students_service(
+    db: Session,
+    course_id: int,
+    limit: int = None,
+    cursor: int = None
+):
+    """
+    Get students enrolled in a specific course.
+    With a limit, returns one page plus next_cursor (the last student_user_id
+    on the page) to pass back as cursor.
+    """
+    course = _get_course_or_404(db, course_id)
+    
+    query = _course_students_statement(course_id, cursor)
+    if limit is not None:
+        # Fetch one extra row to know whether another page exists
+        query = query.limit(limit + 1)
+    
+    rows = db.execute(query).all()
+    
+    has_more = limit is not None and len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
+    
+    if limit is None:
+        total_students = len(rows)
+    else:
+        total_students = db.query(func.count()).select_from(Enrollment).join(
+            User, User.user_id == Enrollment.student_user_id
+        ).filter(
+            Enrollment.course_id == course_id
+        ).scalar()
     
     return {
         "course_id": course_id,
         "course_name": course.title,
-        "total_students": len(students_list),
-        "students": students_list
+        "total_students": total_students,
+        "students": [_course_student_row(row) for row in rows],
+        "next_cursor": rows[-1].user_id if has_more else None
     }
 
 
+def stream_course_students_service(db: Session, course_id: int):
+    """
+    Full course roster as NDJSON lines, fetched in batches so memory stays
+    flat however many students the course has.
+    Raises 404 before streaming starts if the course does not exist.
+    The rows are read on a session of their own, opened and closed by the
+    generator: the response body is streamed after the endpoint returns,
+    when the request's session may already be closed.
+    """
+    _get_course_or_404(db, course_id)
+    bind = db.get_bind()
+    
+    def generate():
+        with Session(bind=bind) as stream_db:
+            result = stream_db.execute(
+                _course_students_statement(course_id).execution_options(
+                    yield_per=STUDENT_EXPORT_BATCH_SIZE
+                )
+            )
+            for row in result:
+                yield json.dumps(_course_student_row(row), default=str) + "\n"
+    
+    return generate()
+
+
 # ============================================================
 # GET STUDENT PROFILE WITH COURSES AND RATINGS
 # ============================================================
 
-def get_student_profile_service(db: Session, student_user_id: int):
-    """Get student profile with all courses and ratings"""
-    student_user = db.query(User).filter(
+def get_student_profile_service(
+    db: Session,
+    student_user_id: int,
+    limit: int = None,
+    cursor: int = None
+):
+    """
+    Get student profile with all courses and ratings.
+    With a limit, courses and ratings are paged together by course_id:
+    one page of enrollments plus next_cursor (the last course_id on the
+    page) to pass back as cursor. The totals always cover every course.
+    """
+    profile_query = db.query(User, Student).outerjoin(
+        Student, Student.user_id == User.user_id
+    )
+    
+    if limit is not None:
+        # Totals for the whole profile ride along with the student row
+        student_enrollments = select(func.count()).where(
+            Enrollment.student_user_id == User.user_id
+        )
+        profile_query = profile_query.add_columns(
+            student_enrollments.scalar_subquery().label("total_courses"),
+            student_enrollments.where(
+                Enrollment.rating.isnot(None)
+            ).scalar_subquery().label("total_ratings")
+        )
+    
+    row = profile_query.filter(
         User.user_id == student_user_id
     ).first()
     
-    if not student_user:
+    if not row:
         raise HTTPException(
             status_code=404,
             detail="Student not found"
         )
     
-    # Get student details
-    student = db.query(Student).filter(
-        Student.user_id == student_user_id
-    ).first()
+    student_user, student = row[0], row[1]
     
-    # Get all enrollments
-    enrollments = db.query(Enrollment).filter(
+    # Enrollments with their course in one query
+    enrollments_query = db.query(Enrollment, Course).join(
+        Course, Course.course_id == Enrollment.course_id
+    ).filter(
         Enrollment.student_user_id == student_user_id
-    ).all()
+    )
+    
+    if cursor is not None:
+        enrollments_query = enrollments_query.filter(Enrollment.course_id > cursor)
+    
+    enrollments_query = enrollments_query.order_by(Enrollment.course_id)
+    if limit is not None:
+        # Fetch one extra row to know whether another page exists
+        enrollments_query = enrollments_query.limit(limit + 1)
+    
+    enrollments = enrollments_query.all()
+    
+    has_more = limit is not None and len(enrollments) > limit
+    if has_more:
+        enrollments = enrollments[:limit]
     
     # Build courses list
     courses_list = []
     ratings_list = []
     
-    for enrollment in enrollments:
-        course = db.query(Course).filter(
-            Course.course_id == enrollment.course_id
-        ).first()
+    for enrollment, course in enrollments:
+        courses_list.append({
+            "course_id": course.course_id,
+            "course_name": course.title,
+            "category": course.category,
+            "level": course.level,
+            "completion_status": enrollment.completion_status,
+            "enrollment_date": enrollment.enrollment_date,
+            "completion_date": enrollment.completion_date,
+            "grade": enrollment.grade,
+        })
         
-        if course:
-            courses_list.append({
+        # Add rating if exists
+        if enrollment.rating is not None:
+            ratings_list.append({
                 "course_id": course.course_id,
                 "course_name": course.title,
-                "category": course.category,
-                "level": course.level,
-                "completion_status": enrollment.completion_status,
-                "enrollment_date": enrollment.enrollment_date,
-                "completion_date": enrollment.completion_date,
-                "grade": enrollment.grade,
+                "rating": enrollment.rating,
+                "review_text": enrollment.review_text,
+                "is_review_public": enrollment.is_review_public,
+                "rated_at": enrollment.rated_at,
             })
-            
-            # Add rating if exists
-            if enrollment.rating is not None:
-                ratings_list.append({
-                    "course_id": course.course_id,
-                    "course_name": course.title,
-                    "rating": enrollment.rating,
-                    "review_text": enrollment.review_text,
-                    "is_review_public": enrollment.is_review_public,
-                    "rated_at": enrollment.rated_at,
-                })
     
     profile_data = {
         "student_user_id": student_user.user_id,
@@ -600,10 +780,11 @@ def get_student_profile_service(db: Session, student_user_id: int):
         "country": student.country if student else None,
         "gender": student.gender if student else None,
         "education_level": student.education_level if student else None,
-        "total_courses": len(courses_list),
+        "total_courses": row.total_courses if limit is not None else len(courses_list),
         "courses": courses_list,
-        "total_ratings": len(ratings_list),
+        "total_ratings": row.total_ratings if limit is not None else len(ratings_list),
         "ratings": ratings_list,
+        "next_cursor": enrollments[-1][1].course_id if has_more else None
     }
     
-    return profile_data
\ No newline at end of file
+    return profile_data
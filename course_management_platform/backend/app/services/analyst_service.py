@@ -1,5 +1,10 @@
+import os
+import threading
+import time
+
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, case, select, tuple_
 from fastapi import HTTPException
 
 from app.models.course import Course
@@ -17,19 +22,44 @@ from app.models.instructor_statistics import InstructorStatistics
 # PLATFORM OVERVIEW
 # ============================================================
 
-def get_platform_overview_service(db: Session):
-    """Get overall platform statistics"""
+# Seconds a cached overview stays fresh when the cached mode is requested
+OVERVIEW_CACHE_TTL_SECONDS = int(
+    os.getenv("ANALYST_OVERVIEW_CACHE_TTL", 30)
+)
+
+# Shared by the sync and async paths. The lock only guards the dict; the
+# query runs outside it, by the one request that claimed the refresh.
+_overview_cache = {"value": None, "expires_at": 0.0, "refreshing": False}
+_overview_cache_lock = threading.Lock()
+
+
+def _platform_overview_statement():
+    """Every platform counter in a single statement"""
     
-    # Total counts
-    total_courses = db.query(func.count(Course.course_id)).scalar() or 0
-    total_students = db.query(func.count(Student.user_id)).scalar() or 0
-    total_instructors = db.query(func.count(Instructor.user_id)).scalar() or 0
-    total_enrollments = db.query(func.count(Enrollment.student_user_id)).scalar() or 0
+    # Both enrollment counters come from one pass over enrollment
+    enrollment_counts = select(
+        func.count().label("total_enrollments"),
+        func.count().filter(
+            Enrollment.completion_status == "Completed"
+        ).label("completed_enrollments")
+    ).select_from(Enrollment).subquery()
+    
+    return select(
+        select(func.count(Course.course_id)).scalar_subquery().label("total_courses"),
+        select(func.count(Student.user_id)).scalar_subquery().label("total_students"),
+        select(func.count(Instructor.user_id)).scalar_subquery().label("total_instructors"),
+        enrollment_counts.c.total_enrollments,
+        enrollment_counts.c.completed_enrollments
+    )
+
+
+def _platform_overview_response(counts):
     
-    # Completion stats
-    completed_enrollments = db.query(func.count(Enrollment.student_user_id)).filter(
-        Enrollment.completion_status == "Completed"
-    ).scalar() or 0
+    total_courses = counts.total_courses or 0
+    total_students = counts.total_students or 0
+    total_instructors = counts.total_instructors or 0
+    total_enrollments = counts.total_enrollments or 0
+    completed_enrollments = counts.completed_enrollments or 0
     
     active_enrollments = total_enrollments - completed_enrollments
     
@@ -55,92 +85,201 @@ def get_platform_overview_service(db: Session):
     }
 
 
+def _overview_cache_claim():
+    """
+    (copy, refresh): a copy of the cached overview when it is fresh, or
+    while another request is refreshing it; otherwise (None, True) and the
+    caller must compute the overview and hand it to _overview_cache_store.
+    """
+    with _overview_cache_lock:
+        value = _overview_cache["value"]
+        if value is not None and (
+            time.monotonic() < _overview_cache["expires_at"] or _overview_cache["refreshing"]
+        ):
+            return dict(value), False
+        _overview_cache["refreshing"] = True
+        return None, True
+
+
+def _overview_cache_store(value):
+    """Store a refreshed overview (None when the refresh failed) and release the claim"""
+    with _overview_cache_lock:
+        if value is not None:
+            _overview_cache["value"] = value
+            _overview_cache["expires_at"] = time.monotonic() + OVERVIEW_CACHE_TTL_SECONDS
+        _overview_cache["refreshing"] = False
+
+
+def get_platform_overview_service(db: Session, cached: bool = False):
+    """
+    Get overall platform statistics.
+    • cached=False: always query the database (one round trip)
+    • cached=True: serve a process-wide copy refreshed at most once
+      every OVERVIEW_CACHE_TTL_SECONDS, however many analysts poll
+    """
+    
+    if not cached:
+        return _platform_overview_response(db.execute(_platform_overview_statement()).one())
+    
+    copy, refresh = _overview_cache_claim()
+    if not refresh:
+        return copy
+    
+    value = None
+    try:
+        value = _platform_overview_response(db.execute(_platform_overview_statement()).one())
+    finally:
+        _overview_cache_store(value)
+    return dict(value)
+
+
+async def get_platform_overview_async_service(db: AsyncSession, cached: bool = False):
+    """Async variant of get_platform_overview_service (shares its cache)"""
+    
+    if not cached:
+        return _platform_overview_response((await db.execute(_platform_overview_statement())).one())
+    
+    copy, refresh = _overview_cache_claim()
+    if not refresh:
+        return copy
+    
+    value = None
+    try:
+        value = _platform_overview_response((await db.execute(_platform_overview_statement())).one())
+    finally:
+        _overview_cache_store(value)
+    return dict(value)
+
+
 # ============================================================
 # COURSES ANALYTICS
 # ============================================================
 
-def get_all_courses_analytics_service(db: Session):
-    """Get analytics for all courses"""
-    
-    courses = db.query(Course).all()
+def _course_enrollment_counts_subquery():
+    """Per-course enrollment totals computed in one grouped scan of enrollment"""
+    return select(
+        Enrollment.course_id.label("course_id"),
+        func.count().label("total_enrollments"),
+        func.count().filter(
+            Enrollment.completion_status == "Completed"
+        ).label("completed_enrollments"),
+        func.avg(Enrollment.rating).label("average_rating")
+    ).group_by(
+        Enrollment.course_id
+    ).subquery()
+
+
+def _courses_analytics_statement():
+    
+    enrollment_counts = _course_enrollment_counts_subquery()
+    
+    teaching_counts = select(
+        Teaching.course_id.label("course_id"),
+        func.count().label("total_instructors")
+    ).group_by(
+        Teaching.course_id
+    ).subquery()
+    
+    total_enrollments = func.coalesce(enrollment_counts.c.total_enrollments, 0)
+    
+    # One grouped aggregation: courses LEFT JOIN their enrollment and teaching counts
+    return select(
+        Course.course_id,
+        Course.title,
+        Course.category,
+        Course.level,
+        Course.description,
+        total_enrollments.label("total_enrollments"),
+        func.coalesce(enrollment_counts.c.completed_enrollments, 0).label("completed_enrollments"),
+        enrollment_counts.c.average_rating,
+        func.coalesce(teaching_counts.c.total_instructors, 0).label("total_instructors")
+    ).outerjoin(
+        enrollment_counts,
+        enrollment_counts.c.course_id == Course.course_id
+    ).outerjoin(
+        teaching_counts,
+        teaching_counts.c.course_id == Course.course_id
+    ).order_by(
+        total_enrollments.desc(),
+        Course.course_id
+    )
+
+
+def _courses_analytics_response(rows):
     
-    if not courses:
+    if not rows:
         return {"courses": []}
     
     courses_data = []
     
-    for course in courses:
-        # Count enrollments
-        total_enrollments = db.query(func.count(Enrollment.student_user_id)).filter(
-            Enrollment.course_id == course.course_id
-        ).scalar() or 0
-        
-        completed = db.query(func.count(Enrollment.student_user_id)).filter(
-            Enrollment.course_id == course.course_id,
-            Enrollment.completion_status == "Completed"
-        ).scalar() or 0
-        
-        active = total_enrollments - completed
+    for row in rows:
+        completed = row.completed_enrollments
+        active = row.total_enrollments - completed
         
         # Completion rate
         completion_rate = 0
-        if total_enrollments > 0:
-            completion_rate = round((completed / total_enrollments) * 100, 2)
-        
-        # Get average rating
-        avg_rating = db.query(func.avg(Enrollment.rating)).filter(
-            Enrollment.course_id == course.course_id,
-            Enrollment.rating.isnot(None)
-        ).scalar()
-        
-        avg_rating = round(float(avg_rating), 2) if avg_rating else 0
+        if row.total_enrollments > 0:
+            completion_rate = round((completed / row.total_enrollments) * 100, 2)
         
-        # Get instructors
-        instructors = db.query(Teaching).filter(
-            Teaching.course_id == course.course_id
-        ).count()
+        avg_rating = round(float(row.average_rating), 2) if row.average_rating else 0
         
         courses_data.append({
-            "course_id": course.course_id,
-            "title": course.title,
-            "category": course.category,
-            "level": course.level,
-            "description": course.description,
-            "total_enrollments": total_enrollments,
+            "course_id": row.course_id,
+            "title": row.title,
+            "category": row.category,
+            "level": row.level,
+            "description": row.description,
+            "total_enrollments": row.total_enrollments,
             "completed_enrollments": completed,
             "active_enrollments": active,
             "completion_rate": completion_rate,
             "average_rating": avg_rating,
-            "total_instructors": instructors
+            "total_instructors": row.total_instructors
         })
     
-    # Sort by total enrollments descending
-    courses_data.sort(key=lambda x: x["total_enrollments"], reverse=True)
-    
     return {
         "total_courses": len(courses_data),
         "courses": courses_data
     }
 
 
-def get_course_detailed_analytics_service(db: Session, course_id: int):
-    """Get detailed analytics for a specific course including enrolled students"""
-    
-    course = db.query(Course).filter(Course.course_id == course_id).first()
+def get_all_courses_analytics_service(db: Session):
+    """Get analytics for all courses"""
+    return _courses_analytics_response(db.execute(_courses_analytics_statement()).all())
+
+
+async def get_all_courses_analytics_async_service(db: AsyncSession):
+    """Async variant of get_all_courses_analytics_service"""
+    return _courses_analytics_response((await db.execute(_courses_analytics_statement())).all())
+
+
+def _course_detail_statements(course_id: int):
     
-    if not course:
-        raise HTTPException(status_code=404, detail="Course not found")
+    course = select(Course).where(Course.course_id == course_id)
     
-    # Get enrollments with student details
-    enrollments = db.query(
+    # Enrollments with student details
+    enrollments = select(
         Enrollment,
         User
     ).join(
         User,
         User.user_id == Enrollment.student_user_id
-    ).filter(
+    ).where(
         Enrollment.course_id == course_id
-    ).all()
+    )
+    
+    # Instructors
+    instructors = select(Teaching, User).join(
+        User,
+        User.user_id == Teaching.instructor_user_id
+    ).where(
+        Teaching.course_id == course_id
+    )
+    
+    return course, enrollments, instructors
+
+
+def _course_detail_response(course, enrollments, instructors):
     
     students_data = []
     total_enrollments = 0
@@ -164,14 +303,6 @@ def get_course_detailed_analytics_service(db: Session, course_id: int):
             "progress": f"{enrollment.current_topic or 0}"
         })
     
-    # Get instructors
-    instructors = db.query(Teaching, User).join(
-        User,
-        User.user_id == Teaching.instructor_user_id
-    ).filter(
-        Teaching.course_id == course_id
-    ).all()
-    
     instructors_data = []
     for teaching, user in instructors:
         instructors_data.append({
@@ -202,146 +333,299 @@ def get_course_detailed_analytics_service(db: Session, course_id: int):
     }
 
 
+def get_course_detailed_analytics_service(db: Session, course_id: int):
+    """Get detailed analytics for a specific course including enrolled students"""
+    
+    course_stmt, enrollments_stmt, instructors_stmt = _course_detail_statements(course_id)
+    
+    course = db.execute(course_stmt).scalars().first()
+    
+    if not course:
+        raise HTTPException(status_code=404, detail="Course not found")
+    
+    return _course_detail_response(
+        course,
+        db.execute(enrollments_stmt).all(),
+        db.execute(instructors_stmt).all()
+    )
+
+
+async def get_course_detailed_analytics_async_service(db: AsyncSession, course_id: int):
+    """Async variant of get_course_detailed_analytics_service"""
+    
+    course_stmt, enrollments_stmt, instructors_stmt = _course_detail_statements(course_id)
+    
+    course = (await db.execute(course_stmt)).scalars().first()
+    
+    if not course:
+        raise HTTPException(status_code=404, detail="Course not found")
+    
+    return _course_detail_response(
+        course,
+        (await db.execute(enrollments_stmt)).all(),
+        (await db.execute(instructors_stmt)).all()
+    )
+
+
 # ============================================================
 # STUDENTS ANALYTICS
 # ============================================================
 
-def get_all_students_analytics_service(db: Session):
-    """Get analytics for all students on the platform"""
+# Columns the students listing may be sorted (and keyset-paginated) by
+STUDENT_SORT_FIELDS = ("total_enrollments", "completed_courses", "active_courses")
+
+
+def _parse_student_cursor(cursor: str):
+    """Decode a '<sort value>:<user_id>' keyset cursor"""
+    try:
+        value, user_id = cursor.split(":")
+        return int(value), int(user_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _students_analytics_statements(
+    limit: int | None,
+    cursor: str | None,
+    sort_by: str,
+    order: str
+):
+    """Page statement plus, when paginating, the total-count statement"""
+    
+    if sort_by not in STUDENT_SORT_FIELDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"sort_by must be one of: {', '.join(STUDENT_SORT_FIELDS)}"
+        )
+    
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order must be 'asc' or 'desc'")
+    
+    enrollment_counts = select(
+        Enrollment.student_user_id.label("student_user_id"),
+        func.count().label("total_enrollments"),
+        func.count().filter(
+            Enrollment.completion_status == "Completed"
+        ).label("completed_courses"),
+        func.avg(Enrollment.rating).label("average_rating")
+    ).group_by(
+        Enrollment.student_user_id
+    ).subquery()
+    
+    total = func.coalesce(enrollment_counts.c.total_enrollments, 0)
+    completed = func.coalesce(enrollment_counts.c.completed_courses, 0)
+    
+    students = select(
+        User.user_id.label("user_id"),
+        User.name.label("name"),
+        User.email.label("email"),
+        total.label("total_enrollments"),
+        completed.label("completed_courses"),
+        (total - completed).label("active_courses"),
+        enrollment_counts.c.average_rating.label("average_rating"),
+        StudentStatistics.last_updated.label("last_updated")
+    ).outerjoin(
+        enrollment_counts,
+        enrollment_counts.c.student_user_id == User.user_id
+    ).outerjoin(
+        StudentStatistics,
+        StudentStatistics.student_user_id == User.user_id
+    ).where(
+        User.role == "Student"
+    ).subquery()
+    
+    sort_column = students.c[sort_by]
+    sort_key = tuple_(sort_column, students.c.user_id)
+    
+    query = select(students)
+    
+    if cursor:
+        cursor_key = tuple_(*_parse_student_cursor(cursor))
+        query = query.where(sort_key < cursor_key if order == "desc" else sort_key > cursor_key)
+    
+    if order == "desc":
+        query = query.order_by(sort_column.desc(), students.c.user_id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), students.c.user_id.asc())
+    
+    if limit is None:
+        return query, None
+    
+    # Fetch one extra row to know whether another page exists
+    count = select(func.count(User.user_id)).where(User.role == "Student")
+    
+    return query.limit(limit + 1), count
+
+
+def _students_analytics_response(rows, total_students, limit, sort_by):
     
-    students = db.query(User).filter(User.role == "Student").all()
+    has_more = limit is not None and len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
     
-    if not students:
-        return {"students": []}
+    if total_students is None:
+        total_students = len(rows)
     
     students_data = []
     
-    for student in students:
-        # Get enrollment stats
-        total_enrollments = db.query(func.count(Enrollment.course_id)).filter(
-            Enrollment.student_user_id == student.user_id
-        ).scalar() or 0
-        
-        completed = db.query(func.count(Enrollment.course_id)).filter(
-            Enrollment.student_user_id == student.user_id,
-            Enrollment.completion_status == "Completed"
-        ).scalar() or 0
-        
-        active = total_enrollments - completed
-        
-        # Get average rating given
-        avg_rating = db.query(func.avg(Enrollment.rating)).filter(
-            Enrollment.student_user_id == student.user_id,
-            Enrollment.rating.isnot(None)
-        ).scalar()
-        
-        avg_rating = round(float(avg_rating), 2) if avg_rating else 0
-        
-        # Get statistics from StudentStatistics table
-        stats = db.query(StudentStatistics).filter(
-            StudentStatistics.student_user_id == student.user_id
-        ).first()
-        
-        last_updated = None
-        if stats:
-            last_updated = stats.last_updated.isoformat() if stats.last_updated else None
+    for row in rows:
+        avg_rating = round(float(row.average_rating), 2) if row.average_rating else 0
         
         students_data.append({
-            "student_user_id": student.user_id,
-            "name": student.name,
-            "email": student.email,
-            "total_enrollments": total_enrollments,
-            "completed_courses": completed,
-            "active_courses": active,
+            "student_user_id": row.user_id,
+            "name": row.name,
+            "email": row.email,
+            "total_enrollments": row.total_enrollments,
+            "completed_courses": row.completed_courses,
+            "active_courses": row.active_courses,
             "average_rating": avg_rating,
-            "last_stats_update": last_updated
+            "last_stats_update": row.last_updated.isoformat() if row.last_updated else None
         })
     
-    # Sort by total enrollments descending
-    students_data.sort(key=lambda x: x["total_enrollments"], reverse=True)
+    next_cursor = None
+    if has_more:
+        last = students_data[-1]
+        next_cursor = f"{last[sort_by]}:{last['student_user_id']}"
     
     return {
-        "total_students": len(students_data),
-        "students": students_data
+        "total_students": total_students,
+        "students": students_data,
+        "next_cursor": next_cursor
     }
 
 
+def get_all_students_analytics_service(
+    db: Session,
+    limit: int | None = None,
+    cursor: str | None = None,
+    sort_by: str = "total_enrollments",
+    order: str = "desc"
+):
+    """
+    Get analytics for all students on the platform.
+    • One grouped query over enrollment joined to student_statistics
+    • Sorted in SQL by sort_by, ties broken by user_id
+    • Optional keyset pagination: pass the previous page's next_cursor
+    """
+    
+    page_stmt, count_stmt = _students_analytics_statements(limit, cursor, sort_by, order)
+    
+    rows = db.execute(page_stmt).all()
+    
+    total_students = None
+    if count_stmt is not None:
+        total_students = db.execute(count_stmt).scalar() or 0
+    
+    return _students_analytics_response(rows, total_students, limit, sort_by)
+
+
+async def get_all_students_analytics_async_service(
+    db: AsyncSession,
+    limit: int | None = None,
+    cursor: str | None = None,
+    sort_by: str = "total_enrollments",
+    order: str = "desc"
+):
+    """Async variant of get_all_students_analytics_service"""
+    
+    page_stmt, count_stmt = _students_analytics_statements(limit, cursor, sort_by, order)
+    
+    rows = (await db.execute(page_stmt)).all()
+    
+    total_students = None
+    if count_stmt is not None:
+        total_students = (await db.execute(count_stmt)).scalar() or 0
+    
+    return _students_analytics_response(rows, total_students, limit, sort_by)
+
+
 # ============================================================
 # INSTRUCTORS ANALYTICS
 # ============================================================
 
-def get_all_instructors_analytics_service(db: Session):
-    """Get analytics for all instructors on the platform"""
-    
-    instructors = db.query(User).filter(User.role == "Instructor").all()
+def _instructors_analytics_statement():
+    
+    course_counts = _course_enrollment_counts_subquery()
+    
+    # Per-course completion rate, NULL for courses nobody has enrolled in
+    course_completion_rate = case(
+        (
+            course_counts.c.total_enrollments > 0,
+            course_counts.c.completed_enrollments * 100.0 / course_counts.c.total_enrollments
+        ),
+        else_=None
+    )
+    
+    # Teaching stats rolled up per instructor (AVG skips the NULL rates)
+    teaching_stats = select(
+        Teaching.instructor_user_id.label("instructor_user_id"),
+        func.count(Teaching.course_id).label("total_courses_taught"),
+        func.sum(func.coalesce(course_counts.c.total_enrollments, 0)).label("total_students"),
+        func.avg(course_completion_rate).label("average_course_completion_rate")
+    ).outerjoin(
+        course_counts,
+        course_counts.c.course_id == Teaching.course_id
+    ).group_by(
+        Teaching.instructor_user_id
+    ).cte("teaching_stats")
+    
+    total_courses = func.coalesce(teaching_stats.c.total_courses_taught, 0)
+    
+    return select(
+        User.user_id,
+        User.name,
+        User.email,
+        total_courses.label("total_courses_taught"),
+        func.coalesce(teaching_stats.c.total_students, 0).label("total_students"),
+        teaching_stats.c.average_course_completion_rate,
+        InstructorStatistics.last_updated
+    ).outerjoin(
+        teaching_stats,
+        teaching_stats.c.instructor_user_id == User.user_id
+    ).outerjoin(
+        InstructorStatistics,
+        InstructorStatistics.instructor_user_id == User.user_id
+    ).where(
+        User.role == "Instructor"
+    ).order_by(
+        total_courses.desc(),
+        User.user_id
+    )
+
+
+def _instructors_analytics_response(rows):
     
-    if not instructors:
+    if not rows:
         return {"instructors": []}
     
     instructors_data = []
     
-    for instructor in instructors:
-        # Get teaching stats
-        total_courses = db.query(func.count(Teaching.course_id)).filter(
-            Teaching.instructor_user_id == instructor.user_id
-        ).scalar() or 0
-        
-        # Get total students across all courses taught
-        total_students = db.query(func.count(Enrollment.student_user_id)).join(
-            Teaching,
-            Teaching.course_id == Enrollment.course_id
-        ).filter(
-            Teaching.instructor_user_id == instructor.user_id
-        ).scalar() or 0
-        
-        # Get average course completion for courses taught
-        courses = db.query(Teaching.course_id).filter(
-            Teaching.instructor_user_id == instructor.user_id
-        ).all()
-        
+    for row in rows:
         avg_completion_rate = 0
-        if courses:
-            completion_rates = []
-            for (course_id,) in courses:
-                enrollments = db.query(func.count(Enrollment.student_user_id)).filter(
-                    Enrollment.course_id == course_id
-                ).scalar() or 0
-                
-                completed = db.query(func.count(Enrollment.student_user_id)).filter(
-                    Enrollment.course_id == course_id,
-                    Enrollment.completion_status == "Completed"
-                ).scalar() or 0
-                
-                if enrollments > 0:
-                    rate = (completed / enrollments) * 100
-                    completion_rates.append(rate)
-            
-            if completion_rates:
-                avg_completion_rate = round(sum(completion_rates) / len(completion_rates), 2)
-        
-        # Get statistics from InstructorStatistics table
-        stats = db.query(InstructorStatistics).filter(
-            InstructorStatistics.instructor_user_id == instructor.user_id
-        ).first()
-        
-        last_updated = None
-        if stats:
-            last_updated = stats.last_updated.isoformat() if stats.last_updated else None
+        if row.average_course_completion_rate is not None:
+            avg_completion_rate = round(float(row.average_course_completion_rate), 2)
         
         instructors_data.append({
-            "instructor_user_id": instructor.user_id,
-            "name": instructor.name,
-            "email": instructor.email,
-            "total_courses_taught": total_courses,
-            "total_students": total_students,
+            "instructor_user_id": row.user_id,
+            "name": row.name,
+            "email": row.email,
+            "total_courses_taught": row.total_courses_taught,
+            "total_students": int(row.total_students),
             "average_course_completion_rate": avg_completion_rate,
-            "last_stats_update": last_updated
+            "last_stats_update": row.last_updated.isoformat() if row.last_updated else None
         })
     
-    # Sort by total courses taught descending
-    instructors_data.sort(key=lambda x: x["total_courses_taught"], reverse=True)
-    
     return {
         "total_instructors": len(instructors_data),
         "instructors": instructors_data
     }
+
+
+def get_all_instructors_analytics_service(db: Session):
+    """Get analytics for all instructors on the platform"""
+    return _instructors_analytics_response(db.execute(_instructors_analytics_statement()).all())
+
+
+async def get_all_instructors_analytics_async_service(db: AsyncSession):
+    """Async variant of get_all_instructors_analytics_service"""
+    return _instructors_analytics_response((await db.execute(_instructors_analytics_statement())).all())
@@ -1,8 +1,13 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 
+from app.core.catalog_cache import catalog_cache, CatalogEntry, invalidate_catalog_cache
 from app.repositories import course_repo
 from app.repositories import quiz_repo
+from app.schemas.course_schema import CourseResponse
+from app.services.search_service import reindex_course
 
 # UNIVERSITY SERVICES
 def create_university_service(db: Session, payload):
@@ -40,11 +45,30 @@ def create_course_service(db: Session, payload):
         payload.dict()
     )
 
+    invalidate_catalog_cache()
+    reindex_course(db, course)
+
     return course
 
 
-def get_all_courses_service(db: Session):
-    return course_repo.get_approved_courses(db)
+_catalog_adapter = TypeAdapter(list[CourseResponse])
+
+
+def get_course_catalog_service(db: Session) -> CatalogEntry:
+    """Serialized approved-course list (JSON body + ETag), served from the catalog cache"""
+
+    def build() -> bytes:
+        courses = _catalog_adapter.validate_python(
+            course_repo.get_approved_courses(db),
+            from_attributes=True
+        )
+        return _catalog_adapter.dump_json(courses)
+
+    return catalog_cache.get(build)
+
+
+async def get_all_courses_async_service(db: AsyncSession):
+    return await course_repo.get_all_courses_async(db)
 
 
 def create_instructor_course_service(db: Session, payload, instructor_user_id: int):
@@ -111,7 +135,10 @@ def create_instructor_course_service(db: Session, payload, instructor_user_id: i
             final_assessment_topic.topic_id,
             None
         )
-    
+
+    invalidate_catalog_cache()
+    reindex_course(db, course)
+
     return course
 
 
@@ -194,6 +221,8 @@ def map_topic_to_course_service(
         sequence_order
     )
 
+    reindex_course(db, course)
+
     return mapping
 
 
@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from datetime import date
 
@@ -6,15 +7,15 @@ from app.repositories import participation_repo
 from app.repositories import user_repo
 from app.repositories import course_repo
 
-from app.models.teaching import Teaching
-
 from app.core.roles import Role
+from app.core.job_queue import statistics_queue
 
 # Import statistics service for updating stats on enrollment/teaching changes
 from app.services.statistics_service import (
-    update_course_statistics_service,
-    update_student_statistics_service,
-    update_instructor_statistics_service
+    update_instructor_statistics_service,
+    prepare_enrollment_statistics_service,
+    record_enrollment_created_service,
+    record_completion_change_service
 )
 
 def enroll_student_service(
@@ -60,32 +61,27 @@ def enroll_student_service(
     if existing:
         raise HTTPException(400, "Student already enrolled")
 
+    # Statistics rows must exist before the enrollment commits, so the
+    # deltas below never have to create them from counts that include it
+    prepare_enrollment_statistics_service(
+        db,
+        student_user_id,
+        course_id
+    )
+
     enrollment = participation_repo.create_enrollment(
         db,
         student_user_id,
         course_id
     )
     
-    # Update statistics when new enrollment is created
-    try:
-        update_course_statistics_service(db, course_id)
-        update_student_statistics_service(db, student_user_id)
-        
-        # Update statistics for all instructors teaching this course
-        instructors = db.query(Teaching).filter(
-            Teaching.course_id == course_id
-        ).all()
-        
-        for teaching in instructors:
-            try:
-                update_instructor_statistics_service(db, teaching.instructor_user_id)
-            except Exception:
-                # Swallow individual instructor stats errors
-                pass
-                
-    except Exception:
-        # Swallow statistics update errors to not block enrollment
-        pass
+    # Apply enrollment deltas to course, student and instructor statistics
+    _run_statistics_job(
+        db,
+        record_enrollment_created_service,
+        student_user_id,
+        course_id
+    )
     
     return enrollment
 
@@ -120,13 +116,19 @@ def update_completion_service(
     if not enrollment:
         raise HTTPException(404, "Enrollment not found")
 
-    return participation_repo.update_completion(
+    was_completed = enrollment.completion_status == "Completed"
+
+    enrollment = participation_repo.update_completion(
         db,
         enrollment,
         completion_status,
         completion_date
     )
 
+    _record_completion_change(db, enrollment, was_completed)
+
+    return enrollment
+
 
 # Rating Update
 def rate_course_service(
@@ -231,12 +233,13 @@ def assign_instructor_service(
         role_in_course
     )
     
-    # Update statistics when instructor is assigned
-    try:
-        update_instructor_statistics_service(db, instructor_user_id)
-    except Exception:
-        # Swallow statistics update errors to not block assignment
-        pass
+    # Update statistics when instructor is assigned (coalesced per instructor)
+    _run_statistics_job(
+        db,
+        update_instructor_statistics_service,
+        instructor_user_id,
+        key=("recompute_instructor", instructor_user_id)
+    )
     
     return teaching
 
@@ -258,6 +261,22 @@ def get_public_reviews_by_course_service(
     return participation_repo.get_public_reviews_by_course(db, course_id)
 
 
+async def get_public_reviews_by_course_async_service(
+    db: AsyncSession,
+    course_id: int
+):
+    """Async variant of get_public_reviews_by_course_service"""
+    course = await course_repo.get_course_by_id_async(db, course_id)
+
+    if not course:
+        raise HTTPException(
+            status_code=404,
+            detail="Course not found"
+        )
+
+    return await participation_repo.get_public_reviews_by_course_async(db, course_id)
+
+
 def get_student_enrollments_service(
     db: Session,
     student_user_id: int
@@ -275,6 +294,86 @@ def get_student_enrollments_service(
     return participation_repo.get_student_enrollments(db, student_user_id)
 
 
+def get_instructors_by_courses_service(
+    db: Session,
+    course_ids: list[int] | None = None
+):
+    """Instructor assignments grouped by course_id, for many courses in one query"""
+    grouped = {}
+
+    # Requested courses without any instructor still get an (empty) entry
+    if course_ids is not None:
+        grouped = {course_id: [] for course_id in course_ids}
+
+    for teaching, instructor_name in participation_repo.get_instructors_by_courses(db, course_ids):
+        grouped.setdefault(teaching.course_id, []).append({
+            "course_id": teaching.course_id,
+            "instructor_user_id": teaching.instructor_user_id,
+            "instructor_name": instructor_name,
+            "assigned_date": teaching.assigned_date,
+            "role_in_course": teaching.role_in_course
+        })
+
+    return grouped
+
+
+def get_student_enrollment_service(
+    db: Session,
+    student_user_id: int,
+    course_id: int
+):
+    """Fetch one enrollment (with course info) by its (student, course) key"""
+    enrollments = participation_repo.get_student_enrollments_for_courses(
+        db, student_user_id, [course_id]
+    )
+
+    if not enrollments:
+        raise HTTPException(
+            status_code=404,
+            detail="Enrollment not found"
+        )
+
+    return enrollments[0]
+
+
+# Upper bound on course ids per batched enrollment lookup
+MAX_ENROLLMENT_BATCH = 100
+
+
+def get_student_enrollments_batch_service(
+    db: Session,
+    student_user_id: int,
+    course_ids: list[int]
+):
+    """Fetch the student's enrollments in several courses; courses the
+    student is not enrolled in are left out"""
+    if len(course_ids) > MAX_ENROLLMENT_BATCH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_ENROLLMENT_BATCH} course ids per request"
+        )
+
+    return participation_repo.get_student_enrollments_for_courses(
+        db, student_user_id, list(dict.fromkeys(course_ids))
+    )
+
+
+async def get_student_enrollments_async_service(
+    db: AsyncSession,
+    student_user_id: int
+):
+    """Async variant of get_student_enrollments_service"""
+    user = await user_repo.get_user_by_id_async(db, student_user_id)
+
+    if not user:
+        raise HTTPException(
+            status_code=404,
+            detail="Student not found"
+        )
+
+    return await participation_repo.get_student_enrollments_async(db, student_user_id)
+
+
 def get_instructor_courses_service(
     db: Session,
     instructor_user_id: int
@@ -472,12 +571,14 @@ def submit_assessment_service(
 
     # Auto-complete if grade != F
     if grade != "F":
+        was_completed = enrollment.completion_status == "Completed"
         participation_repo.update_completion(
             db,
             enrollment,
             "Completed",
             date.today()
         )
+        _record_completion_change(db, enrollment, was_completed)
 
     # Return result
     return {
@@ -488,6 +589,33 @@ def submit_assessment_service(
     }
 
 
+def _run_statistics_job(db: Session, fn, *args, key=None):
+    """
+    Hand statistics work to the background queue so the request never waits
+    on it. If the queue is stopped or its backlog is full, run it inline.
+    Statistics errors never fail the request.
+    """
+    if statistics_queue.submit(fn, *args, key=key):
+        return
+
+    try:
+        fn(db, *args)
+    except Exception:
+        db.rollback()
+
+
+def _record_completion_change(db: Session, enrollment, was_completed: bool):
+    """Apply the completion delta to statistics without failing the request"""
+    _run_statistics_job(
+        db,
+        record_completion_change_service,
+        enrollment.student_user_id,
+        enrollment.course_id,
+        was_completed,
+        enrollment.completion_status == "Completed"
+    )
+
+
 def _map_score_to_grade(score: int) -> str:
     """
     Map score (0-100) to grade using percentage thresholds.
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
+from app.core.catalog_cache import invalidate_catalog_cache
 from app.repositories import quiz_repo
 from app.models.course import Course
 
@@ -137,6 +138,10 @@ def update_answer_key_service(db: Session, course_id: int, answer_key: str):
         )
     
     updated_course = quiz_repo.update_answer_key(db, course_id, answer_key)
+
+    # The answer key is part of the public catalog payload
+    invalidate_catalog_cache()
+
     return {
         'course_id': updated_course.course_id,
         'quiz_answer_key': updated_course.quiz_answer_key
@@ -0,0 +1,110 @@
+import os
+import threading
+from collections import defaultdict
+
+from sqlalchemy.orm import Session
+
+from app.core.course_search import course_search_index
+from app.repositories import course_repo
+
+# Seconds between full rebuilds of the search index (0 disables them).
+# Writes in this process update the index immediately; the rebuild picks
+# up writes handled by other worker processes and resets score drift.
+COURSE_SEARCH_REFRESH_SECONDS = int(
+    os.getenv("COURSE_SEARCH_REFRESH_INTERVAL", 300)
+)
+
+
+# ============================================================
+# INDEX MAINTENANCE
+# ============================================================
+
+def rebuild_search_index_service(db: Session) -> bool:
+    """Reload every approved course and its topic names into the search index"""
+    version = course_search_index.version
+    courses = course_repo.get_approved_courses(db)
+
+    topic_names = defaultdict(list)
+    for course_id, name in course_repo.get_approved_course_topic_names(db):
+        topic_names[course_id].append(name)
+
+    return course_search_index.build(courses, topic_names, version=version)
+
+
+def start_search_index_refresher(
+    session_factory,
+    interval_seconds: int = COURSE_SEARCH_REFRESH_SECONDS
+) -> threading.Event | None:
+    """
+    Build the search index now, then rebuild it every interval_seconds,
+    on a daemon thread. Returns an Event that stops the loop when set,
+    or None when disabled (searches then build it on first use).
+    """
+    if interval_seconds <= 0:
+        return None
+
+    stop = threading.Event()
+
+    def run():
+        while True:
+            db = session_factory()
+            try:
+                rebuild_search_index_service(db)
+            except Exception:
+                # keep the loop alive; the next run retries
+                db.rollback()
+            finally:
+                db.close()
+            if stop.wait(interval_seconds):
+                break
+
+    threading.Thread(target=run, name="search-index-refresher", daemon=True).start()
+
+    return stop
+
+
+def reindex_course(db: Session, course):
+    """
+    Bring one course's search entry in line with the database.
+    Call after the commit of any write that changes a course, its
+    approval status or its topic mapping.
+    """
+    if course.approval_status != 'Approved':
+        course_search_index.remove(course.course_id)
+        return
+
+    topics = course_repo.get_topics_by_course(db, course.course_id)
+    course_search_index.upsert(course, [topic.name for topic in topics])
+
+
+def remove_course_from_index(course_id: int):
+    course_search_index.remove(course_id)
+
+
+# ============================================================
+# SEARCH
+# ============================================================
+
+def search_courses_service(
+    db: Session,
+    q: str = "",
+    category: str | None = None,
+    level: str | None = None,
+    language: str | None = None,
+    limit: int = 20,
+    offset: int = 0,
+    prefix: bool = True
+) -> dict:
+    """Ranked approved courses with category/level/language facet counts"""
+    if not course_search_index.is_built:
+        rebuild_search_index_service(db)
+
+    result = course_search_index.search(
+        q,
+        filters={"category": category, "level": level, "language": language},
+        limit=limit,
+        offset=offset,
+        prefix=prefix
+    )
+
+    return {"query": q, **result}
@@ -1,3 +1,8 @@
+import os
+import threading
+import time
+
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
@@ -7,9 +12,19 @@ from app.models.student_statistics import StudentStatistics
 from app.models.instructor_statistics import InstructorStatistics
 from app.models.student import Student
 from app.models.instructor import Instructor
-from app.models.student import Student
 from app.models.course import Course
 
+# Seconds between drift-correcting full recomputes (0 disables the job)
+STATISTICS_RECONCILE_INTERVAL_SECONDS = int(
+    os.getenv("STATISTICS_RECONCILE_INTERVAL", 3600)
+)
+
+# Seconds stored student/instructor statistics are served as-is by the
+# freshness-aware reads before a read recomputes them
+STATISTICS_MAX_AGE_SECONDS = int(
+    os.getenv("STATISTICS_MAX_AGE", 300)
+)
+
 # COURSE STATISTICS SERVICE
 
 def update_course_statistics_service(db: Session, course_id: int):
@@ -82,6 +97,7 @@ def update_student_statistics_service(
     stats.total_enrollments = total
     stats.completed_courses = completed
     stats.active_courses = active
+    stats.last_updated = func.now()
 
     db.commit()
     db.refresh(stats)
@@ -124,6 +140,7 @@ def update_instructor_statistics_service(
 
     stats.total_courses_taught = courses
     stats.total_students = students
+    stats.last_updated = func.now()
 
     db.commit()
     db.refresh(stats)
@@ -131,6 +148,88 @@ def update_instructor_statistics_service(
     return stats
 
 
+# INCREMENTAL STATISTICS (EVENT DELTAS)
+# Enrollment events adjust the stored counters in place instead of
+# recounting enrollment. The statistics rows are created, from absolute
+# counts, in the same transaction that inserts the enrollment, so the
+# delta that follows always has a row to land on. A row that is still
+# missing (e.g. deleted) is created with INSERT ... ON CONFLICT DO NOTHING
+# from counts that already include the event, and no delta is applied to
+# it; a worker racing on the same row then finds it and skips the insert.
+
+def prepare_enrollment_statistics_service(
+    db: Session,
+    student_user_id: int,
+    course_id: int
+):
+    """
+    Create missing course, student and instructor statistics rows before
+    the enrollment is inserted. Does not commit: the rows are committed
+    together with the enrollment.
+    """
+
+    statistics_repo.insert_course_statistics_if_missing(db, course_id)
+    statistics_repo.insert_student_statistics_if_missing(db, student_user_id)
+    statistics_repo.insert_course_instructor_statistics_if_missing(db, course_id)
+
+
+def record_enrollment_created_service(
+    db: Session,
+    student_user_id: int,
+    course_id: int
+):
+    """A new (not yet completed) enrollment: +1 total / +1 active everywhere"""
+
+    course_rows = statistics_repo.apply_course_enrollment_delta(
+        db, course_id, total_delta=1, active_delta=1
+    )
+    if not course_rows:
+        statistics_repo.insert_course_statistics_if_missing(db, course_id)
+
+    student_rows = statistics_repo.apply_student_enrollment_delta(
+        db, student_user_id, total_delta=1, completed_delta=0
+    )
+    if not student_rows:
+        statistics_repo.insert_student_statistics_if_missing(db, student_user_id)
+
+    # The instructor UPDATE skips instructors without a row; create theirs
+    statistics_repo.add_student_to_instructors(
+        db, student_user_id, course_id
+    )
+    statistics_repo.insert_course_instructor_statistics_if_missing(db, course_id)
+
+    db.commit()
+
+
+def record_completion_change_service(
+    db: Session,
+    student_user_id: int,
+    course_id: int,
+    was_completed: bool,
+    is_completed: bool
+):
+    """An enrollment moved into or out of "Completed": shift active ↔ completed"""
+
+    if was_completed == is_completed:
+        return
+
+    delta = 1 if is_completed else -1
+
+    course_rows = statistics_repo.apply_course_enrollment_delta(
+        db, course_id, total_delta=0, active_delta=-delta
+    )
+    if not course_rows:
+        statistics_repo.insert_course_statistics_if_missing(db, course_id)
+
+    student_rows = statistics_repo.apply_student_enrollment_delta(
+        db, student_user_id, total_delta=0, completed_delta=delta
+    )
+    if not student_rows:
+        statistics_repo.insert_student_statistics_if_missing(db, student_user_id)
+
+    db.commit()
+
+
 # FETCH ANALYTICS
 
 def get_course_statistics_service(db: Session, course_id: int):
@@ -186,6 +285,82 @@ def get_instructor_statistics_service(
     return stats
 
 
+# FRESHNESS-AWARE READS
+# Serve the stored row while it is younger than max_age seconds. Enrollment
+# events already keep these rows current through the incremental deltas
+# (which also bump last_updated), so a recompute only happens for a missing
+# row or one nothing has touched for max_age seconds.
+
+def _is_stale(last_updated, db_now, max_age: int) -> bool:
+    if last_updated is None or db_now is None:
+        return True
+
+    # On Postgres now() is timestamptz while last_updated is a naive
+    # TIMESTAMP holding now() in the session time zone. Compare both as
+    # wall-clock times in that zone: strip the offset, do not convert it.
+    if (db_now.tzinfo is None) != (last_updated.tzinfo is None):
+        db_now = db_now.replace(tzinfo=None)
+        last_updated = last_updated.replace(tzinfo=None)
+
+    return (db_now - last_updated).total_seconds() >= max_age
+
+
+def get_fresh_student_statistics_service(
+    db: Session,
+    student_user_id: int,
+    max_age: int = STATISTICS_MAX_AGE_SECONDS
+):
+
+    # Age is measured against the database clock that wrote last_updated
+    row = db.query(StudentStatistics, func.now()).filter(
+        StudentStatistics.student_user_id ==
+        student_user_id
+    ).first()
+
+    recomputed = row is None or _is_stale(row[0].last_updated, row[1], max_age)
+
+    if recomputed:
+        stats = update_student_statistics_service(db, student_user_id)
+    else:
+        stats = row[0]
+
+    return {
+        "student_user_id": stats.student_user_id,
+        "total_enrollments": stats.total_enrollments,
+        "completed_courses": stats.completed_courses,
+        "active_courses": stats.active_courses,
+        "last_updated": stats.last_updated,
+        "recomputed": recomputed
+    }
+
+
+def get_fresh_instructor_statistics_service(
+    db: Session,
+    instructor_user_id: int,
+    max_age: int = STATISTICS_MAX_AGE_SECONDS
+):
+
+    row = db.query(InstructorStatistics, func.now()).filter(
+        InstructorStatistics.instructor_user_id ==
+        instructor_user_id
+    ).first()
+
+    recomputed = row is None or _is_stale(row[0].last_updated, row[1], max_age)
+
+    if recomputed:
+        stats = update_instructor_statistics_service(db, instructor_user_id)
+    else:
+        stats = row[0]
+
+    return {
+        "instructor_user_id": stats.instructor_user_id,
+        "total_courses_taught": stats.total_courses_taught,
+        "total_students": stats.total_students,
+        "last_updated": stats.last_updated,
+        "recomputed": recomputed
+    }
+
+
 # ---------------- Batch Recompute Helpers -----------------
 def recompute_all_students_service(db: Session):
     """Recompute statistics for all students that have Student records."""
@@ -233,11 +408,79 @@ def recompute_all_courses_service(db: Session):
     return {"updated": updated, "errors": errors}
 
 
-def recompute_platform_service(db: Session):
+def bulk_recompute_platform_service(db: Session):
+    """
+    Rebuild every statistics table with one set-based UPSERT per table, all
+    inside a single transaction. Reports rows inserted/changed and elapsed
+    milliseconds per table.
+    """
+    steps = (
+        ("students", statistics_repo.bulk_upsert_student_statistics),
+        ("instructors", statistics_repo.bulk_upsert_instructor_statistics),
+        ("courses", statistics_repo.bulk_upsert_course_statistics),
+    )
+
+    res = {}
+    try:
+        for name, upsert in steps:
+            started = time.perf_counter()
+            rows_changed = upsert(db)
+            res[name] = {
+                "rows_changed": rows_changed,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+            }
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return res
+
+
+def recompute_platform_service(db: Session, bulk: bool = False):
     """Run all recompute tasks for platform (students, instructors, courses)."""
+    if bulk:
+        return bulk_recompute_platform_service(db)
+
     res = {
         "students": recompute_all_students_service(db),
         "instructors": recompute_all_instructors_service(db),
         "courses": recompute_all_courses_service(db)
     }
-    return res
\ No newline at end of file
+    return res
+
+
+# ---------------- Periodic Reconciliation -----------------
+def reconcile_statistics_service(db: Session):
+    """Full recount of every statistics table, correcting any drift left by deltas."""
+    return bulk_recompute_platform_service(db)
+
+
+def start_statistics_reconciler(
+    session_factory,
+    interval_seconds: int = STATISTICS_RECONCILE_INTERVAL_SECONDS
+) -> threading.Event | None:
+    """
+    Run reconcile_statistics_service every interval_seconds on a daemon thread.
+    Returns an Event that stops the loop when set, or None when disabled.
+    """
+    if interval_seconds <= 0:
+        return None
+
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval_seconds):
+            db = session_factory()
+            try:
+                reconcile_statistics_service(db)
+            except Exception:
+                # keep the loop alive; the next run retries
+                db.rollback()
+            finally:
+                db.close()
+
+    threading.Thread(target=run, name="statistics-reconciler", daemon=True).start()
+
+    return stop
+
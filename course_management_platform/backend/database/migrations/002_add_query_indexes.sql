@@ -0,0 +1,87 @@
+-- ============================================================
+-- 002: INDEXES FOR HOT FILTER COLUMNS
+-- ============================================================
+-- Applies after add_quiz_tables.sql. Mirrors the Index() declarations in
+-- app/models (course, course_content, course_topic, enrollment, teaching),
+-- so databases built with Base.metadata.create_all() end up identical.
+--
+-- CONCURRENTLY keeps the tables writable while the indexes build. It cannot
+-- run inside a transaction block, so apply this file with plain psql:
+--
+--   psql "$DATABASE_URL" -f backend/database/migrations/002_add_query_indexes.sql
+--
+-- IF NOT EXISTS makes re-running safe. If a concurrent build is interrupted
+-- it leaves an INVALID index behind: DROP it and run the file again.
+
+-- ------------------------------------------------------------
+-- ENROLLMENT
+-- ------------------------------------------------------------
+
+-- Per-course enrollment/completion counts (analyst, admin, course students)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enrollment_course_completion
+    ON enrollment (course_id, completion_status);
+
+-- A student's enrollments, newest first
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enrollment_student_date
+    ON enrollment (student_user_id, enrollment_date);
+
+-- Public reviews of a course ordered by rated_at; private reviews are
+-- left out of the index entirely
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_enrollment_public_reviews
+    ON enrollment (course_id, rated_at)
+    WHERE is_review_public;
+
+-- ------------------------------------------------------------
+-- TEACHING
+-- ------------------------------------------------------------
+
+-- The primary key (course_id, instructor_user_id) cannot serve lookups
+-- by instructor
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_teaching_instructor
+    ON teaching (instructor_user_id);
+
+-- ------------------------------------------------------------
+-- COURSE
+-- ------------------------------------------------------------
+
+-- Public catalog (Approved) and admin review queue (Pending)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_course_approval_status
+    ON course (approval_status);
+
+-- An instructor's own course requests by status
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_course_created_by_approval
+    ON course (created_by, approval_status);
+
+-- ------------------------------------------------------------
+-- COURSE CONTENT / COURSE TOPIC
+-- ------------------------------------------------------------
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_course_content_course
+    ON course_content (course_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_course_content_topic
+    ON course_content (topic_id);
+
+-- A course's topics in sequence order
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_course_topic_course_sequence
+    ON course_topic (course_id, sequence_order);
+
+-- Refresh planner statistics so the new indexes are considered right away
+ANALYZE enrollment;
+ANALYZE teaching;
+ANALYZE course;
+ANALYZE course_content;
+ANALYZE course_topic;
+
+-- ------------------------------------------------------------
+-- ROLLBACK
+-- ------------------------------------------------------------
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_enrollment_course_completion;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_enrollment_student_date;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_enrollment_public_reviews;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_teaching_instructor;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_course_approval_status;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_course_created_by_approval;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_course_content_course;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_course_content_topic;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_course_topic_course_sequence;
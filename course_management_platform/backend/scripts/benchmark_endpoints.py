@@ -0,0 +1,276 @@
+"""
+Endpoint latency benchmark: calls the main backend routes in-process
+through the ASGI app against generated datasets of several sizes, records
+p50/p95/p99 latency and SQL statement counts, and compares them with a
+stored baseline.
+
+Usage:
+  python backend/scripts/benchmark_endpoints.py
+  python backend/scripts/benchmark_endpoints.py --sizes 10000 100000 --repeats 50
+  python backend/scripts/benchmark_endpoints.py --update-baseline
+  python backend/scripts/benchmark_endpoints.py --database-url postgresql://.../scratch
+
+Datasets come from generate_dataset.py with a fixed seed, so every run
+sees the same rows. By default each size is loaded into an in-memory
+SQLite database. --database-url must point at a scratch database: every
+table is dropped and reloaded for each size.
+
+A route regresses when it issues more SQL statements than the baseline,
+or when its p95 grows by more than --tolerance (relative) and
+--min-delta-ms (absolute). Any regression exits with status 1. Latency
+baselines are machine specific: refresh them with --update-baseline on
+the machine that runs the comparison. Statement counts are portable.
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+from generate_dataset import DEFAULT_SEED, DatasetPlan, load_dataset, _create_engine  # noqa: E402  (also puts backend on sys.path)
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.core import query_counter
+from app.core.catalog_cache import invalidate_catalog_cache
+from app.core.course_search import course_search_index
+from app.core.jwt_handler import create_access_token
+from app.database import get_db
+from app.main import app
+
+DEFAULT_BASELINE = Path(__file__).with_name("benchmark_baseline.json")
+DEFAULT_SIZES = [10_000, 50_000]
+DEFAULT_REPEATS = 30
+DEFAULT_WARMUP = 2
+
+
+class Endpoint(NamedTuple):
+    method: str
+    path: str
+    auth: str | None = None
+    repeats: int | None = None
+    max_enrollments: int | None = None  # skip on larger datasets (slow routes)
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+def endpoints() -> list:
+    """The benchmarked routes; every GET /analyst/* route is included automatically"""
+    analyst = [
+        Endpoint("GET", path)
+        for path, operations in app.openapi()["paths"].items()
+        if path.startswith("/analyst/") and "get" in operations
+    ]
+    return [
+        Endpoint("GET", "/courses"),
+        Endpoint("GET", "/courses/{course_id}/topics"),
+        Endpoint("GET", "/courses/search?q=data+sci"),
+        Endpoint("GET", "/enrollments/student/{student_user_id}", auth="student"),
+        Endpoint("GET", "/enrollments/reviews/{course_id}"),
+        *analyst,
+        Endpoint("GET", "/analyst/students/analytics?limit=50"),
+        Endpoint("GET", "/admin/courses", auth="admin"),
+        Endpoint("GET", "/admin/courses?limit=50", auth="admin"),
+        Endpoint("POST", "/analytics/recompute/platform?bulk=true", repeats=5),
+        # Per-row recompute issues several statements per student
+        Endpoint("POST", "/analytics/recompute/platform", repeats=2, max_enrollments=10_000),
+    ]
+
+
+# ============================================================
+# MEASUREMENT
+# ============================================================
+
+def percentile(sorted_samples: list, p: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    rank = max(1, math.ceil(p * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples_ms: list, queries: list) -> dict:
+    samples = sorted(samples_ms)
+    return {
+        "p50_ms": round(percentile(samples, 0.50), 2),
+        "p95_ms": round(percentile(samples, 0.95), 2),
+        "p99_ms": round(percentile(samples, 0.99), 2),
+        "mean_ms": round(sum(samples) / len(samples), 2),
+        "queries": max(queries),
+        "samples": len(samples),
+    }
+
+
+def measure(client: TestClient, endpoint: Endpoint, url: str, headers: dict, repeats: int, warmup: int) -> dict:
+    for _ in range(warmup):
+        client.request(endpoint.method, url, headers=headers)
+
+    samples, queries = [], []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        response = client.request(endpoint.method, url, headers=headers)
+        samples.append((time.perf_counter() - started) * 1000)
+
+        if response.status_code >= 400:
+            raise RuntimeError(f"{endpoint.name} returned {response.status_code}: {response.text[:200]}")
+        queries.append(int(response.headers.get("x-db-query-count", 0)))
+
+    return summarize(samples, queries)
+
+
+def benchmark_dataset(engine, plan: DatasetPlan, repeats: int, warmup: int, progress=None) -> dict:
+    """Measure every endpoint against one loaded dataset"""
+    progress = progress or (lambda name, result: None)
+
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    # Most popular course and the first student, both present at every size
+    path_ids = {"course_id": plan.enrollable[0], "student_user_id": plan.first_student_id}
+    tokens = {
+        "admin": create_access_token({"user_id": 1, "role": "Administrator", "admin_level": "Senior"}),
+        "student": create_access_token({"user_id": plan.first_student_id, "role": "Student"}),
+    }
+
+    query_counter.instrument_engine(engine)
+    previous_headers = query_counter.QUERY_HEADERS_ENABLED
+    query_counter.QUERY_HEADERS_ENABLED = True
+    app.dependency_overrides[get_db] = override_get_db
+    invalidate_catalog_cache()
+    course_search_index.clear()
+
+    results = {}
+    try:
+        client = TestClient(app)
+        for endpoint in endpoints():
+            if endpoint.max_enrollments is not None and plan.target_enrollments > endpoint.max_enrollments:
+                continue
+            url = endpoint.path.format(**path_ids)
+            headers = {"Authorization": f"Bearer {tokens[endpoint.auth]}"} if endpoint.auth else {}
+            result = measure(
+                client, endpoint, url, headers,
+                repeats=endpoint.repeats or repeats,
+                warmup=warmup if endpoint.repeats is None else 0
+            )
+            results[endpoint.name] = result
+            progress(endpoint.name, result)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        query_counter.QUERY_HEADERS_ENABLED = previous_headers
+        invalidate_catalog_cache()
+        course_search_index.clear()
+
+    return results
+
+
+def run_benchmarks(
+    sizes: list,
+    repeats: int = DEFAULT_REPEATS,
+    warmup: int = DEFAULT_WARMUP,
+    seed: int = DEFAULT_SEED,
+    database_url: str = "sqlite://",
+    progress=None
+) -> dict:
+    """Results keyed by dataset size (as a string, for JSON) then endpoint name"""
+    results = {}
+    for size in sizes:
+        plan = DatasetPlan(size, seed=seed)
+        engine = _create_engine(database_url)
+        try:
+            load_dataset(engine, plan, reset=True)
+            results[str(size)] = benchmark_dataset(engine, plan, repeats, warmup, progress)
+        finally:
+            engine.dispose()
+    return results
+
+
+# ============================================================
+# BASELINE COMPARISON
+# ============================================================
+
+def compare_to_baseline(results: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> list:
+    """Regression messages; empty when every measured route is within bounds"""
+    regressions = []
+    for size, endpoints_ in results.items():
+        for name, current in endpoints_.items():
+            base = baseline.get(size, {}).get(name)
+            if base is None:
+                continue
+
+            if current["queries"] > base["queries"]:
+                regressions.append(
+                    f"[{size}] {name}: {current['queries']} SQL statements (baseline {base['queries']})"
+                )
+
+            delta = current["p95_ms"] - base["p95_ms"]
+            if current["p95_ms"] > base["p95_ms"] * (1 + tolerance) and delta > min_delta_ms:
+                regressions.append(
+                    f"[{size}] {name}: p95 {current['p95_ms']:.2f}ms (baseline {base['p95_ms']:.2f}ms, +{delta:.2f}ms)"
+                )
+    return regressions
+
+
+def print_report(results: dict, baseline: dict):
+    header = f"{'endpoint':<52} {'p50':>8} {'p95':>8} {'p99':>8} {'queries':>8} {'p95 vs base':>12}"
+    for size, endpoints_ in results.items():
+        print(f"\n== {int(size):,} enrollments")
+        print(header)
+        for name, r in endpoints_.items():
+            base = baseline.get(size, {}).get(name)
+            change = f"{(r['p95_ms'] / base['p95_ms'] - 1) * 100:+.0f}%" if base and base["p95_ms"] else "new"
+            print(f"{name:<52} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['queries']:>8} {change:>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="dataset sizes in enrollments")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--database-url", default="sqlite://")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative p95 growth")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0, help="ignore p95 growth below this many ms")
+    parser.add_argument("--json-out", type=Path, help="also write the raw results here")
+    args = parser.parse_args()
+
+    # The N+1 detector would log every per-row recompute statement
+    logging.getLogger("app.core.query_counter").setLevel(logging.ERROR)
+
+    results = run_benchmarks(args.sizes, args.repeats, args.warmup, args.seed, args.database_url)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    print_report(results, baseline)
+
+    if args.json_out:
+        args.json_out.write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return
+
+    regressions = compare_to_baseline(results, baseline, args.tolerance, args.min_delta_ms)
+    if regressions:
+        print("\nREGRESSIONS:", file=sys.stderr)
+        for message in regressions:
+            print(f"  {message}", file=sys.stderr)
+        sys.exit(1)
+    print("\nNo regressions against baseline" if baseline else "\nNo baseline to compare against")
+
+
+if __name__ == "__main__":
+    main()
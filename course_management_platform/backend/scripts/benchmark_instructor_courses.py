@@ -0,0 +1,154 @@
+"""
+Benchmark get_courses_by_instructor: the grouped LEFT JOIN against the old
+per-course COUNT loop, for instructors teaching 10, 100 and 1000 courses.
+
+Usage:
+  python backend/scripts/benchmark_instructor_courses.py
+  python backend/scripts/benchmark_instructor_courses.py --sizes 10 100 --students 50
+  python backend/scripts/benchmark_instructor_courses.py --database-url postgresql://.../scratch
+
+By default the data lives in an in-memory SQLite database. --database-url
+must point at a scratch database: the schema is created there and the
+benchmark rows are inserted and left behind.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+import app.models  # noqa: F401  (register all tables on Base.metadata)
+from app.models import User, Student, Instructor, Course, Enrollment, Teaching
+from app.repositories.participation_repo import get_courses_by_instructor
+
+
+def legacy_get_courses_by_instructor(db, instructor_user_id):
+    """The previous implementation: two COUNT queries per course"""
+    teachings = db.query(Teaching, Course).join(
+        Course,
+        Course.course_id == Teaching.course_id
+    ).filter(
+        Teaching.instructor_user_id == instructor_user_id
+    ).order_by(
+        Course.title.asc()
+    ).all()
+
+    result = []
+    for teaching, course in teachings:
+        enrollment_count = db.query(Enrollment).filter(
+            Enrollment.course_id == course.course_id
+        ).count()
+        completion_count = db.query(Enrollment).filter(
+            Enrollment.course_id == course.course_id,
+            Enrollment.completion_status == "Completed"
+        ).count()
+        result.append({
+            'course_id': course.course_id,
+            'course_title': course.title,
+            'category': course.category,
+            'level': course.level,
+            'duration': course.duration,
+            'description': course.description,
+            'role_in_course': teaching.role_in_course,
+            'assigned_date': teaching.assigned_date,
+            'enrollment_count': enrollment_count,
+            'completion_count': completion_count
+        })
+
+    return result
+
+
+def seed_instructor(db, num_courses, num_students):
+    """One instructor teaching num_courses courses, each with num_students enrollments"""
+    instructor = User(name="Bench Instructor", email=f"bench{time.time_ns()}@bench.io", password="x", role="Instructor")
+    db.add(instructor)
+    db.flush()
+    db.add(Instructor(user_id=instructor.user_id))
+
+    students = []
+    for i in range(num_students):
+        user = User(name=f"Bench Student {i}", email=f"bench{time.time_ns()}-{i}@bench.io", password="x", role="Student")
+        db.add(user)
+        students.append(user)
+    db.flush()
+    db.add_all(Student(user_id=s.user_id) for s in students)
+
+    courses = [Course(title=f"Bench Course {c:05d}", approval_status="Approved") for c in range(num_courses)]
+    db.add_all(courses)
+    db.flush()
+
+    for course in courses:
+        db.add(Teaching(course_id=course.course_id, instructor_user_id=instructor.user_id))
+        db.add_all(
+            Enrollment(
+                student_user_id=s.user_id,
+                course_id=course.course_id,
+                enrollment_date=date.today(),
+                completion_status="Completed" if i % 3 == 0 else "In Progress"
+            )
+            for i, s in enumerate(students)
+        )
+
+    db.commit()
+    return instructor.user_id
+
+
+def measure(db, fn, instructor_user_id, repeats, statement_counter):
+    timings = []
+    for _ in range(repeats):
+        statement_counter[0] = 0
+        started = time.perf_counter()
+        result = fn(db, instructor_user_id)
+        timings.append((time.perf_counter() - started) * 1000)
+        db.expire_all()
+    return result, statistics.median(timings), statement_counter[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="courses per instructor")
+    parser.add_argument("--students", type=int, default=20, help="enrollments per course")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--database-url", default="sqlite://")
+    args = parser.parse_args()
+
+    if args.database_url.startswith("sqlite"):
+        engine = create_engine(args.database_url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+    else:
+        engine = create_engine(args.database_url)
+    Base.metadata.create_all(engine)
+
+    statement_counter = [0]
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_statement(*_):
+        statement_counter[0] += 1
+
+    db = sessionmaker(bind=engine, autoflush=False)()
+
+    print(f"{'courses':>8} {'loop ms':>10} {'loop stmts':>11} {'join ms':>10} {'join stmts':>11} {'speedup':>8}")
+    for size in args.sizes:
+        instructor_user_id = seed_instructor(db, size, args.students)
+
+        legacy, legacy_ms, legacy_stmts = measure(db, legacy_get_courses_by_instructor, instructor_user_id, args.repeats, statement_counter)
+        joined, joined_ms, joined_stmts = measure(db, get_courses_by_instructor, instructor_user_id, args.repeats, statement_counter)
+
+        if legacy != joined:
+            sys.exit(f"Results differ for {size} courses")
+
+        print(f"{size:>8} {legacy_ms:>10.2f} {legacy_stmts:>11} {joined_ms:>10.2f} {joined_stmts:>11} {legacy_ms / joined_ms:>7.1f}x")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,686 @@
+"""
+Generate a synthetic, platform-scale dataset and bulk-load it.
+
+Every table the app reads is populated: users with their ISA subtype rows
+(student, instructor, administrator, data_analyst), universities, courses
+in every approval state, topics and their course_topic order, teaching
+assignments, course content, quizzes with questions, and enrollments with
+progress, grades and ratings. Course popularity is Zipfian, so a few
+courses hold most enrollments, as on a real platform.
+
+The dataset is a pure function of (--enrollments, --seed, tuning flags):
+the same arguments always produce the same rows, ids included, so a
+performance change can be measured against an identical dataset.
+
+Usage:
+  python backend/scripts/generate_dataset.py --enrollments 10000
+  python backend/scripts/generate_dataset.py --enrollments 10000000 --database-url postgresql://.../perf --reset
+  python backend/scripts/generate_dataset.py --enrollments 1000000 --dry-run
+
+Postgres is loaded with COPY; other databases (SQLite for tests and local
+benchmarks) fall back to batched executemany INSERTs. The target must be
+empty unless --reset is given, which DROPS AND RECREATES every table.
+Every seeded user can log in with password "password".
+"""
+import argparse
+import bisect
+import csv
+import io
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+import app.models  # noqa: F401  (register all tables on Base.metadata)
+import app.models.quiz  # noqa: F401  (quiz tables are not re-exported by app.models)
+from app.core.roles import Role
+from app.utils.db_utils import sync_postgres_serial_sequences
+
+DEFAULT_SEED = 42
+SEED_PASSWORD = "password"
+
+# Rows per COPY / executemany batch
+LOAD_BATCH_SIZE = 50_000
+
+# Dates are relative to a fixed day, never today, so reruns match
+BASE_DATE = date(2025, 1, 1)
+HISTORY_DAYS = 730
+
+QUESTIONS_PER_QUIZ = 15  # the grading scale assumes 15 questions
+
+COUNTRIES = ["India", "United States", "United Kingdom", "Germany", "Brazil", "Nigeria", "Japan", "Canada", "Australia", "France"]
+REGIONS = ["Asia", "North America", "Europe", "South America", "Africa", "Oceania"]
+CATEGORIES = ["Programming", "Data Science", "Web Development", "Mathematics", "Business", "Design", "Languages", "Physics", "Biology", "Music"]
+LEVELS = ["Beginner", "Intermediate", "Advanced"]
+LANGUAGES = ["English", "Hindi", "Spanish", "French", "German"]
+EDUCATION_LEVELS = ["High School", "Bachelor", "Master", "PhD"]
+GENDERS = ["Female", "Male", "Other"]
+QUALIFICATIONS = ["BSc", "MSc", "MTech", "PhD"]
+CONTENT_TYPES = [("video", "mp4"), ("pdf", "pdf"), ("slides", "pptx"), ("article", "html")]
+SUBJECTS = ["Foundations", "Algorithms", "Statistics", "Systems", "Design", "Analysis", "Theory", "Practice", "Modelling", "Optimization"]
+REVIEWS = [
+    "Clear explanations and useful exercises.",
+    "Good pace, would recommend.",
+    "Too fast in the later topics.",
+    "The quizzes really helped.",
+    "Content was a bit outdated.",
+    "Excellent instructor.",
+]
+
+# Rating 1..5 and grade weights, skewed positive like real course reviews
+RATING_WEIGHTS = [5, 8, 17, 35, 35]
+GRADE_WEIGHTS = {"A": 30, "B": 40, "C": 20, "D": 10}
+
+# Table load order respects foreign keys
+LOAD_ORDER = [
+    "university",
+    "users",
+    "student",
+    "instructor",
+    "administrator",
+    "data_analyst",
+    "course",
+    "topic",
+    "course_topic",
+    "teaching",
+    "course_content",
+    "quiz",
+    "quiz_question",
+    "enrollment",
+]
+
+
+# ============================================================
+# DATASET PLAN
+# ============================================================
+# Sizes and per-course facts (topics, lead instructor, popularity) that
+# several tables depend on are fixed up front; rows are then streamed
+# table by table without holding the large tables in memory.
+
+class DatasetPlan:
+
+    def __init__(
+        self,
+        enrollments: int,
+        seed: int = DEFAULT_SEED,
+        enrollments_per_student: float = 5.0,
+        zipf_exponent: float = 1.1
+    ):
+        if enrollments < 1:
+            raise ValueError("enrollments must be positive")
+
+        self.target_enrollments = enrollments
+        self.seed = seed
+        self.enrollments_per_student = enrollments_per_student
+        self.zipf_exponent = zipf_exponent
+
+        self.num_students = max(10, round(enrollments / enrollments_per_student))
+        self.num_courses = max(20, enrollments // 200)
+        self.num_instructors = max(5, self.num_courses // 3)
+        self.num_universities = max(3, self.num_courses // 100)
+        self.num_admins = max(2, self.num_courses // 1000)
+        self.num_analysts = max(2, self.num_courses // 2000)
+
+        # User id blocks: admins, analysts, instructors, students
+        self.first_analyst_id = self.num_admins + 1
+        self.first_instructor_id = self.first_analyst_id + self.num_analysts
+        self.first_student_id = self.first_instructor_id + self.num_instructors
+        self.num_users = self.first_student_id + self.num_students - 1
+
+        self._plan_courses()
+
+    def rng(self, table: str) -> random.Random:
+        """Independent stream per table, so changing one table keeps the others"""
+        return random.Random(f"{self.seed}:{table}")
+
+    def _plan_courses(self):
+        rng = self.rng("plan")
+
+        self.approval = []
+        self.lead_instructor = []
+        self.first_topic_id = []
+        self.topic_count = []
+
+        next_topic_id = 1
+        for _ in range(self.num_courses):
+            roll = rng.random()
+            self.approval.append("Approved" if roll < 0.90 else "Pending" if roll < 0.97 else "Rejected")
+            self.lead_instructor.append(rng.randint(self.first_instructor_id, self.first_student_id - 1))
+
+            # Regular topics plus the trailing "Final Assessment" topic
+            count = rng.randint(4, 11) + 1
+            self.first_topic_id.append(next_topic_id)
+            self.topic_count.append(count)
+            next_topic_id += count
+
+        self.num_topics = next_topic_id - 1
+
+        # Zipfian popularity over approved courses, in a shuffled rank order
+        self.enrollable = [c + 1 for c in range(self.num_courses) if self.approval[c] == "Approved"]
+        rng.shuffle(self.enrollable)
+
+        total = 0.0
+        self.popularity = []
+        for rank in range(1, len(self.enrollable) + 1):
+            total += 1.0 / rank ** self.zipf_exponent
+            self.popularity.append(total)
+
+    def pick_course(self, rng: random.Random) -> int:
+        point = rng.random() * self.popularity[-1]
+        return self.enrollable[bisect.bisect_left(self.popularity, point)]
+
+    def counts(self) -> dict:
+        return {
+            "users": self.num_users,
+            "students": self.num_students,
+            "instructors": self.num_instructors,
+            "administrators": self.num_admins,
+            "data_analysts": self.num_analysts,
+            "universities": self.num_universities,
+            "courses": self.num_courses,
+            "approved_courses": len(self.enrollable),
+            "topics": self.num_topics,
+            "quiz_questions": self.num_courses * QUESTIONS_PER_QUIZ,
+            "enrollments (target)": self.target_enrollments,
+        }
+
+
+def _day(rng: random.Random, start_days_ago: int = HISTORY_DAYS) -> date:
+    return BASE_DATE - timedelta(days=rng.randint(0, start_days_ago))
+
+
+# ============================================================
+# ROW GENERATORS
+# ============================================================
+# Each yields (column names, row iterator) for one table.
+
+def university_rows(plan: DatasetPlan):
+    rng = plan.rng("university")
+
+    def rows():
+        for i in range(1, plan.num_universities + 1):
+            yield (i, f"University {i}", rng.choice(REGIONS), rng.choice(COUNTRIES), f"https://university{i}.example.edu")
+
+    return ("university_id", "name", "region", "country", "website"), rows()
+
+
+def user_rows(plan: DatasetPlan):
+    rng = plan.rng("users")
+
+    def role_of(user_id):
+        if user_id < plan.first_analyst_id:
+            return Role.ADMIN.value, "admin"
+        if user_id < plan.first_instructor_id:
+            return Role.ANALYST.value, "analyst"
+        if user_id < plan.first_student_id:
+            return Role.INSTRUCTOR.value, "instructor"
+        return Role.STUDENT.value, "student"
+
+    def rows():
+        for user_id in range(1, plan.num_users + 1):
+            role, key = role_of(user_id)
+            created_at = datetime.combine(_day(rng, HISTORY_DAYS + 365), datetime.min.time())
+            yield (
+                user_id,
+                f"{role} {user_id}",
+                f"{key}{user_id}@seed.example.com",
+                SEED_PASSWORD,
+                f"+1555{user_id:07d}",
+                role,
+                None,
+                created_at,
+            )
+
+    return ("user_id", "name", "email", "password", "phone_number", "role", "last_login", "created_at"), rows()
+
+
+def student_rows(plan: DatasetPlan):
+    rng = plan.rng("student")
+
+    def rows():
+        for user_id in range(plan.first_student_id, plan.num_users + 1):
+            born = date(1970, 1, 1) + timedelta(days=rng.randint(0, 365 * 38))
+            yield (user_id, born, rng.choice(COUNTRIES), rng.choice(GENDERS), rng.choice(EDUCATION_LEVELS))
+
+    return ("user_id", "date_of_birth", "country", "gender", "education_level"), rows()
+
+
+def instructor_rows(plan: DatasetPlan):
+    rng = plan.rng("instructor")
+
+    def rows():
+        for user_id in range(plan.first_instructor_id, plan.first_student_id):
+            area = rng.choice(CATEGORIES)
+            yield (user_id, rng.choice(QUALIFICATIONS), rng.randint(1, 30), area, f"Teaches {area}.")
+
+    return ("user_id", "qualification", "experience", "expertise_area", "bio"), rows()
+
+
+def administrator_rows(plan: DatasetPlan):
+    rng = plan.rng("administrator")
+
+    def rows():
+        for user_id in range(1, plan.first_analyst_id):
+            # User 1 is always a Senior admin
+            level = "Senior" if user_id == 1 or rng.random() < 0.3 else "Junior"
+            yield (user_id, level, _day(rng))
+
+    return ("user_id", "admin_level", "assigned_since"), rows()
+
+
+def data_analyst_rows(plan: DatasetPlan):
+    rng = plan.rng("data_analyst")
+
+    def rows():
+        for user_id in range(plan.first_analyst_id, plan.first_instructor_id):
+            yield (user_id, rng.choice(QUALIFICATIONS), _day(rng))
+
+    return ("user_id", "qualification", "assigned_since"), rows()
+
+
+def _answer_key(plan: DatasetPlan, course_id: int) -> str:
+    rng = random.Random(f"{plan.seed}:answer_key:{course_id}")
+    return "".join(rng.choice("ABCD") for _ in range(QUESTIONS_PER_QUIZ))
+
+
+def course_rows(plan: DatasetPlan):
+    rng = plan.rng("course")
+
+    def rows():
+        for c in range(plan.num_courses):
+            course_id = c + 1
+            category = rng.choice(CATEGORIES)
+            status = plan.approval[c]
+            created = _day(rng)
+            yield (
+                course_id,
+                f"{category} {rng.choice(SUBJECTS)} {course_id}",
+                f"A {rng.choice(LEVELS).lower()} course on {category.lower()}.",
+                category,
+                rng.choice(LEVELS),
+                rng.choice(LANGUAGES),
+                created + timedelta(days=14),
+                rng.choice([4, 6, 8, 10, 12]),
+                _answer_key(plan, course_id),
+                rng.randint(1, plan.num_universities),
+                plan.lead_instructor[c],
+                status,
+                1 if status == "Approved" else None,
+                datetime.combine(created, datetime.min.time()) if status == "Approved" else None,
+            )
+
+    return (
+        "course_id", "title", "description", "category", "level", "language", "start_date",
+        "duration", "quiz_answer_key", "university_id", "created_by", "approval_status",
+        "approved_by", "approved_at"
+    ), rows()
+
+
+def topic_rows(plan: DatasetPlan):
+    rng = plan.rng("topic")
+
+    def rows():
+        for c in range(plan.num_courses):
+            first, count = plan.first_topic_id[c], plan.topic_count[c]
+            for n in range(count - 1):
+                subject = rng.choice(SUBJECTS)
+                yield (first + n, f"{subject} part {n + 1}", f"Covers {subject.lower()}, part {n + 1}.")
+            yield (first + count - 1, "Final Assessment", "Take the final quiz to complete the course")
+
+    return ("topic_id", "name", "description"), rows()
+
+
+def course_topic_rows(plan: DatasetPlan):
+
+    def rows():
+        for c in range(plan.num_courses):
+            first, count = plan.first_topic_id[c], plan.topic_count[c]
+            for n in range(count):
+                yield (c + 1, first + n, n + 1)
+
+    return ("course_id", "topic_id", "sequence_order"), rows()
+
+
+def teaching_rows(plan: DatasetPlan):
+    rng = plan.rng("teaching")
+
+    def rows():
+        for c in range(plan.num_courses):
+            if plan.approval[c] != "Approved":
+                continue
+            lead = plan.lead_instructor[c]
+            assigned = _day(rng)
+            yield (c + 1, lead, assigned, "Lead Instructor")
+
+            assistants = set()
+            for _ in range(rng.choice([0, 0, 1, 1, 2])):
+                assistant = rng.randint(plan.first_instructor_id, plan.first_student_id - 1)
+                if assistant != lead and assistant not in assistants:
+                    assistants.add(assistant)
+                    yield (c + 1, assistant, assigned + timedelta(days=rng.randint(0, 60)), "Assistant Instructor")
+
+    return ("course_id", "instructor_user_id", "assigned_date", "role_in_course"), rows()
+
+
+def course_content_rows(plan: DatasetPlan):
+    rng = plan.rng("course_content")
+
+    def rows():
+        content_id = 0
+        for c in range(plan.num_courses):
+            first, count = plan.first_topic_id[c], plan.topic_count[c]
+            for topic_id in range(first, first + count - 1):
+                for n in range(rng.randint(1, 3)):
+                    content_id += 1
+                    content_type, extension = rng.choice(CONTENT_TYPES)
+                    yield (
+                        content_id,
+                        f"Lesson {topic_id - first + 1}.{n + 1}",
+                        content_type,
+                        _day(rng),
+                        f"https://cdn.example.com/courses/{c + 1}/{content_id}.{extension}",
+                        c + 1,
+                        topic_id,
+                        plan.lead_instructor[c],
+                    )
+
+    return (
+        "content_id", "title", "content_type", "upload_date", "file_url",
+        "course_id", "topic_id", "instructor_user_id"
+    ), rows()
+
+
+def quiz_rows(plan: DatasetPlan):
+
+    def rows():
+        created = datetime.combine(BASE_DATE, datetime.min.time())
+        for course_id in range(1, plan.num_courses + 1):
+            yield (
+                course_id,
+                course_id,
+                "Final Assessment",
+                f"Final assessment quiz for course {course_id}",
+                1,
+                70,
+                created,
+                created,
+            )
+
+    return (
+        "quiz_id", "course_id", "title", "description", "max_attempts",
+        "passing_score", "created_at", "updated_at"
+    ), rows()
+
+
+def quiz_question_rows(plan: DatasetPlan):
+
+    def rows():
+        created = datetime.combine(BASE_DATE, datetime.min.time())
+        question_id = 0
+        for course_id in range(1, plan.num_courses + 1):
+            for n, answer in enumerate(_answer_key(plan, course_id), start=1):
+                question_id += 1
+                yield (
+                    question_id,
+                    course_id,
+                    f"Question {n} of course {course_id}?",
+                    "multiple_choice",
+                    "Option A", "Option B", "Option C", "Option D",
+                    answer,
+                    f"The correct option is {answer}.",
+                    n,
+                    created,
+                )
+
+    return (
+        "question_id", "quiz_id", "question_text", "question_type", "option_a", "option_b",
+        "option_c", "option_d", "correct_answer", "explanation", "order", "created_at"
+    ), rows()
+
+
+def _courses_per_student(plan: DatasetPlan, rng: random.Random, max_per_student: int) -> list:
+    """Geometric course counts (at least one each), adjusted to sum to the target"""
+    p = 1.0 / plan.enrollments_per_student
+    counts = []
+    for _ in range(plan.num_students):
+        k = 1
+        while rng.random() > p and k < max_per_student:
+            k += 1
+        counts.append(k)
+
+    difference = plan.target_enrollments - sum(counts)
+    step = 1 if difference > 0 else -1
+    capacity = plan.num_students * (max_per_student - 1)
+    difference = max(-capacity, min(capacity, difference))
+    while difference:
+        i = rng.randrange(plan.num_students)
+        if 1 <= counts[i] + step <= max_per_student:
+            counts[i] += step
+            difference -= step
+    return counts
+
+
+def enrollment_rows(plan: DatasetPlan):
+    """
+    Each student takes a geometric number of distinct courses (mean
+    enrollments_per_student) drawn from the Zipfian popularity curve.
+    """
+    rng = plan.rng("enrollment")
+    max_per_student = max(1, len(plan.enrollable) // 2)
+    grades = list(GRADE_WEIGHTS)
+    grade_weights = list(GRADE_WEIGHTS.values())
+
+    def rows():
+        counts = _courses_per_student(plan, rng, max_per_student)
+        for student_id, k in zip(range(plan.first_student_id, plan.num_users + 1), counts):
+            taken = set()
+            while len(taken) < k:
+                course_id = plan.pick_course(rng)
+                if course_id in taken:
+                    continue
+                taken.add(course_id)
+                yield _enrollment(plan, rng, student_id, course_id, grades, grade_weights)
+
+    return (
+        "student_user_id", "course_id", "enrollment_date", "status", "completion_status",
+        "completion_date", "rating", "review_text", "is_review_public", "rated_at",
+        "grade", "current_topic"
+    ), rows()
+
+
+def _enrollment(plan, rng, student_id, course_id, grades, grade_weights):
+    enrolled = _day(rng)
+    first_topic = plan.first_topic_id[course_id - 1]
+    topic_count = plan.topic_count[course_id - 1]
+
+    if rng.random() < 0.35:
+        completed = enrolled + timedelta(days=rng.randint(7, 120))
+        grade = rng.choices(grades, grade_weights)[0]
+        current_topic = first_topic + topic_count - 1
+
+        rating = review = rated_at = None
+        is_public = False
+        if rng.random() < 0.6:
+            rating = rng.choices(range(1, 6), RATING_WEIGHTS)[0]
+            rated_at = datetime.combine(completed, datetime.min.time()) + timedelta(hours=rng.randint(0, 240))
+            if rng.random() < 0.5:
+                review = rng.choice(REVIEWS)
+                is_public = rng.random() < 0.5
+
+        return (
+            student_id, course_id, enrolled, "Active", "Completed", completed,
+            rating, review, is_public, rated_at, grade, current_topic
+        )
+
+    return (
+        student_id, course_id, enrolled, "Active", "In Progress", None,
+        None, None, False, None, None, first_topic + rng.randint(0, topic_count - 2)
+    )
+
+
+GENERATORS = {
+    "university": university_rows,
+    "users": user_rows,
+    "student": student_rows,
+    "instructor": instructor_rows,
+    "administrator": administrator_rows,
+    "data_analyst": data_analyst_rows,
+    "course": course_rows,
+    "topic": topic_rows,
+    "course_topic": course_topic_rows,
+    "teaching": teaching_rows,
+    "course_content": course_content_rows,
+    "quiz": quiz_rows,
+    "quiz_question": quiz_question_rows,
+    "enrollment": enrollment_rows,
+}
+
+
+# ============================================================
+# LOADING
+# ============================================================
+
+def _batches(rows, size: int = LOAD_BATCH_SIZE):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _copy_batch(cursor, table: str, columns, batch, preparer):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in batch:
+        writer.writerow(row)
+    buffer.seek(0)
+
+    column_list = ", ".join(preparer.quote(c) for c in columns)
+    cursor.copy_expert(f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def _load_copy(engine, plan: DatasetPlan, progress) -> dict:
+    """Postgres: stream every table through COPY in one transaction"""
+    preparer = engine.dialect.identifier_preparer
+    loaded = {}
+
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        for table in LOAD_ORDER:
+            columns, rows = GENERATORS[table](plan)
+            started = time.perf_counter()
+            loaded[table] = 0
+            for batch in _batches(rows):
+                _copy_batch(cursor, table, columns, batch, preparer)
+                loaded[table] += len(batch)
+            progress(table, loaded[table], time.perf_counter() - started)
+        raw.commit()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+
+    return loaded
+
+
+def _load_insert(engine, plan: DatasetPlan, progress) -> dict:
+    """Any other database: batched executemany INSERTs"""
+    loaded = {}
+
+    with engine.begin() as conn:
+        for table in LOAD_ORDER:
+            columns, rows = GENERATORS[table](plan)
+            insert = Base.metadata.tables[table].insert()
+            started = time.perf_counter()
+            loaded[table] = 0
+            for batch in _batches(rows):
+                conn.execute(insert, [dict(zip(columns, row)) for row in batch])
+                loaded[table] += len(batch)
+            progress(table, loaded[table], time.perf_counter() - started)
+
+    return loaded
+
+
+def load_dataset(engine, plan: DatasetPlan, reset: bool = False, progress=None) -> dict:
+    """
+    Create the schema if needed and load the planned dataset into it.
+    Returns rows loaded per table. Refuses to load into a database that
+    already has users unless reset=True (drop and recreate every table).
+    """
+    progress = progress or (lambda table, rows, seconds: None)
+
+    if reset:
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    with engine.connect() as conn:
+        existing = conn.execute(select(func.count()).select_from(Base.metadata.tables["users"])).scalar()
+    if existing:
+        raise RuntimeError(f"Target database already has {existing} users; use --reset to replace them")
+
+    is_postgres = engine.dialect.name == "postgresql"
+    loaded = _load_copy(engine, plan, progress) if is_postgres else _load_insert(engine, plan, progress)
+
+    if is_postgres:
+        sync_postgres_serial_sequences(engine)
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("ANALYZE"))
+
+    return loaded
+
+
+def _create_engine(database_url: str):
+    if database_url.startswith("sqlite"):
+        return create_engine(database_url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+    return create_engine(database_url)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--enrollments", type=int, default=10_000, help="target enrollment rows (10k to 10M)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--enrollments-per-student", type=float, default=5.0)
+    parser.add_argument("--zipf-exponent", type=float, default=1.1, help="course popularity skew (higher is more skewed)")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--reset", action="store_true", help="drop and recreate every table first")
+    parser.add_argument("--dry-run", action="store_true", help="print the planned sizes and exit")
+    args = parser.parse_args()
+
+    plan = DatasetPlan(
+        args.enrollments,
+        seed=args.seed,
+        enrollments_per_student=args.enrollments_per_student,
+        zipf_exponent=args.zipf_exponent
+    )
+
+    for name, count in plan.counts().items():
+        print(f"{name:>22}: {count:,}")
+    if args.dry_run:
+        return
+
+    def progress(table, rows, seconds):
+        print(f"{table:>22}: {rows:>12,} rows in {seconds:7.2f}s")
+
+    started = time.perf_counter()
+    try:
+        load_dataset(_create_engine(args.database_url), plan, reset=args.reset, progress=progress)
+    except RuntimeError as e:
+        sys.exit(str(e))
+    print(f"Loaded in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
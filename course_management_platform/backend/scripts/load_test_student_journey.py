@@ -0,0 +1,383 @@
+"""
+Concurrent load test replaying the student learning journey.
+
+Each virtual user runs one session:
+
+  register -> login -> browse /courses -> enroll -> read the course topics
+  -> PUT /enrollments/progress for every topic -> GET /quizzes/course/{id}
+  -> POST /enrollments/assessment -> rate the course
+
+and starts the next session as soon as it finishes (plus optional think
+time). A failed step ends that session. Each stage runs a fixed number of
+virtual users; listing several concurrency levels ramps through them and
+shows where throughput stops growing while latency keeps rising, which is
+the saturation point of the backend under test.
+
+Usage:
+  # One uvicorn worker, then the same ramp against four workers
+  uvicorn app.main:app --port 8000 --workers 1
+  python backend/scripts/load_test_student_journey.py --concurrency 1 4 16 64 --duration 30
+  uvicorn app.main:app --port 8000 --workers 4
+  python backend/scripts/load_test_student_journey.py --concurrency 1 4 16 64 --duration 30 --json-out w4.json
+
+  # Without a server: the ASGI app in-process on a generated SQLite dataset
+  python backend/scripts/load_test_student_journey.py --in-process --concurrency 1 4 --sessions 50
+
+The target needs approved courses (generate_dataset.py creates them).
+Every session registers a new student; run against a scratch database.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+
+STEPS = ["register", "login", "browse", "enroll", "topics", "progress", "quiz", "assessment", "rate"]
+
+# Chance that a simulated student answers a quiz question correctly
+ANSWER_ACCURACY = 0.8
+RATING_WEIGHTS = [5, 8, 17, 35, 35]
+
+
+class StepFailed(Exception):
+    pass
+
+
+# ============================================================
+# STATS
+# ============================================================
+
+def percentile(sorted_samples: list, p: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(p * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+class StageStats:
+
+    def __init__(self):
+        self.latency_ms = {step: [] for step in STEPS}
+        self.errors = {step: 0 for step in STEPS}
+        self.error_samples = {}
+        self.sessions_completed = 0
+        self.sessions_failed = 0
+        self.instances = set()
+
+    def record(self, step: str, elapsed_ms: float, error: str | None = None):
+        self.latency_ms[step].append(elapsed_ms)
+        if error is not None:
+            self.errors[step] += 1
+            self.error_samples.setdefault(step, error)
+
+    def summary(self, concurrency: int, elapsed_s: float) -> dict:
+        steps = {}
+        for step in STEPS:
+            samples = sorted(self.latency_ms[step])
+            if not samples:
+                continue
+            steps[step] = {
+                "requests": len(samples),
+                "errors": self.errors[step],
+                "error_rate": round(self.errors[step] / len(samples), 4),
+                "throughput_rps": round(len(samples) / elapsed_s, 2),
+                "p50_ms": round(percentile(samples, 0.50), 2),
+                "p95_ms": round(percentile(samples, 0.95), 2),
+                "p99_ms": round(percentile(samples, 0.99), 2),
+            }
+
+        requests = sum(s["requests"] for s in steps.values())
+        errors = sum(s["errors"] for s in steps.values())
+        return {
+            "concurrency": concurrency,
+            "elapsed_s": round(elapsed_s, 2),
+            "sessions_completed": self.sessions_completed,
+            "sessions_failed": self.sessions_failed,
+            "sessions_per_s": round(self.sessions_completed / elapsed_s, 2),
+            "requests": requests,
+            "throughput_rps": round(requests / elapsed_s, 2),
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "backend_instances": len(self.instances),
+            "steps": steps,
+            "first_errors": self.error_samples,
+        }
+
+
+# ============================================================
+# STUDENT SESSION
+# ============================================================
+
+async def call(client: httpx.AsyncClient, stats: StageStats, step: str, method: str, url: str, **kwargs):
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except httpx.HTTPError as e:
+        stats.record(step, (time.perf_counter() - started) * 1000, f"{type(e).__name__}: {e}")
+        raise StepFailed(step) from e
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    instance = response.headers.get("x-server-instance")
+    if instance:
+        stats.instances.add(instance)
+
+    if response.status_code >= 400:
+        stats.record(step, elapsed_ms, f"{response.status_code}: {response.text[:200]}")
+        raise StepFailed(step)
+
+    stats.record(step, elapsed_ms)
+    return response
+
+
+async def student_session(client: httpx.AsyncClient, stats: StageStats, rng: random.Random, email: str, think_time: float):
+
+    async def think():
+        if think_time > 0:
+            await asyncio.sleep(rng.expovariate(1 / think_time))
+
+    password = "loadtest-password"
+    await call(client, stats, "register", "POST", "/auth/register", json={
+        "name": "Load Student",
+        "email": email,
+        "password": password,
+        "role": "student",
+    })
+
+    login = (await call(client, stats, "login", "POST", "/auth/login", json={
+        "email": email,
+        "password": password,
+    })).json()
+    student_id = login["user_id"]
+    auth = {"Authorization": f"Bearer {login['access_token']}"}
+    await think()
+
+    courses = (await call(client, stats, "browse", "GET", "/courses")).json()
+    if not courses:
+        stats.record("enroll", 0.0, "catalog is empty")
+        raise StepFailed("enroll")
+
+    # Students favour the courses listed first, so a few courses run hot
+    course_id = courses[int(len(courses) * rng.random() ** 2)]["course_id"]
+    await think()
+
+    await call(client, stats, "enroll", "POST", "/enrollments/", headers=auth, json={
+        "student_user_id": student_id,
+        "course_id": course_id,
+    })
+
+    topics = (await call(client, stats, "topics", "GET", f"/courses/{course_id}/topics")).json()
+    for topic in topics:
+        await think()
+        await call(
+            client, stats, "progress", "PUT",
+            f"/enrollments/progress/{student_id}/{course_id}/{topic['topic_id']}",
+            headers=auth
+        )
+
+    quiz = (await call(client, stats, "quiz", "GET", f"/quizzes/course/{course_id}")).json()
+    answers = [
+        q["correct_answer"] if rng.random() < ANSWER_ACCURACY else rng.choice("ABCD")
+        for q in quiz["questions"]
+    ]
+    await think()
+
+    await call(
+        client, stats, "assessment", "POST",
+        f"/enrollments/assessment/{student_id}/{course_id}",
+        headers=auth, json={"answers": answers}
+    )
+
+    await call(client, stats, "rate", "POST", f"/enrollments/rate/{student_id}/{course_id}", headers=auth, json={
+        "rating": rng.choices(range(1, 6), RATING_WEIGHTS)[0],
+        "review_text": "Load test review",
+        "is_public": rng.random() < 0.5,
+    })
+
+
+# ============================================================
+# STAGES
+# ============================================================
+
+async def run_stage(
+    client_factory,
+    concurrency: int,
+    sessions: int | None,
+    duration: float | None,
+    run_id: str,
+    seed: int,
+    think_time: float
+) -> dict:
+    """Run `concurrency` virtual users until `sessions` sessions ran or `duration` seconds passed"""
+    stats = StageStats()
+    session_numbers = itertools.count()
+
+    async with client_factory(concurrency) as client:
+        started = time.perf_counter()
+        deadline = None if duration is None else started + duration
+
+        async def virtual_user():
+            while True:
+                n = next(session_numbers)
+                if sessions is not None and n >= sessions:
+                    return
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return
+
+                rng = random.Random(f"{seed}:{concurrency}:{n}")
+                email = f"load-{run_id}-c{concurrency}-{n}@load.example.com"
+                try:
+                    await student_session(client, stats, rng, email, think_time)
+                    stats.sessions_completed += 1
+                except StepFailed:
+                    stats.sessions_failed += 1
+
+        await asyncio.gather(*(virtual_user() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return stats.summary(concurrency, elapsed)
+
+
+def http_client_factory(base_url: str, timeout: float):
+    def factory(concurrency: int):
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        return httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits)
+    return factory
+
+
+def in_process_client_factory(enrollments: int, seed: int, timeout: float):
+    """The ASGI app on a freshly generated file-backed SQLite dataset"""
+    import tempfile
+
+    sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+    from generate_dataset import DatasetPlan, load_dataset  # also puts backend on sys.path
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.database import get_db
+    from app.main import app
+
+    path = Path(tempfile.mkdtemp()) / "load_test.db"
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False, "timeout": 30})
+    load_dataset(engine, DatasetPlan(enrollments, seed=seed))
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    def factory(concurrency: int):
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://in-process", timeout=timeout)
+    return factory
+
+
+def run_load_test(
+    client_factory,
+    concurrency_levels: list,
+    sessions: int | None = None,
+    duration: float | None = None,
+    seed: int = 42,
+    think_time: float = 0.0,
+    run_id: str | None = None,
+    progress=None
+) -> list:
+    run_id = run_id or uuid.uuid4().hex[:8]
+    progress = progress or (lambda stage: None)
+
+    stages = []
+    for concurrency in concurrency_levels:
+        stage = asyncio.run(run_stage(client_factory, concurrency, sessions, duration, run_id, seed, think_time))
+        stages.append(stage)
+        progress(stage)
+    return stages
+
+
+# ============================================================
+# REPORT
+# ============================================================
+
+def saturation_point(stages: list, min_gain: float = 0.10) -> dict | None:
+    """Last stage whose throughput still grew by min_gain over the previous one"""
+    for previous, stage in zip(stages, stages[1:]):
+        if stage["throughput_rps"] < previous["throughput_rps"] * (1 + min_gain):
+            return previous
+    return None
+
+
+def print_stage(stage: dict):
+    print(
+        f"\n== concurrency {stage['concurrency']}: {stage['sessions_completed']} sessions "
+        f"({stage['sessions_failed']} failed) in {stage['elapsed_s']}s, "
+        f"{stage['sessions_per_s']} sessions/s, {stage['throughput_rps']} req/s, "
+        f"errors {stage['error_rate']:.2%}, backend instances {stage['backend_instances']}"
+    )
+    print(f"{'step':<12} {'requests':>9} {'req/s':>9} {'errors':>8} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for step, s in stage["steps"].items():
+        print(
+            f"{step:<12} {s['requests']:>9} {s['throughput_rps']:>9.2f} {s['error_rate']:>8.2%} "
+            f"{s['p50_ms']:>9.2f} {s['p95_ms']:>9.2f} {s['p99_ms']:>9.2f}"
+        )
+    for step, error in stage["first_errors"].items():
+        print(f"  first {step} error: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=os.getenv("BACKEND_URL", "http://127.0.0.1:8000"))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64], help="virtual users per stage")
+    stop = parser.add_mutually_exclusive_group()
+    stop.add_argument("--duration", type=float, help="seconds per stage (default: 30)")
+    stop.add_argument("--sessions", type=int, help="sessions per stage instead of a duration")
+    parser.add_argument("--think-time", type=float, default=0.0, help="mean seconds between steps (exponential)")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--in-process", action="store_true", help="drive the ASGI app directly on a generated SQLite dataset")
+    parser.add_argument("--enrollments", type=int, default=10_000, help="dataset size for --in-process")
+    parser.add_argument("--json-out", type=Path, help="write the stage results here")
+    args = parser.parse_args()
+
+    duration = args.duration if args.duration is not None or args.sessions is not None else 30.0
+
+    if args.in_process:
+        client_factory = in_process_client_factory(args.enrollments, args.seed, args.timeout)
+    else:
+        client_factory = http_client_factory(args.base_url, args.timeout)
+
+    stages = run_load_test(
+        client_factory,
+        args.concurrency,
+        sessions=args.sessions,
+        duration=None if args.sessions is not None else duration,
+        seed=args.seed,
+        think_time=args.think_time,
+        progress=print_stage
+    )
+
+    saturated = saturation_point(stages)
+    if saturated:
+        print(
+            f"\nThroughput stops scaling beyond concurrency {saturated['concurrency']} "
+            f"(~{saturated['throughput_rps']} req/s, {saturated['sessions_per_s']} sessions/s)"
+        )
+    else:
+        print("\nThroughput still grew at the highest concurrency; ramp further to find saturation")
+
+    if args.json_out:
+        args.json_out.write_text(json.dumps(stages, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,10 @@ from services.instructor_service import InstructorService
 from services.admin_service import AdminService
 from services.analyst_service import AnalystService
 from services.progress_service import ProgressService
+from services.backend_client import backend, fetch_all
 import json
 from datetime import datetime
 import os
-import requests
 
 # Backend URL (used to query server instance)
 BACKEND_URL = os.getenv('BACKEND_URL', 'http://127.0.0.1:8000')
@@ -77,14 +77,9 @@ def login():
             
             # Return token in response for client storage
             # Also store current backend instance id in session so we can detect restarts
-            try:
-                r = requests.get(f"{BACKEND_URL}/server/instance", timeout=2)
-                if r.ok:
-                    data = r.json()
-                    session['server_instance_id'] = data.get('instance_id')
-            except Exception:
-                # Don't block login if instance endpoint is unavailable
-                pass
+            instance_id = backend.instance_id()
+            if instance_id:
+                session['server_instance_id'] = instance_id
             return jsonify({
                 'success': True, 
                 'redirect': redirect_url,
@@ -147,19 +142,16 @@ def dashboard():
     token = session.get('token')
     user_id = session.get('user_id')
     
-    # Fetch current user info
-    user_success, user_data = DashboardService.get_current_user(token)
-    
-    # IMPORTANT: Only recompute student statistics for Student role
-    # This avoids attempting to create StudentStatistics for non-student users
-    if session.get('role', '').lower() == 'student':
-        DashboardService.recompute_student_stats(user_id, token)
-    
-    # Fetch student analytics (now updated)
-    analytics_success, analytics = DashboardService.get_student_analytics(user_id, token)
-    
-    # Fetch student enrollments (detailed course info)
-    enrollments_success, enrollments = DashboardService.get_student_enrollments(user_id, token)
+    # Current user, analytics and enrollments in parallel. Analytics are the
+    # stored statistics; the backend recomputes them only when stale.
+    results = fetch_all({
+        'user': lambda: DashboardService.get_current_user(token),
+        'analytics': lambda: DashboardService.get_student_analytics(user_id, token),
+        'enrollments': lambda: DashboardService.get_student_enrollments(user_id, token),
+    })
+    user_success, user_data = results['user']
+    analytics_success, analytics = results['analytics']
+    enrollments_success, enrollments = results['enrollments']
     
     if not user_success:
         flash('Failed to fetch user data. Please login again.', 'danger')
@@ -202,33 +194,27 @@ def check_server_instance():
     if request.path.startswith('/static/'):
         return None
 
-    # Attempt to query backend instance id
-    try:
-        resp = requests.get(f"{BACKEND_URL}/server/instance", timeout=1.5)
-        if not resp.ok:
-            return None
-        data = resp.json()
-        instance_id = data.get('instance_id')
-        if not instance_id:
-            return None
-        # If session doesn't have stored instance, set it
-        if 'server_instance_id' not in session:
-            session['server_instance_id'] = instance_id
-            return None
-
-        # If instance differs, invalidate session and inform user
-        if session.get('server_instance_id') != instance_id:
-            # clear session and redirect to login with message
-            session.clear()
-            # For AJAX/API requests, return JSON error
-            if request.path.startswith('/api/') or request.is_json:
-                return jsonify({'error': 'Session expired. Please login again.'}), 401
-            flash('Session expired. Please login again.', 'warning')
-            return redirect(url_for('login'))
-    except Exception:
+    # Backend instance id, cached by the backend client (no round trip per request)
+    instance_id = backend.instance_id()
+    if not instance_id:
         # If backend unreachable, don't log out (avoid lockout during short network hiccups)
         return None
 
+    # If session doesn't have stored instance, set it
+    if 'server_instance_id' not in session:
+        session['server_instance_id'] = instance_id
+        return None
+
+    # If instance differs, invalidate session and inform user
+    if session.get('server_instance_id') != instance_id:
+        # clear session and redirect to login with message
+        session.clear()
+        # For AJAX/API requests, return JSON error
+        if request.path.startswith('/api/') or request.is_json:
+            return jsonify({'error': 'Session expired. Please login again.'}), 401
+        flash('Session expired. Please login again.', 'warning')
+        return redirect(url_for('login'))
+
 
 @app.route('/enroll-courses')
 def enroll_courses():
@@ -250,6 +236,18 @@ def enroll_courses():
     return render_template('enroll_courses.html', courses=courses, user=user_context)
 
 
+@app.route('/api/courses/search')
+def api_search_courses():
+    """Course search / type-ahead for the catalog pages (public)"""
+    filters = {key: request.args.get(key) for key in ('category', 'level', 'language', 'limit', 'offset')}
+    success, result = CourseService.search_courses(request.args.get('q', ''), **filters)
+
+    if success:
+        return jsonify(result), 200
+    else:
+        return jsonify({'error': 'Search failed'}), 400
+
+
 @app.route('/courses/<int:course_id>')
 def course_detail(course_id: int):
     """Course detail page"""
@@ -524,24 +522,22 @@ def instructor_dashboard():
     token = session.get('token')
     user_id = session.get('user_id')
     
-    # Fetch current instructor info
-    user_success, user_data = InstructorService.get_current_instructor(token)
+    # Instructor info, analytics, taught courses and pending courses in parallel
+    results = fetch_all({
+        'user': lambda: InstructorService.get_current_instructor(token),
+        'analytics': lambda: InstructorService.get_instructor_analytics(user_id, token),
+        'courses': lambda: InstructorService.get_instructor_courses(user_id, token),
+        'pending': lambda: CourseService.get_instructor_pending_courses(token),
+    })
+    user_success, user_data = results['user']
     
     if not user_success:
         flash('Failed to fetch user data. Please login again.', 'danger')
         return redirect(url_for('login'))
     
-    # Recompute instructor statistics
-    InstructorService.recompute_instructor_stats(user_id, token)
-    
-    # Fetch instructor analytics
-    analytics_success, analytics = InstructorService.get_instructor_analytics(user_id, token)
-    
-    # Fetch courses taught by instructor
-    courses_success, instructor_courses = InstructorService.get_instructor_courses(user_id, token)
-    
-    # Fetch pending courses created by instructor
-    pending_success, pending_courses = CourseService.get_instructor_pending_courses(token)
+    analytics_success, analytics = results['analytics']
+    courses_success, instructor_courses = results['courses']
+    pending_success, pending_courses = results['pending']
     if not pending_success:
         pending_courses = []
     
@@ -984,13 +980,12 @@ def admin_courses():
     courses_success, courses = AdminService.get_all_courses(token)
     instructors_success, instructors = AdminService.get_all_instructors(token)
     
-    # Fetch instructors for each course
+    # Instructor assignments for every course, grouped by course_id, in one call
     course_instructors = {}
     if courses_success:
-        for course in courses:
-            instr_success, course_instrs = AdminService.get_instructors_by_course(course['course_id'], token)
-            if instr_success:
-                course_instructors[course['course_id']] = course_instrs
+        instr_success, course_instructors = AdminService.get_instructors_by_courses(token)
+        if not instr_success:
+            course_instructors = {}
     
     return render_template('admin_course_manage.html',
                          admin_level=admin_level,
@@ -1137,6 +1132,14 @@ def api_force_completion(student_id, course_id):
         return jsonify(response), 400
 
 
+# Backend call latency per route, recorded by the shared backend client
+@app.route('/server/backend-latency')
+def backend_latency():
+    if not check_admin_role():
+        return jsonify({'error': 'Unauthorized'}), 401
+    return jsonify(backend.latency_stats()), 200
+
+
 # Error handlers
 @app.errorhandler(404)
 def not_found(error):
@@ -1,8 +1,8 @@
 import requests
-import os
 from typing import Dict, Any, Optional
 
-BACKEND_URL = os.getenv('BACKEND_URL', 'http://127.0.0.1:8000')
+from services.backend_client import backend
+
 
 class AdminService:
     """Service for handling admin-related API calls"""
@@ -11,10 +11,9 @@ class AdminService:
     def get_current_admin(token: str) -> tuple[bool, Dict[str, Any]]:
         """Get current admin user info"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/auth/me',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                '/auth/me',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -27,10 +26,9 @@ class AdminService:
     def get_all_courses(token: str) -> tuple[bool, list]:
         """Fetch all courses"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/courses',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get_revalidated(
+                '/courses',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -43,10 +41,9 @@ class AdminService:
     def get_course_analytics(course_id: int, token: str) -> tuple[bool, Dict[str, Any]]:
         """Fetch analytics for a specific course"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/analytics/courses/{course_id}',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                f'/analytics/courses/{course_id}',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -59,10 +56,9 @@ class AdminService:
     def get_all_instructors(token: str) -> tuple[bool, list]:
         """Fetch all instructors - via users endpoint filtering"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/users/instructors',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                '/users/instructors',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -75,10 +71,9 @@ class AdminService:
     def get_instructors_by_course(course_id: int, token: str) -> tuple[bool, list]:
         """Fetch instructors for a specific course"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/teaching/course/{course_id}',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                f'/teaching/course/{course_id}',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -87,15 +82,33 @@ class AdminService:
         except requests.exceptions.RequestException as e:
             return False, []
     
+    @staticmethod
+    def get_instructors_by_courses(token: str, course_ids: Optional[list] = None) -> tuple[bool, dict]:
+        """Fetch instructor assignments for many courses (all when course_ids is None),
+        keyed by course_id"""
+        try:
+            params = {'course_ids': list(course_ids)} if course_ids is not None else None
+            response = backend.get(
+                '/teaching/courses',
+                params=params,
+                headers={'Authorization': f'Bearer {token}'}
+            )
+            if response.status_code == 200:
+                # JSON object keys arrive as strings
+                return True, {int(course_id): instrs for course_id, instrs in response.json().items()}
+            else:
+                return False, {}
+        except requests.exceptions.RequestException as e:
+            return False, {}
+    
     @staticmethod
     def assign_instructor(payload: Dict[str, Any], token: str) -> tuple[bool, Dict[str, Any]]:
         """Assign instructor to course"""
         try:
-            response = requests.post(
-                f'{BACKEND_URL}/teaching/assign',
+            response = backend.post(
+                '/teaching/assign',
                 json=payload,
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code in [200, 201]:
                 return True, response.json()
@@ -108,10 +121,9 @@ class AdminService:
     def remove_instructor(course_id: int, instructor_user_id: int, token: str) -> tuple[bool, Dict[str, Any]]:
         """Remove instructor from course"""
         try:
-            response = requests.delete(
-                f'{BACKEND_URL}/admin/teaching/{course_id}/{instructor_user_id}',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.delete(
+                f'/admin/teaching/{course_id}/{instructor_user_id}',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -124,10 +136,9 @@ class AdminService:
     def get_all_users(token: str) -> tuple[bool, list]:
         """Fetch all users (Senior Admin only)"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/users',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                '/users',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -140,10 +151,9 @@ class AdminService:
     def delete_user(user_id: int, token: str) -> tuple[bool, Dict[str, Any]]:
         """Delete a user (Senior Admin only)"""
         try:
-            response = requests.delete(
-                f'{BACKEND_URL}/admin/users/{user_id}',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.delete(
+                f'/admin/users/{user_id}',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -156,10 +166,9 @@ class AdminService:
     def delete_review(student_user_id: int, course_id: int, token: str) -> tuple[bool, Dict[str, Any]]:
         """Delete a course review (Moderation)"""
         try:
-            response = requests.delete(
-                f'{BACKEND_URL}/moderation/review/{student_user_id}/{course_id}',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.delete(
+                f'/moderation/review/{student_user_id}/{course_id}',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -172,10 +181,9 @@ class AdminService:
     def override_rating(student_user_id: int, course_id: int, rating: int, token: str) -> tuple[bool, Dict[str, Any]]:
         """Override student rating (Moderation)"""
         try:
-            response = requests.put(
-                f'{BACKEND_URL}/moderation/rating/{student_user_id}/{course_id}/{rating}',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.put(
+                f'/moderation/rating/{student_user_id}/{course_id}/{rating}',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -188,10 +196,9 @@ class AdminService:
     def force_completion(student_user_id: int, course_id: int, token: str) -> tuple[bool, Dict[str, Any]]:
         """Force mark course as complete (Moderation)"""
         try:
-            response = requests.put(
-                f'{BACKEND_URL}/moderation/completion/{student_user_id}/{course_id}',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.put(
+                f'/moderation/completion/{student_user_id}/{course_id}',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -204,10 +211,9 @@ class AdminService:
     def get_platform_analytics(token: str) -> tuple[bool, Dict[str, Any]]:
         """Get overall platform analytics"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/analytics/platform',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                '/analytics/platform',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -223,10 +229,9 @@ class AdminService:
     def get_admin_all_courses(token: str) -> tuple[bool, list]:
         """Get all courses (approved and pending) for admin"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/admin/courses',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                '/admin/courses',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -239,10 +244,9 @@ class AdminService:
     def get_pending_courses(token: str) -> tuple[bool, list]:
         """Get only pending courses for admin review"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/admin/courses/pending/list',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                '/admin/courses/pending/list',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -255,10 +259,9 @@ class AdminService:
     def get_course_details_admin(course_id: int, token: str) -> tuple[bool, Dict[str, Any]]:
         """Get course details for admin view"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/admin/courses/{course_id}',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                f'/admin/courses/{course_id}',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -271,10 +274,9 @@ class AdminService:
     def get_course_statistics_admin(course_id: int, token: str) -> tuple[bool, Dict[str, Any]]:
         """Get course statistics for admin view"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/admin/courses/{course_id}/statistics',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                f'/admin/courses/{course_id}/statistics',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -287,10 +289,9 @@ class AdminService:
     def get_course_ratings_admin(course_id: int, token: str) -> tuple[bool, Dict[str, Any]]:
         """Get course ratings and reviews for admin"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/admin/courses/{course_id}/ratings',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                f'/admin/courses/{course_id}/ratings',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -303,10 +304,9 @@ class AdminService:
     def approve_course(course_id: int, token: str) -> tuple[bool, Dict[str, Any]]:
         """Approve a pending course"""
         try:
-            response = requests.put(
-                f'{BACKEND_URL}/admin/courses/{course_id}/approve',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.put(
+                f'/admin/courses/{course_id}/approve',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -319,11 +319,10 @@ class AdminService:
     def reject_course(course_id: int, reason: str = None, token: str = None) -> tuple[bool, Dict[str, Any]]:
         """Reject a pending course"""
         try:
-            response = requests.put(
-                f'{BACKEND_URL}/admin/courses/{course_id}/reject',
+            response = backend.put(
+                f'/admin/courses/{course_id}/reject',
                 json={'reason': reason},
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -336,10 +335,9 @@ class AdminService:
     def delete_course_request(course_id: int, token: str) -> tuple[bool, Dict[str, Any]]:
         """Delete a course request (Senior Admin only)"""
         try:
-            response = requests.delete(
-                f'{BACKEND_URL}/admin/courses/{course_id}',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.delete(
+                f'/admin/courses/{course_id}',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -352,10 +350,9 @@ class AdminService:
     def delete_public_rating(student_user_id: int, course_id: int, token: str) -> tuple[bool, Dict[str, Any]]:
         """Delete a public rating (Senior Admin only)"""
         try:
-            response = requests.delete(
-                f'{BACKEND_URL}/admin/ratings/{student_user_id}/{course_id}',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.delete(
+                f'/admin/ratings/{student_user_id}/{course_id}',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
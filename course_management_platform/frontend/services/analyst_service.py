@@ -1,8 +1,7 @@
 import requests
-import os
 from typing import Dict, Any, Tuple
 
-BACKEND_URL = os.getenv('BACKEND_URL', 'http://127.0.0.1:8000')
+from services.backend_client import backend
 
 
 class AnalystService:
@@ -12,10 +11,10 @@ class AnalystService:
     def get_platform_overview(token: str) -> Tuple[bool, Dict[str, Any]]:
         """Get platform-wide overview statistics"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/analyst/overview',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                '/analyst/overview',
+                params={'cached': 'true'},
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -28,10 +27,9 @@ class AnalystService:
     def get_all_courses_analytics(token: str) -> Tuple[bool, Dict[str, Any]]:
         """Get analytics for all courses"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/analyst/courses/analytics',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                '/analyst/courses/analytics',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -44,10 +42,9 @@ class AnalystService:
     def get_course_detailed_analytics(course_id: int, token: str) -> Tuple[bool, Dict[str, Any]]:
         """Get detailed analytics for a specific course"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/analyst/courses/{course_id}/detailed',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                f'/analyst/courses/{course_id}/detailed',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -60,10 +57,9 @@ class AnalystService:
     def get_all_students_analytics(token: str) -> Tuple[bool, Dict[str, Any]]:
         """Get analytics for all students"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/analyst/students/analytics',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                '/analyst/students/analytics',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -76,10 +72,9 @@ class AnalystService:
     def get_all_instructors_analytics(token: str) -> Tuple[bool, Dict[str, Any]]:
         """Get analytics for all instructors"""
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/analyst/instructors/analytics',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                '/analyst/instructors/analytics',
+                headers={'Authorization': f'Bearer {token}'}
             )
             if response.status_code == 200:
                 return True, response.json()
@@ -1,8 +1,8 @@
 import requests
-import os
 from typing import Dict, Any, Optional
 
-BACKEND_URL = os.getenv('BACKEND_URL', 'http://127.0.0.1:8000')
+from services.backend_client import backend
+
 
 class AuthService:
     """Service for handling authentication API calls"""
@@ -19,10 +19,9 @@ class AuthService:
             Tuple of (success: bool, response: dict)
         """
         try:
-            response = requests.post(
-                f'{BACKEND_URL}/auth/register',
-                json=data,
-                timeout=10
+            response = backend.post(
+                '/auth/register',
+                json=data
             )
             
             if response.status_code == 200:
@@ -45,13 +44,12 @@ class AuthService:
             Tuple of (success: bool, response: dict)
         """
         try:
-            response = requests.post(
-                f'{BACKEND_URL}/auth/login',
+            response = backend.post(
+                '/auth/login',
                 json={
                     'email': email,
                     'password': password
-                },
-                timeout=10
+                }
             )
             
             if response.status_code == 200:
@@ -73,10 +71,9 @@ class AuthService:
             Tuple of (success: bool, response: dict)
         """
         try:
-            response = requests.get(
-                f'{BACKEND_URL}/auth/me',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            response = backend.get(
+                '/auth/me',
+                headers={'Authorization': f'Bearer {token}'}
             )
             
             if response.status_code == 200:
@@ -0,0 +1,317 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BACKEND_URL = os.getenv('BACKEND_URL', 'http://127.0.0.1:8000')
+
+# Keep-alive pool towards the backend (one pool, shared by every service)
+BACKEND_POOL_SIZE = int(os.getenv('BACKEND_POOL_SIZE', 20))
+
+# Default (connect, read) timeout in seconds
+BACKEND_CONNECT_TIMEOUT = float(os.getenv('BACKEND_CONNECT_TIMEOUT', 3))
+BACKEND_READ_TIMEOUT = float(os.getenv('BACKEND_READ_TIMEOUT', 10))
+
+# Retries for idempotent calls; waits backoff * 2^(n-1) between attempts
+BACKEND_MAX_RETRIES = int(os.getenv('BACKEND_MAX_RETRIES', 2))
+BACKEND_RETRY_BACKOFF = float(os.getenv('BACKEND_RETRY_BACKOFF', 0.2))
+
+# Read timeouts for routes that are slower than the default, by path prefix
+ENDPOINT_READ_TIMEOUTS = {
+    '/server/instance': 1.5,
+    '/analytics/recompute': 30,
+    '/content/upload': 60,
+}
+
+# Seconds a known backend instance id is trusted before /server/instance is
+# asked again. Every backend response refreshes it via X-Server-Instance.
+BACKEND_INSTANCE_TTL = float(os.getenv('BACKEND_INSTANCE_TTL', 5))
+
+# Worker threads shared by all parallel fan-outs, and how long a view waits
+# for its slowest call before rendering without it
+BACKEND_FANOUT_WORKERS = int(os.getenv('BACKEND_FANOUT_WORKERS', 16))
+BACKEND_FANOUT_TIMEOUT = float(os.getenv('BACKEND_FANOUT_TIMEOUT', 10))
+
+# Samples kept per route for latency percentiles
+LATENCY_SAMPLE_SIZE = 500
+
+# Only reads are retried after the request reached the backend. Connection
+# failures are retried for every method since nothing was sent yet.
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+_ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+
+def route_template(path: str) -> str:
+    """Collapse numeric path segments: /courses/42/topics -> /courses/{id}/topics"""
+    return _ID_SEGMENT.sub('/{id}', path.split('?', 1)[0])
+
+
+class RevalidatedResponse(NamedTuple):
+    """
+    Result of get_revalidated(): the fresh body of a 200, or the kept body
+    when the backend answered 304 (from_cache=True, status_code 200).
+    Offers the parts of requests.Response the services use.
+    """
+    status_code: int
+    content: bytes
+    headers: Mapping[str, str]
+    from_cache: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8') if self.content else ''
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class BackendClient:
+    """
+    Shared HTTP client for the backend API.
+
+    Wraps one requests.Session so connections are kept alive and reused,
+    applies per-endpoint timeouts, retries idempotent calls with exponential
+    backoff and records latency per backend route.
+    """
+
+    def __init__(
+        self,
+        base_url: str = BACKEND_URL,
+        pool_size: int = BACKEND_POOL_SIZE,
+        max_retries: int = BACKEND_MAX_RETRIES,
+        backoff: float = BACKEND_RETRY_BACKOFF
+    ):
+        self.base_url = base_url.rstrip('/')
+
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=IDEMPOTENT_METHODS,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=retry
+        )
+
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._latency: Dict[str, Dict[str, Any]] = {}
+        self._latency_lock = threading.Lock()
+
+        self._instance_id: Optional[str] = None
+        self._instance_seen_at = 0.0
+        self._instance_refresh_lock = threading.Lock()
+
+        # path -> (etag, body) of the last 200 seen by get_revalidated()
+        self._validated: Dict[str, tuple] = {}
+
+    # --------------------------------------------------------
+    # REQUESTS
+    # --------------------------------------------------------
+
+    def timeout_for(self, path: str) -> tuple:
+        read_timeout = BACKEND_READ_TIMEOUT
+        for prefix, seconds in ENDPOINT_READ_TIMEOUTS.items():
+            if path.startswith(prefix):
+                read_timeout = seconds
+                break
+        return (BACKEND_CONNECT_TIMEOUT, read_timeout)
+
+    def request(self, method: str, path: str, timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """
+        Send a request to the backend. Raises requests.exceptions.RequestException
+        on connection errors and timeouts, exactly like requests.request.
+        """
+        method = method.upper()
+        route = f'{method} {route_template(path)}'
+
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = self.session.request(
+                method,
+                f'{self.base_url}{path}',
+                timeout=timeout if timeout is not None else self.timeout_for(path),
+                **kwargs
+            )
+            failed = response.status_code >= 500
+            self._observe_instance(response)
+            return response
+        finally:
+            self._record(route, (time.perf_counter() - started) * 1000, failed)
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request('GET', path, **kwargs)
+
+    def get_revalidated(self, path: str, **kwargs) -> RevalidatedResponse:
+        """
+        GET for public, ETag-aware routes such as /courses. Sends If-None-Match
+        with the last ETag seen for this path; a 304 is answered from the kept
+        body and handed back with status 200, so callers need no changes.
+        """
+        cached = self._validated.get(path)
+        headers = dict(kwargs.pop('headers', None) or {})
+        if cached:
+            headers['If-None-Match'] = cached[0]
+
+        response = self.get(path, headers=headers, **kwargs)
+
+        if response.status_code == 304 and cached:
+            return RevalidatedResponse(200, cached[1], response.headers, from_cache=True)
+
+        if response.status_code == 200 and response.headers.get('ETag'):
+            self._validated[path] = (response.headers['ETag'], response.content)
+        return RevalidatedResponse(response.status_code, response.content, response.headers)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request('POST', path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> requests.Response:
+        return self.request('PUT', path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> requests.Response:
+        return self.request('DELETE', path, **kwargs)
+
+    # --------------------------------------------------------
+    # SERVER INSTANCE
+    # --------------------------------------------------------
+
+    def _observe_instance(self, response: requests.Response):
+        instance_id = response.headers.get('X-Server-Instance')
+        if instance_id:
+            self._instance_id = instance_id
+            self._instance_seen_at = time.monotonic()
+
+    def instance_id(self) -> Optional[str]:
+        """
+        Current backend instance id, used to detect backend restarts.
+
+        Served from memory while fresh. Once stale, one caller refreshes it
+        from /server/instance; concurrent callers keep using the last known
+        id instead of waiting. Returns None if the backend was never reached.
+        """
+        if time.monotonic() - self._instance_seen_at < BACKEND_INSTANCE_TTL:
+            return self._instance_id
+
+        if not self._instance_refresh_lock.acquire(blocking=False):
+            return self._instance_id
+
+        try:
+            response = self.get('/server/instance')
+            if response.ok:
+                instance_id = response.json().get('instance_id')
+                if instance_id:
+                    self._instance_id = instance_id
+                    self._instance_seen_at = time.monotonic()
+        except (requests.exceptions.RequestException, ValueError):
+            # Keep the last known id through short network hiccups
+            pass
+        finally:
+            self._instance_refresh_lock.release()
+
+        return self._instance_id
+
+    # --------------------------------------------------------
+    # LATENCY
+    # --------------------------------------------------------
+
+    def _record(self, route: str, elapsed_ms: float, failed: bool):
+        with self._latency_lock:
+            stats = self._latency.get(route)
+            if stats is None:
+                stats = self._latency[route] = {
+                    'count': 0,
+                    'errors': 0,
+                    'total_ms': 0.0,
+                    'max_ms': 0.0,
+                    'samples': deque(maxlen=LATENCY_SAMPLE_SIZE),
+                }
+            stats['count'] += 1
+            stats['errors'] += int(failed)
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            stats['samples'].append(elapsed_ms)
+
+    def latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-route call counts, error counts and latency (ms) percentiles"""
+        with self._latency_lock:
+            snapshot = {
+                route: (dict(stats), sorted(stats['samples']))
+                for route, stats in self._latency.items()
+            }
+
+        result = {}
+        for route, (stats, samples) in sorted(snapshot.items()):
+            def percentile(p):
+                return round(samples[min(len(samples) - 1, int(p * len(samples)))], 2)
+
+            result[route] = {
+                'count': stats['count'],
+                'errors': stats['errors'],
+                'avg_ms': round(stats['total_ms'] / stats['count'], 2),
+                'p50_ms': percentile(0.50),
+                'p95_ms': percentile(0.95),
+                'max_ms': round(stats['max_ms'], 2),
+            }
+        return result
+
+
+# Shared client used by every frontend service
+backend = BackendClient()
+
+
+# ============================================================
+# PARALLEL FAN-OUT
+# ============================================================
+
+_fanout_pool = ThreadPoolExecutor(
+    max_workers=BACKEND_FANOUT_WORKERS,
+    thread_name_prefix='backend-fanout'
+)
+
+
+def fetch_all(
+    calls: Dict[str, Callable[[], Any]],
+    timeout: float = BACKEND_FANOUT_TIMEOUT,
+    default: Any = (False, None)
+) -> Dict[str, Any]:
+    """
+    Run independent backend calls in parallel and return their results by name.
+
+    Each call is a zero-argument callable, typically a service method returning
+    (success, data). A call that raises or is still running after `timeout`
+    seconds yields `default`, so the page can render without that part.
+    Total latency is that of the slowest call, not the sum.
+    """
+    futures = {name: _fanout_pool.submit(call) for name, call in calls.items()}
+    wait(futures.values(), timeout=timeout)
+
+    results = {}
+    for name, future in futures.items():
+        if future.done() and future.exception() is None:
+            results[name] = future.result()
+        else:
+            future.cancel()
+            results[name] = default
+    return results
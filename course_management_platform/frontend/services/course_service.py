@@ -1,8 +1,7 @@
 import requests
-import os
 from typing import Tuple, Any
 
-BACKEND_URL = os.getenv('BACKEND_URL', 'http://127.0.0.1:8000')
+from services.backend_client import backend
 
 
 class CourseService:
@@ -11,18 +10,30 @@ class CourseService:
     @staticmethod
     def get_all_courses() -> Tuple[bool, Any]:
         try:
-            resp = requests.get(f"{BACKEND_URL}/courses", timeout=10)
+            resp = backend.get_revalidated("/courses")
             if resp.status_code == 200:
                 return True, resp.json()
             return False, resp.json() if resp.text else []
         except requests.exceptions.RequestException:
             return False, []
 
+    @staticmethod
+    def search_courses(q: str = "", **filters) -> Tuple[bool, Any]:
+        """Ranked course search with facet counts; filters: category, level, language, limit, offset"""
+        try:
+            params = {"q": q, **{k: v for k, v in filters.items() if v not in (None, "")}}
+            resp = backend.get("/courses/search", params=params)
+            if resp.status_code == 200:
+                return True, resp.json()
+            return False, resp.json() if resp.text else {}
+        except requests.exceptions.RequestException:
+            return False, {}
+
     @staticmethod
     def get_all_universities() -> Tuple[bool, Any]:
         """Fetch all universities"""
         try:
-            resp = requests.get(f"{BACKEND_URL}/universities", timeout=10)
+            resp = backend.get("/universities")
             if resp.status_code == 200:
                 return True, resp.json()
             return False, []
@@ -32,7 +43,7 @@ class CourseService:
     @staticmethod
     def get_course_by_id(course_id: int) -> Tuple[bool, Any]:
         try:
-            resp = requests.get(f"{BACKEND_URL}/courses/{course_id}", timeout=10)
+            resp = backend.get(f"/courses/{course_id}")
             if resp.status_code == 200:
                 return True, resp.json()
             return False, None
@@ -42,7 +53,7 @@ class CourseService:
     @staticmethod
     def get_course_content(course_id: int) -> Tuple[bool, Any]:
         try:
-            resp = requests.get(f"{BACKEND_URL}/content/course/{course_id}", timeout=10)
+            resp = backend.get(f"/content/course/{course_id}")
             if resp.status_code == 200:
                 return True, resp.json()
             return False, []
@@ -53,7 +64,7 @@ class CourseService:
     def get_university_by_course(course_id: int) -> Tuple[bool, Any]:
         """Fetch the university information for a given course_id"""
         try:
-            resp = requests.get(f"{BACKEND_URL}/courses/{course_id}/university", timeout=10)
+            resp = backend.get(f"/courses/{course_id}/university")
             if resp.status_code == 200:
                 return True, resp.json()
             return False, resp.json() if resp.text else None
@@ -64,7 +75,7 @@ class CourseService:
     def get_topics_by_course(course_id: int) -> Tuple[bool, Any]:
         """Fetch all topics for a given course_id"""
         try:
-            resp = requests.get(f"{BACKEND_URL}/courses/{course_id}/topics", timeout=10)
+            resp = backend.get(f"/courses/{course_id}/topics")
             if resp.status_code == 200:
                 return True, resp.json()
             return False, []
@@ -75,7 +86,7 @@ class CourseService:
     def get_public_reviews_by_course(course_id: int) -> Tuple[bool, Any]:
         """Fetch all public reviews for a given course_id"""
         try:
-            resp = requests.get(f"{BACKEND_URL}/enrollments/reviews/{course_id}", timeout=10)
+            resp = backend.get(f"/enrollments/reviews/{course_id}")
             if resp.status_code == 200:
                 return True, resp.json()
             return False, []
@@ -90,11 +101,10 @@ class CourseService:
                 'Authorization': f'Bearer {token}',
                 'Content-Type': 'application/json'
             }
-            resp = requests.post(
-                f"{BACKEND_URL}/courses/instructor/create",
+            resp = backend.post(
+                "/courses/instructor/create",
                 json=course_data,
-                headers=headers,
-                timeout=10
+                headers=headers
             )
             
             # Always try to parse response as JSON
@@ -118,10 +128,9 @@ class CourseService:
             headers = {
                 'Authorization': f'Bearer {token}',
             }
-            resp = requests.get(
-                f"{BACKEND_URL}/courses/instructor/pending",
-                headers=headers,
-                timeout=10
+            resp = backend.get(
+                "/courses/instructor/pending",
+                headers=headers
             )
             if resp.status_code == 200:
                 return True, resp.json()
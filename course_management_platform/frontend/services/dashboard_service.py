@@ -1,8 +1,7 @@
 import requests
-import os
 from typing import Tuple, Any
 
-BACKEND_URL = os.getenv('BACKEND_URL', 'http://127.0.0.1:8000')
+from services.backend_client import backend
 
 
 class DashboardService:
@@ -12,10 +11,9 @@ class DashboardService:
     def get_current_user(token: str) -> Tuple[bool, Any]:
         """Fetch current user info from JWT token"""
         try:
-            resp = requests.get(
-                f"{BACKEND_URL}/auth/me",
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            resp = backend.get(
+                "/auth/me",
+                headers={'Authorization': f'Bearer {token}'}
             )
             if resp.status_code == 200:
                 return True, resp.json()
@@ -25,12 +23,11 @@ class DashboardService:
 
     @staticmethod
     def get_student_analytics(user_id: int, token: str) -> Tuple[bool, Any]:
-        """Fetch analytics for a student"""
+        """Fetch analytics for a student (stored stats, refreshed by the backend when stale)"""
         try:
-            resp = requests.get(
-                f"{BACKEND_URL}/analytics/students/{user_id}",
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            resp = backend.get(
+                f"/analytics/students/{user_id}/fresh",
+                headers={'Authorization': f'Bearer {token}'}
             )
             if resp.status_code == 200:
                 return True, resp.json()
@@ -42,7 +39,7 @@ class DashboardService:
     def get_all_courses() -> Tuple[bool, Any]:
         """Fetch all available courses"""
         try:
-            resp = requests.get(f"{BACKEND_URL}/courses", timeout=10)
+            resp = backend.get_revalidated("/courses")
             if resp.status_code == 200:
                 return True, resp.json()
             return False, []
@@ -53,14 +50,13 @@ class DashboardService:
     def enroll_course(user_id: int, course_id: int, token: str) -> Tuple[bool, Any]:
         """Enroll student in a course"""
         try:
-            resp = requests.post(
-                f"{BACKEND_URL}/enrollments/",
+            resp = backend.post(
+                "/enrollments/",
                 json={
                     'student_user_id': user_id,
                     'course_id': course_id
                 },
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+                headers={'Authorization': f'Bearer {token}'}
             )
             if resp.status_code == 200:
                 return True, resp.json()
@@ -74,28 +70,12 @@ class DashboardService:
     def get_student_enrollments(user_id: int, token: str) -> Tuple[bool, Any]:
         """Fetch all enrollments for a student with course details"""
         try:
-            resp = requests.get(
-                f"{BACKEND_URL}/enrollments/student/{user_id}",
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            resp = backend.get(
+                f"/enrollments/student/{user_id}",
+                headers={'Authorization': f'Bearer {token}'}
             )
             if resp.status_code == 200:
                 return True, resp.json()
             return False, []
         except requests.exceptions.RequestException:
             return False, []
-
-    @staticmethod
-    def recompute_student_stats(user_id: int, token: str) -> Tuple[bool, Any]:
-        """Recompute student statistics (total enrollments, completed courses, etc.)"""
-        try:
-            resp = requests.post(
-                f"{BACKEND_URL}/analytics/recompute/student/{user_id}",
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
-            )
-            if resp.status_code == 200:
-                return True, resp.json()
-            return False, None
-        except requests.exceptions.RequestException:
-            return False, None
@@ -3,11 +3,10 @@ Progress Service - Handles topic progression, assessment, and course completion
 """
 
 import requests
-import os
 from typing import Tuple, Any
 from datetime import datetime
 
-BACKEND_URL = os.getenv('BACKEND_URL', 'http://127.0.0.1:8000')
+from services.backend_client import backend
 
 
 class ProgressService:
@@ -24,10 +23,9 @@ class ProgressService:
             if token:
                 headers['Authorization'] = f'Bearer {token}'
             
-            resp = requests.get(
-                f"{BACKEND_URL}/courses/{course_id}/topics",
-                headers=headers,
-                timeout=10
+            resp = backend.get(
+                f"/courses/{course_id}/topics",
+                headers=headers
             )
             if resp.status_code == 200:
                 return True, resp.json()
@@ -47,18 +45,12 @@ class ProgressService:
             if token:
                 headers['Authorization'] = f'Bearer {token}'
             
-            resp = requests.get(
-                f"{BACKEND_URL}/enrollments/student/{student_user_id}",
-                headers=headers,
-                timeout=10
+            resp = backend.get(
+                f"/enrollments/student/{student_user_id}/course/{course_id}",
+                headers=headers
             )
             if resp.status_code == 200:
-                enrollments = resp.json()
-                # Filter for specific course
-                for enrollment in enrollments:
-                    if enrollment.get('course_id') == course_id:
-                        return True, enrollment
-                return False, None
+                return True, resp.json()
             return False, None
         except requests.exceptions.RequestException as e:
             return False, None
@@ -92,10 +84,9 @@ class ProgressService:
             if token:
                 headers['Authorization'] = f'Bearer {token}'
             
-            resp = requests.put(
-                f"{BACKEND_URL}/enrollments/progress/{student_user_id}/{course_id}/{topic_id}",
-                headers=headers,
-                timeout=10
+            resp = backend.put(
+                f"/enrollments/progress/{student_user_id}/{course_id}/{topic_id}",
+                headers=headers
             )
             if resp.status_code == 200:
                 result = resp.json()
@@ -136,11 +127,10 @@ class ProgressService:
             if not payload:
                 return False, "Either score or answers must be provided"
             
-            resp = requests.post(
-                f"{BACKEND_URL}/enrollments/assessment/{student_user_id}/{course_id}",
+            resp = backend.post(
+                f"/enrollments/assessment/{student_user_id}/{course_id}",
                 json=payload,
-                headers=headers,
-                timeout=10
+                headers=headers
             )
             if resp.status_code == 200:
                 return True, resp.json()
@@ -169,11 +159,10 @@ class ProgressService:
                 "completion_date": str(datetime.today().date())
             }
             
-            resp = requests.put(
-                f"{BACKEND_URL}/enrollments/complete/{student_user_id}/{course_id}",
+            resp = backend.put(
+                f"/enrollments/complete/{student_user_id}/{course_id}",
                 json=payload,
-                headers=headers,
-                timeout=10
+                headers=headers
             )
             if resp.status_code == 200:
                 return True, resp.json()
@@ -202,11 +191,10 @@ class ProgressService:
 
             payload = {"rating": rating, "review_text": review_text, "is_public": bool(is_public)}
 
-            resp = requests.post(
-                f"{BACKEND_URL}/enrollments/rate/{student_user_id}/{course_id}",
+            resp = backend.post(
+                f"/enrollments/rate/{student_user_id}/{course_id}",
                 json=payload,
-                headers=headers,
-                timeout=10
+                headers=headers
             )
             if resp.status_code == 200:
                 return True, resp.json()
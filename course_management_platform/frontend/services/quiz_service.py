@@ -1,8 +1,7 @@
 import requests
-import os
 from typing import Dict, Any, Tuple
 
-BACKEND_URL = os.getenv('BACKEND_URL', 'http://127.0.0.1:8000')
+from services.backend_client import backend
 
 
 class QuizService:
@@ -12,10 +11,9 @@ class QuizService:
     def create_quiz_for_course(course_id: int, token: str) -> Tuple[bool, Any]:
         """Create or get a quiz for a course"""
         try:
-            resp = requests.post(
-                f"{BACKEND_URL}/quizzes/course/{course_id}",
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            resp = backend.post(
+                f"/quizzes/course/{course_id}",
+                headers={'Authorization': f'Bearer {token}'}
             )
             if resp.status_code == 200:
                 return True, resp.json()
@@ -27,11 +25,10 @@ class QuizService:
     def add_question(quiz_id: int, question_data: Dict, token: str) -> Tuple[bool, Any]:
         """Add a question to a quiz"""
         try:
-            resp = requests.post(
-                f"{BACKEND_URL}/quizzes/{quiz_id}/questions",
+            resp = backend.post(
+                f"/quizzes/{quiz_id}/questions",
                 json=question_data,
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+                headers={'Authorization': f'Bearer {token}'}
             )
             if resp.status_code == 200:
                 return True, resp.json()
@@ -46,10 +43,9 @@ class QuizService:
             headers = {}
             if token:
                 headers['Authorization'] = f'Bearer {token}'
-            resp = requests.get(
-                f"{BACKEND_URL}/quizzes/{quiz_id}/questions",
-                headers=headers,
-                timeout=10
+            resp = backend.get(
+                f"/quizzes/{quiz_id}/questions",
+                headers=headers
             )
             if resp.status_code == 200:
                 return True, resp.json()
@@ -64,10 +60,9 @@ class QuizService:
             headers = {}
             if token:
                 headers['Authorization'] = f'Bearer {token}'
-            resp = requests.get(
-                f"{BACKEND_URL}/quizzes/course/{course_id}",
-                headers=headers,
-                timeout=10
+            resp = backend.get(
+                f"/quizzes/course/{course_id}",
+                headers=headers
             )
             if resp.status_code == 200:
                 return True, resp.json()
@@ -79,11 +74,10 @@ class QuizService:
     def update_answer_key(course_id: int, answer_key: str, token: str) -> Tuple[bool, Any]:
         """Update answer key for a course"""
         try:
-            resp = requests.put(
-                f"{BACKEND_URL}/quizzes/courses/{course_id}/answer-key",
+            resp = backend.put(
+                f"/quizzes/courses/{course_id}/answer-key",
                 json={'quiz_answer_key': answer_key},
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+                headers={'Authorization': f'Bearer {token}'}
             )
             if resp.status_code == 200:
                 return True, resp.json()
@@ -95,10 +89,9 @@ class QuizService:
     def delete_question(question_id: int, token: str) -> Tuple[bool, Any]:
         """Delete a question from a quiz"""
         try:
-            resp = requests.delete(
-                f"{BACKEND_URL}/quizzes/questions/{question_id}",
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
+            resp = backend.delete(
+                f"/quizzes/questions/{question_id}",
+                headers={'Authorization': f'Bearer {token}'}
             )
             if resp.status_code == 200:
                 return True, resp.json()
@@ -0,0 +1,91 @@
+import sys
+from pathlib import Path
+
+# Ensure backend package is importable
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from app.database import SessionLocal
+from app.services.analyst_service import _course_detail_statements, _courses_analytics_statement
+from app.services.admin_service import _course_students_statement
+from app.repositories.participation_repo import _public_reviews_statement, _student_enrollments_statement
+
+
+# Indexes created by backend/database/migrations/002_add_query_indexes.sql
+QUERY_INDEXES = [
+    "idx_enrollment_course_completion",
+    "idx_enrollment_student_date",
+    "idx_enrollment_public_reviews",
+    "idx_teaching_instructor",
+    "idx_course_approval_status",
+    "idx_course_created_by_approval",
+    "idx_course_content_course",
+    "idx_course_content_topic",
+    "idx_course_topic_course_sequence",
+]
+
+
+# --------------------------------------------------
+# Fixture → DB Session
+# --------------------------------------------------
+
+@pytest.fixture(scope="module")
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+def explain(db, statement) -> str:
+    """Plan text with sequential scans disabled, so small test tables still
+    show whether an index *can* serve the statement"""
+    sql = statement.compile(
+        dialect=postgresql.dialect(),
+        compile_kwargs={"literal_binds": True}
+    )
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    rows = db.execute(text(f"EXPLAIN {sql}")).scalars().all()
+    return "\n".join(rows)
+
+
+# --------------------------------------------------
+# 1️⃣ Migration Applied
+# --------------------------------------------------
+
+def test_query_indexes_exist(db):
+    existing = set(db.execute(text(
+        "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()"
+    )).scalars())
+
+    assert set(QUERY_INDEXES) <= existing
+
+
+# --------------------------------------------------
+# 2️⃣ Analyst / Admin Plans
+# --------------------------------------------------
+
+def test_course_detail_enrollments_use_course_index(db):
+    _, enrollments, _ = _course_detail_statements(1)
+    assert "idx_enrollment_course_completion" in explain(db, enrollments)
+
+
+def test_courses_analytics_uses_course_index(db):
+    assert "idx_enrollment_course_completion" in explain(db, _courses_analytics_statement())
+
+
+def test_course_students_use_course_index(db):
+    assert "idx_enrollment_course_completion" in explain(db, _course_students_statement(1))
+
+
+def test_public_reviews_use_partial_index(db):
+    assert "idx_enrollment_public_reviews" in explain(db, _public_reviews_statement(1))
+
+
+def test_student_enrollments_use_date_index(db):
+    assert "idx_enrollment_student_date" in explain(db, _student_enrollments_statement(1))
@@ -0,0 +1,102 @@
+"""
+Service-level test fixtures: an isolated in-memory SQLite database with the
+ORM schema, plus a statement counter for query-budget assertions.
+"""
+import sys
+import os
+
+from pathlib import Path
+from dotenv import load_dotenv
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# Ensure backend package is importable
+backend_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+sys.path.insert(0, backend_path)
+
+# Load environment variables from project .env if present; the services under
+# test run against their own engine, so any URL is enough to import app.database
+load_dotenv(Path(__file__).parent.parent.parent / '.env')
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+
+from app.database import Base
+import app.models  # noqa: F401  (register all tables on Base.metadata)
+
+
+# --------------------------------------------------
+# Fixture → Isolated Engine / Session
+# --------------------------------------------------
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+# --------------------------------------------------
+# Fixture → Statement Counter
+# --------------------------------------------------
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+
+
+@pytest.fixture
+def query_counter(engine):
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+
+
+# --------------------------------------------------
+# Fixture → Empty Catalog Cache
+# --------------------------------------------------
+# The catalog cache is process-wide; each test has its own database.
+
+@pytest.fixture(autouse=True)
+def reset_catalog_cache():
+    from app.core.catalog_cache import catalog_cache
+    catalog_cache.invalidate()
+    yield
+    catalog_cache.invalidate()
+
+
+# --------------------------------------------------
+# Fixture → Empty Course Search Index
+# --------------------------------------------------
+# Also process-wide; cleared so each test builds it from its own database.
+
+@pytest.fixture(autouse=True)
+def reset_course_search_index():
+    from app.core.course_search import course_search_index
+    course_search_index.clear()
+    yield
+    course_search_index.clear()
@@ -0,0 +1,218 @@
+import json
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from app.models import User, Student, Instructor, Course, Enrollment, Teaching
+from app.services.admin_service import (
+    get_all_courses_admin_service,
+    get_pending_courses_service,
+    get_course_details_admin_service,
+    get_course_students_service,
+    stream_course_students_service,
+    get_student_profile_service
+)
+
+
+def add_instructor(db, key: str) -> int:
+    user = User(name=key, email=f"{key}@test.io", password="x", role="Instructor")
+    db.add(user)
+    db.flush()
+    db.add(Instructor(user_id=user.user_id))
+    return user.user_id
+
+
+def seed_courses(db, num_courses: int = 12):
+    """Every third course is pending; each course has an assistant assigned
+    first and its lead instructor assigned later."""
+    assistant = add_instructor(db, "assistant")
+
+    for i in range(num_courses):
+        lead = add_instructor(db, f"lead{i}")
+        course = Course(
+            title=f"Course {i}",
+            category="Data" if i % 2 else "Web",
+            level="Beginner",
+            approval_status="Pending" if i % 3 == 0 else "Approved"
+        )
+        db.add(course)
+        db.flush()
+        db.add(Teaching(
+            course_id=course.course_id, instructor_user_id=assistant,
+            assigned_date=date(2024, 1, 1), role_in_course="Assistant"
+        ))
+        db.add(Teaching(
+            course_id=course.course_id, instructor_user_id=lead,
+            assigned_date=date(2024, 2, 1), role_in_course="Lead Instructor"
+        ))
+
+    # No teaching assignment at all
+    db.add(Course(title="Orphan", approval_status="Pending"))
+    db.commit()
+
+
+# --------------------------------------------------
+# Course Listing
+# --------------------------------------------------
+
+def test_courses_resolve_lead_instructor_in_one_query(db, query_counter):
+    seed_courses(db)
+    query_counter.count = 0
+
+    courses = get_all_courses_admin_service(db)
+
+    assert query_counter.count == 1
+    assert len(courses) == 13
+    assert [c["instructor_name"] for c in courses[:3]] == ["lead0", "lead1", "lead2"]
+    assert courses[-1]["instructor_name"] == "Unknown"
+
+
+def test_courses_filtering_and_pagination(db):
+    seed_courses(db)
+
+    web = get_all_courses_admin_service(db, approval_status="Approved", category="Web")
+    assert {c["title"] for c in web} == {"Course 2", "Course 4", "Course 8", "Course 10"}
+
+    page = get_all_courses_admin_service(db, limit=5, offset=10)
+    assert [c["title"] for c in page] == ["Course 10", "Course 11", "Orphan"]
+
+
+def test_pending_courses(db, query_counter):
+    seed_courses(db)
+    query_counter.count = 0
+
+    pending = get_pending_courses_service(db)
+
+    assert query_counter.count == 1
+    assert [c["title"] for c in pending] == ["Course 0", "Course 3", "Course 6", "Course 9", "Orphan"]
+    assert pending[0]["instructor_name"] == "lead0"
+
+
+def test_course_details_lead_instructor(db):
+    seed_courses(db)
+
+    details = get_course_details_admin_service(db, 2)
+
+    assert details["instructor_name"] == "lead1"
+    assert details["instructor_email"] == "lead1@test.io"
+
+
+def seed_roster(db, num_students: int = 25, num_courses: int = 3):
+    """Every student enrolls in every course and rates the first one."""
+    courses = [Course(title=f"Course {c}", category="Data", level="Beginner") for c in range(num_courses)]
+    db.add_all(courses)
+    db.flush()
+
+    for i in range(num_students):
+        user = User(name=f"student{i}", email=f"student{i}@test.io", password="x", role="Student")
+        db.add(user)
+        db.flush()
+        db.add(Student(user_id=user.user_id, country="NZ"))
+        for c, course in enumerate(courses):
+            db.add(Enrollment(
+                student_user_id=user.user_id,
+                course_id=course.course_id,
+                enrollment_date=date.today(),
+                completion_status="Completed" if i % 2 else "In Progress",
+                rating=5 if c == 0 else None
+            ))
+
+    db.commit()
+
+
+# --------------------------------------------------
+# Course Students
+# --------------------------------------------------
+
+def test_course_students_keyset_pages_cover_roster(db, query_counter):
+    seed_roster(db)
+    query_counter.count = 0
+
+    full = get_course_students_service(db, 1)
+    assert query_counter.count == 2
+    assert full["total_students"] == 25
+    assert full["next_cursor"] is None
+
+    collected, cursor = [], None
+    while True:
+        page = get_course_students_service(db, 1, limit=10, cursor=cursor)
+        assert page["total_students"] == 25
+        collected += page["students"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert collected == full["students"]
+
+
+def test_course_students_missing_course(db):
+    with pytest.raises(HTTPException) as e:
+        get_course_students_service(db, 99)
+    assert e.value.status_code == 404
+
+
+def test_stream_course_students_is_ndjson(db):
+    seed_roster(db, num_students=5)
+
+    lines = list(stream_course_students_service(db, 1))
+
+    assert len(lines) == 5
+    assert all(line.endswith("\n") for line in lines)
+    assert [json.loads(line)["student_name"] for line in lines] == [f"student{i}" for i in range(5)]
+
+
+def test_stream_does_not_use_request_session_after_return(db, monkeypatch):
+    seed_roster(db, num_students=3)
+
+    stream = stream_course_students_service(db, 1)
+
+    # The handler has returned: get_db's teardown may close the session
+    # before the body is streamed
+    db.close()
+
+    def closed(*args, **kwargs):
+        raise AssertionError("request session used while streaming")
+
+    monkeypatch.setattr(db, "execute", closed)
+
+    assert len(list(stream)) == 3
+
+
+# --------------------------------------------------
+# Student Profile
+# --------------------------------------------------
+
+def test_student_profile_in_two_queries(db, query_counter):
+    seed_roster(db, num_students=2)
+    query_counter.count = 0
+
+    profile = get_student_profile_service(db, 1)
+
+    assert query_counter.count == 2
+    assert profile["country"] == "NZ"
+    assert profile["total_courses"] == 3
+    assert profile["total_ratings"] == 1
+    assert profile["ratings"][0]["course_name"] == "Course 0"
+
+
+def test_student_profile_keyset_pages_cover_profile(db, query_counter):
+    seed_roster(db, num_students=2, num_courses=5)
+    full = get_student_profile_service(db, 1)
+    assert full["next_cursor"] is None
+
+    courses, ratings = [], []
+    cursor = None
+    while True:
+        query_counter.count = 0
+        page = get_student_profile_service(db, 1, limit=2, cursor=cursor)
+        assert query_counter.count == 2
+        assert (page["total_courses"], page["total_ratings"]) == (5, 1)
+        courses.extend(page["courses"])
+        ratings.extend(page["ratings"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert courses == full["courses"]
+    assert ratings == full["ratings"]
@@ -0,0 +1,153 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from app.models import User, Student, Instructor, Course, Enrollment, Teaching
+from app.services import analyst_service
+from app.services.analyst_service import (
+    get_all_instructors_analytics_service,
+    get_all_students_analytics_service,
+    get_platform_overview_service,
+    get_platform_overview_async_service
+)
+
+
+def add_user(db, role: str, key: str) -> int:
+    user = User(name=key, email=f"{key}@test.io", password="x", role=role)
+    db.add(user)
+    db.flush()
+    db.add(Student(user_id=user.user_id) if role == "Student" else Instructor(user_id=user.user_id))
+    return user.user_id
+
+
+def seed_instructors(db, start: int, stop: int, courses_per_instructor: int = 3):
+    """Create instructors, each teaching a few courses with one completed and one ongoing student."""
+    completed = add_user(db, "Student", f"completed{start}")
+    ongoing = add_user(db, "Student", f"ongoing{start}")
+
+    for i in range(start, stop):
+        instructor_id = add_user(db, "Instructor", f"instructor{i}")
+
+        for c in range(courses_per_instructor):
+            course = Course(title=f"Course {i}-{c}", approval_status="Approved")
+            db.add(course)
+            db.flush()
+            db.add(Teaching(course_id=course.course_id, instructor_user_id=instructor_id))
+            for student_id, status in ((completed, "Completed"), (ongoing, "In Progress")):
+                db.add(Enrollment(
+                    student_user_id=student_id,
+                    course_id=course.course_id,
+                    enrollment_date=date.today(),
+                    completion_status=status
+                ))
+
+    db.commit()
+
+
+# --------------------------------------------------
+# Instructors Analytics
+# --------------------------------------------------
+
+def test_instructors_analytics_values(db):
+    seed_instructors(db, 0, 2)
+
+    result = get_all_instructors_analytics_service(db)
+
+    assert result["total_instructors"] == 2
+    for row in result["instructors"]:
+        assert row["total_courses_taught"] == 3
+        assert row["total_students"] == 6
+        assert row["average_course_completion_rate"] == 50.0
+
+
+def test_instructors_analytics_query_count_is_constant(db, query_counter):
+    seed_instructors(db, 0, 2)
+    query_counter.count = 0
+    assert get_all_instructors_analytics_service(db)["total_instructors"] == 2
+    small_count = query_counter.count
+
+    seed_instructors(db, 2, 50)
+    query_counter.count = 0
+    assert get_all_instructors_analytics_service(db)["total_instructors"] == 50
+    large_count = query_counter.count
+
+    assert large_count == small_count
+
+
+# --------------------------------------------------
+# Students Analytics
+# --------------------------------------------------
+
+def test_students_analytics_keyset_pages_match_full_listing(db):
+    seed_instructors(db, 0, 3, courses_per_instructor=2)
+    for i in range(7):
+        add_user(db, "Student", f"idle{i}")
+    db.commit()
+
+    full = get_all_students_analytics_service(db)
+    assert full["total_students"] == 9
+    assert full["next_cursor"] is None
+
+    pages = []
+    cursor = None
+    while True:
+        page = get_all_students_analytics_service(db, limit=4, cursor=cursor)
+        assert page["total_students"] == 9
+        pages.extend(page["students"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert pages == full["students"]
+    assert pages[0]["total_enrollments"] == 6
+
+
+def test_students_analytics_empty_page_keeps_response_shape(db):
+    expected = {"total_students": 0, "students": [], "next_cursor": None}
+
+    assert get_all_students_analytics_service(db) == expected
+    assert get_all_students_analytics_service(db, limit=4) == expected
+
+
+# --------------------------------------------------
+# Platform Overview Cache
+# --------------------------------------------------
+
+@pytest.fixture
+def overview_cache(monkeypatch):
+    cache = {"value": None, "expires_at": 0.0, "refreshing": False}
+    monkeypatch.setattr(analyst_service, "_overview_cache", cache)
+    return cache
+
+
+def test_cached_overview_refreshes_once_per_ttl(db, query_counter, overview_cache):
+    seed_instructors(db, 0, 1)
+    query_counter.count = 0
+
+    first = get_platform_overview_service(db, cached=True)
+    second = get_platform_overview_service(db, cached=True)
+
+    assert query_counter.count == 1
+    assert second == first
+    assert first["total_instructors"] == 1
+
+
+def test_sync_and_async_share_one_refresh(db, query_counter, overview_cache):
+    seed_instructors(db, 0, 1)
+    stale = get_platform_overview_service(db, cached=True)
+    overview_cache["expires_at"] = 0.0
+
+    # A sync request has claimed the refresh and is still querying
+    assert analyst_service._overview_cache_claim() == (None, True)
+    query_counter.count = 0
+
+    assert get_platform_overview_service(db, cached=True) == stale
+    # The async path sees the same claim and never touches its session
+    assert asyncio.run(get_platform_overview_async_service(None, cached=True)) == stale
+    assert query_counter.count == 0
+
+    analyst_service._overview_cache_store(None)
+    get_platform_overview_service(db, cached=True)
+    assert query_counter.count == 1
+    assert overview_cache["refreshing"] is False
@@ -0,0 +1,51 @@
+import json
+
+from scripts.benchmark_endpoints import (
+    DEFAULT_BASELINE,
+    compare_to_baseline,
+    endpoints,
+    percentile,
+    run_benchmarks
+)
+
+
+def result(p95_ms: float, queries: int) -> dict:
+    return {"p50_ms": p95_ms / 2, "p95_ms": p95_ms, "p99_ms": p95_ms, "mean_ms": p95_ms / 2, "queries": queries, "samples": 10}
+
+
+def test_percentile_nearest_rank():
+    samples = list(range(1, 101))
+    assert percentile(samples, 0.50) == 50
+    assert percentile(samples, 0.95) == 95
+    assert percentile(samples, 0.99) == 99
+    assert percentile([7.0], 0.99) == 7.0
+
+
+def test_compare_flags_query_and_latency_regressions():
+    baseline = {"1000": {"GET /a": result(10, 1), "GET /b": result(10, 1), "GET /c": result(10, 1)}}
+    current = {"1000": {
+        "GET /a": result(11, 1),    # within tolerance
+        "GET /b": result(30, 1),    # p95 tripled
+        "GET /c": result(10, 2),    # one more statement
+        "GET /d": result(99, 9),    # not in the baseline yet
+    }}
+
+    regressions = compare_to_baseline(current, baseline, tolerance=0.25, min_delta_ms=5)
+
+    assert len(regressions) == 2
+    assert "GET /b" in regressions[0] and "p95" in regressions[0]
+    assert "GET /c" in regressions[1] and "SQL statements" in regressions[1]
+
+
+def test_benchmark_runs_every_endpoint():
+    results = run_benchmarks([2000], repeats=1, warmup=0)["2000"]
+
+    assert set(results) == {endpoint.name for endpoint in endpoints()}
+    assert all(r["samples"] >= 1 and r["p99_ms"] >= r["p50_ms"] for r in results.values())
+
+
+def test_stored_baseline_covers_every_endpoint():
+    baseline = json.loads(DEFAULT_BASELINE.read_text())
+    smallest = min(baseline, key=int)
+
+    assert set(baseline[smallest]) == {endpoint.name for endpoint in endpoints()}
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.catalog_cache import CatalogCache, catalog_cache, etag_matches
+from app.database import get_db
+from app.main import app
+from app.models import Course
+from app.services.admin_service import (
+    approve_course_service,
+    reject_course_service,
+    delete_course_request_service
+)
+from app.services.course_service import get_course_catalog_service
+
+
+def seed_courses(db):
+    db.add_all([
+        Course(course_id=1, title="Approved A", approval_status="Approved"),
+        Course(course_id=2, title="Approved B", approval_status="Approved"),
+        Course(course_id=3, title="Pending C", approval_status="Pending"),
+        Course(course_id=4, title="Pending D", approval_status="Pending"),
+    ])
+    db.commit()
+
+
+def catalog_titles(db):
+    return [c["title"] for c in json.loads(get_course_catalog_service(db).body)]
+
+
+@pytest.fixture
+def client(db):
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+def test_catalog_served_from_cache_without_queries(db, query_counter):
+    seed_courses(db)
+
+    first = get_course_catalog_service(db)
+    query_counter.count = 0
+    second = get_course_catalog_service(db)
+
+    assert query_counter.count == 0
+    assert second == first
+    assert [c["title"] for c in json.loads(first.body)] == ["Approved A", "Approved B"]
+
+
+def test_catalog_invalidated_by_admin_writes(db):
+    seed_courses(db)
+    assert catalog_titles(db) == ["Approved A", "Approved B"]
+
+    approve_course_service(db, 3, admin_user_id=None)
+    assert catalog_titles(db) == ["Approved A", "Approved B", "Pending C"]
+
+    etag = get_course_catalog_service(db).etag
+    reject_course_service(db, 4)
+    delete_course_request_service(db, 4)
+    assert catalog_cache.status()["cached"] is False
+    # Same approved set → same ETag, so clients keep their copy
+    assert get_course_catalog_service(db).etag == etag
+
+
+def test_get_courses_revalidates_with_etag(db, client):
+    seed_courses(db)
+
+    response = client.get("/courses")
+    assert response.status_code == 200
+    assert [c["title"] for c in response.json()] == ["Approved A", "Approved B"]
+    etag = response.headers["etag"]
+
+    not_modified = client.get("/courses", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    approve_course_service(db, 3, admin_user_id=None)
+
+    changed = client.get("/courses", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(changed.json()) == 3
+
+
+def test_rebuild_racing_an_invalidation_is_not_stored():
+    cache = CatalogCache(ttl=60)
+
+    def build():
+        # A write commits and invalidates while this snapshot is being read
+        cache.invalidate()
+        return b"[]"
+
+    cache.get(build)
+    assert cache.status()["cached"] is False
+
+    cache.get(lambda: b"[1]")
+    assert cache.status()["cached"] is True
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", "abc"', True),
+    ("*", True),
+    ('"xyz"', False),
+])
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"abc"') is expected
@@ -0,0 +1,189 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.course_search import CourseSearchIndex, course_search_index
+from app.database import get_db
+from app.main import app
+from app.models import Course, Topic, CourseTopic
+from app.services.admin_service import (
+    approve_course_service,
+    reject_course_service,
+    delete_course_request_service
+)
+from app.services.course_service import map_topic_to_course_service
+from app.services.search_service import search_courses_service
+
+
+def course(course_id, title, description=None, category=None, level=None, language=None):
+    return SimpleNamespace(
+        course_id=course_id,
+        title=title,
+        description=description,
+        category=category,
+        level=level,
+        language=language
+    )
+
+
+@pytest.fixture
+def index():
+    index = CourseSearchIndex()
+    index.build(
+        [
+            course(1, "Python Foundations", "Variables and loops.", "Programming", "Beginner", "English"),
+            course(2, "Data Analysis", "Pandas and Python notebooks.", "Data Science", "Intermediate", "English"),
+            course(3, "Advanced Python Systems", "Concurrency in python.", "Programming", "Advanced", "Hindi"),
+            course(4, "Music Theory", "Scales and harmony.", "Music", "Beginner", "Spanish"),
+        ],
+        {2: ["Plotting with matplotlib"], 4: ["Python for musicians"]}
+    )
+    return index
+
+
+def ids(result):
+    return [r["course_id"] for r in result["results"]]
+
+
+# --------------------------------------------------
+# Ranking / Matching
+# --------------------------------------------------
+
+def test_title_matches_rank_above_body_matches(index):
+    result = index.search("python", prefix=False)
+
+    assert result["total"] == 4
+    # Title hits first, then topic names, then descriptions
+    assert set(ids(result)[:2]) == {1, 3}
+    assert ids(result)[2:] == [4, 2]
+
+
+def test_every_query_word_must_match(index):
+    assert ids(index.search("python concurrency")) == [3]
+    assert index.search("python cooking")["total"] == 0
+
+
+def test_topic_names_are_searchable(index):
+    assert ids(index.search("matplotlib")) == [2]
+
+
+def test_last_word_matches_as_prefix(index):
+    assert ids(index.search("pyth", prefix=False)) == []
+    assert set(ids(index.search("pyth"))) == {1, 2, 3, 4}
+    assert ids(index.search("data anal")) == [2]
+    # A trailing space ends the word
+    assert ids(index.search("anal ")) == []
+
+
+def test_empty_query_lists_courses_by_title(index):
+    result = index.search("", limit=2, offset=1)
+
+    assert result["total"] == 4
+    assert [r["title"] for r in result["results"]] == ["Data Analysis", "Music Theory"]
+
+
+# --------------------------------------------------
+# Facets
+# --------------------------------------------------
+
+def test_facet_counts_and_filters(index):
+    result = index.search("python", filters={"category": "Programming"})
+
+    assert set(ids(result)) == {1, 3}
+    assert result["total"] == 2
+    # A field's own filter is ignored for its counts ...
+    assert result["facets"]["category"] == {"Programming": 2, "Data Science": 1, "Music": 1}
+    # ... the other filters are applied
+    assert result["facets"]["level"] == {"Beginner": 1, "Advanced": 1}
+    assert result["facets"]["language"] == {"English": 1, "Hindi": 1}
+
+
+# --------------------------------------------------
+# Maintenance
+# --------------------------------------------------
+
+def test_upsert_and_remove_update_postings(index):
+    index.upsert(course(4, "Jazz Piano"), [])
+    assert ids(index.search("music")) == []
+    assert ids(index.search("jazz")) == [4]
+
+    index.remove(4)
+    assert 4 not in index
+    assert index.search("jazz")["total"] == 0
+    assert index.search("")["facets"]["category"] == {"Programming": 2, "Data Science": 1}
+
+
+def test_build_from_stale_snapshot_is_discarded(index):
+    version = index.version
+    index.upsert(course(5, "Statistics"), [])
+
+    assert not index.build([], {}, version=version)
+    assert ids(index.search("statistics")) == [5]
+
+
+# --------------------------------------------------
+# Service / Write Hooks
+# --------------------------------------------------
+
+def seed_courses(db):
+    db.add_all([
+        Course(course_id=1, title="Intro to Databases", category="Programming", approval_status="Approved"),
+        Course(course_id=2, title="Database Internals", category="Programming", approval_status="Pending"),
+        Course(course_id=3, title="Relational Algebra", category="Mathematics", approval_status="Pending"),
+        Topic(topic_id=1, name="Query Optimizers"),
+        CourseTopic(course_id=1, topic_id=1, sequence_order=1),
+    ])
+    db.commit()
+
+
+def search_ids(db, q):
+    return ids(search_courses_service(db, q))
+
+
+def test_index_built_once_from_database(db, query_counter):
+    seed_courses(db)
+    query_counter.count = 0
+
+    assert search_ids(db, "optimizers") == [1]
+    assert query_counter.count == 2
+
+    query_counter.count = 0
+    assert search_ids(db, "databases") == [1]
+    assert query_counter.count == 0
+
+
+def test_write_hooks_keep_index_current(db):
+    seed_courses(db)
+    assert search_ids(db, "internals") == []
+
+    approve_course_service(db, 2, admin_user_id=None)
+    assert search_ids(db, "internals") == [2]
+    assert len(search_courses_service(db, "datab")["results"]) == 2
+
+    db.add(Topic(topic_id=2, name="B-Trees"))
+    db.commit()
+    map_topic_to_course_service(db, 2, 2, 1)
+    assert search_ids(db, "trees") == [2]
+
+    reject_course_service(db, 3)
+    delete_course_request_service(db, 3)
+    assert search_ids(db, "relational") == []
+    assert len(course_search_index) == 2
+
+
+def test_search_route_is_not_shadowed_by_course_id(db):
+    seed_courses(db)
+
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        response = TestClient(app).get("/courses/search", params={"q": "intro dat", "category": "Programming"})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["query"] == "intro dat"
+    assert body["total"] == 1
+    assert body["results"][0]["title"] == "Intro to Databases"
+    assert body["facets"]["category"] == {"Programming": 1}
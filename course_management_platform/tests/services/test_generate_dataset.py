@@ -0,0 +1,72 @@
+import hashlib
+from collections import Counter
+
+import pytest
+from sqlalchemy import text
+
+from scripts.generate_dataset import DatasetPlan, GENERATORS, LOAD_ORDER, load_dataset
+
+
+def digest(plan: DatasetPlan) -> dict:
+    result = {}
+    for table in LOAD_ORDER:
+        _, rows = GENERATORS[table](plan)
+        result[table] = hashlib.sha256(repr(list(rows)).encode()).hexdigest()
+    return result
+
+
+def test_same_seed_generates_identical_rows():
+    assert digest(DatasetPlan(3000, seed=7)) == digest(DatasetPlan(3000, seed=7))
+    assert digest(DatasetPlan(3000, seed=7))["enrollment"] != digest(DatasetPlan(3000, seed=8))["enrollment"]
+
+
+def test_enrollments_hit_target_with_zipfian_popularity():
+    plan = DatasetPlan(20_000)
+    columns, rows = GENERATORS["enrollment"](plan)
+    rows = list(rows)
+
+    assert len(rows) == 20_000
+    assert len({(r[0], r[1]) for r in rows}) == len(rows)  # (student, course) is the primary key
+
+    # Only approved courses take enrollments, and popularity is heavily skewed
+    per_course = Counter(r[1] for r in rows)
+    assert set(per_course) <= set(plan.enrollable)
+    top, *_, median = sorted(per_course.values(), reverse=True)[:len(per_course) // 2]
+    assert top > 10 * median
+
+
+def test_load_dataset_is_consistent(engine):
+    loaded = load_dataset(engine, DatasetPlan(2000))
+
+    with engine.connect() as conn:
+        def scalar(sql):
+            return conn.execute(text(sql)).scalar()
+
+        assert scalar("SELECT COUNT(*) FROM enrollment") == loaded["enrollment"] == 2000
+        assert scalar("SELECT COUNT(*) FROM users") == loaded["users"]
+
+        # Every user has exactly one ISA subtype row matching their role
+        assert scalar("""
+            SELECT COUNT(*) FROM users u
+            WHERE (SELECT COUNT(*) FROM student s WHERE s.user_id = u.user_id)
+                + (SELECT COUNT(*) FROM instructor i WHERE i.user_id = u.user_id)
+                + (SELECT COUNT(*) FROM administrator a WHERE a.user_id = u.user_id)
+                + (SELECT COUNT(*) FROM data_analyst d WHERE d.user_id = u.user_id) != 1
+        """) == 0
+
+        # Progress points at a topic of the enrolled course
+        assert scalar("""
+            SELECT COUNT(*) FROM enrollment e
+            LEFT JOIN course_topic ct ON ct.course_id = e.course_id AND ct.topic_id = e.current_topic
+            WHERE ct.topic_id IS NULL
+        """) == 0
+
+        # Answer keys match the quiz questions
+        assert scalar("""
+            SELECT COUNT(*) FROM course c
+            JOIN quiz_question q ON q.quiz_id = c.course_id
+            WHERE substr(c.quiz_answer_key, q."order", 1) != q.correct_answer
+        """) == 0
+
+    with pytest.raises(RuntimeError):
+        load_dataset(engine, DatasetPlan(2000))
@@ -0,0 +1,82 @@
+import threading
+
+from app.core.job_queue import JobQueue
+
+
+class FakeSession:
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+# --------------------------------------------------
+# Background Job Queue
+# --------------------------------------------------
+
+def test_queue_coalesces_pending_jobs_and_drains():
+    queue = JobQueue(FakeSession, num_workers=1, max_backlog=10, name="test")
+    gate = threading.Event()
+    runs = []
+
+    def blocker(db):
+        gate.wait(5)
+
+    def recompute(db, course_id):
+        runs.append(course_id)
+
+    queue.start()
+    assert queue.submit(blocker)
+
+    # While the worker is busy, duplicate keyed jobs collapse into one
+    for _ in range(5):
+        assert queue.submit(recompute, 7, key=("recompute_course", 7))
+    assert queue.submit(recompute, 8, key=("recompute_course", 8))
+
+    gate.set()
+    assert queue.drain(timeout=5)
+
+    status = queue.status()
+    assert runs == [7, 8]
+    assert status["coalesced"] == 4
+    assert status["completed"] == 3
+    assert status["backlog"] == 0
+
+
+def test_queue_rejects_when_stopped_or_full():
+    queue = JobQueue(FakeSession, num_workers=1, max_backlog=1, name="test")
+    assert not queue.submit(lambda db: None)
+
+    gate = threading.Event()
+    started = threading.Event()
+
+    def blocker(db):
+        started.set()
+        gate.wait(5)
+
+    queue.start()
+    queue.submit(blocker)
+    # Wait for the worker to pick up the blocking job
+    assert started.wait(timeout=5)
+
+    assert queue.submit(lambda db: None)
+    assert not queue.submit(lambda db: None)
+    assert queue.status()["rejected"] == 1
+
+    gate.set()
+    assert queue.drain(timeout=5)
+
+
+def test_failed_job_is_recorded():
+    queue = JobQueue(FakeSession, num_workers=1, max_backlog=10, name="test")
+    queue.start()
+
+    def boom(db):
+        raise RuntimeError("no database")
+
+    queue.submit(boom)
+    queue.drain(timeout=5)
+
+    assert queue.status()["failed"] == 1
+    assert "no database" in queue.status()["last_error"]
@@ -0,0 +1,36 @@
+from app.database import get_db
+from app.main import app
+from scripts.load_test_student_journey import (
+    STEPS,
+    in_process_client_factory,
+    run_load_test,
+    saturation_point
+)
+
+
+def stage(concurrency: int, throughput_rps: float) -> dict:
+    return {"concurrency": concurrency, "throughput_rps": throughput_rps, "sessions_per_s": throughput_rps / 10}
+
+
+def test_saturation_point_is_last_stage_that_still_scaled():
+    stages = [stage(1, 100), stage(4, 350), stage(16, 370), stage(64, 360)]
+    assert saturation_point(stages)["concurrency"] == 4
+    assert saturation_point([stage(1, 100), stage(4, 300)]) is None
+
+
+def test_student_journey_runs_every_step_without_errors():
+    try:
+        stages = run_load_test(
+            in_process_client_factory(2000, seed=1, timeout=30),
+            concurrency_levels=[1, 2],
+            sessions=3
+        )
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    for result in stages:
+        assert result["sessions_completed"] == 3
+        assert result["error_rate"] == 0
+        assert list(result["steps"]) == STEPS
+        # One progress update per course topic
+        assert result["steps"]["progress"]["requests"] >= result["steps"]["topics"]["requests"]
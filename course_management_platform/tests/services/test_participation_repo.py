@@ -0,0 +1,142 @@
+from datetime import date
+
+from app.models import User, Student, Instructor, Course, Enrollment, Teaching
+import pytest
+from fastapi import HTTPException
+
+from app.repositories.participation_repo import get_courses_by_instructor
+from app.services.participation_service import (
+    get_student_enrollment_service,
+    get_student_enrollments_batch_service,
+    get_instructors_by_courses_service
+)
+
+
+def add_user(db, role: str, key: str) -> int:
+    user = User(name=key, email=f"{key}@test.io", password="x", role=role)
+    db.add(user)
+    db.flush()
+    db.add(Student(user_id=user.user_id) if role == "Student" else Instructor(user_id=user.user_id))
+    return user.user_id
+
+
+# --------------------------------------------------
+# Courses By Instructor
+# --------------------------------------------------
+
+def test_courses_by_instructor_counts_in_one_query(db, query_counter):
+    instructor_id = add_user(db, "Instructor", "instructor")
+    other_id = add_user(db, "Instructor", "other")
+    students = [add_user(db, "Student", f"student{i}") for i in range(4)]
+
+    for title, enrolled in (("B course", 4), ("A course", 2), ("C empty", 0)):
+        course = Course(title=title)
+        db.add(course)
+        db.flush()
+        db.add(Teaching(course_id=course.course_id, instructor_user_id=instructor_id, role_in_course="Lead Instructor"))
+        for i, student_id in enumerate(students[:enrolled]):
+            db.add(Enrollment(
+                student_user_id=student_id,
+                course_id=course.course_id,
+                enrollment_date=date.today(),
+                completion_status="Completed" if i % 2 else "In Progress"
+            ))
+
+    # Enrollments in someone else's course must not leak into the counts
+    other_course = Course(title="Other")
+    db.add(other_course)
+    db.flush()
+    db.add(Teaching(course_id=other_course.course_id, instructor_user_id=other_id))
+    db.add(Enrollment(student_user_id=students[0], course_id=other_course.course_id, completion_status="Completed"))
+    db.commit()
+
+    query_counter.count = 0
+    courses = get_courses_by_instructor(db, instructor_id)
+
+    assert query_counter.count == 1
+    assert [
+        (c["course_title"], c["enrollment_count"], c["completion_count"]) for c in courses
+    ] == [("A course", 2, 1), ("B course", 4, 2), ("C empty", 0, 0)]
+
+
+# --------------------------------------------------
+# Enrollment Lookups By (Student, Course)
+# --------------------------------------------------
+
+def seed_enrollments(db, num_courses: int = 5):
+    student_id = add_user(db, "Student", "student")
+    other_id = add_user(db, "Student", "other")
+    for c in range(num_courses):
+        course = Course(title=f"Course {c}")
+        db.add(course)
+        db.flush()
+        db.add(Enrollment(student_user_id=other_id, course_id=course.course_id, enrollment_date=date.today()))
+        # The student skips the last course
+        if c < num_courses - 1:
+            db.add(Enrollment(
+                student_user_id=student_id,
+                course_id=course.course_id,
+                enrollment_date=date.today(),
+                current_topic=None,
+                completion_status="In Progress"
+            ))
+    db.commit()
+    return student_id
+
+
+def test_single_enrollment_lookup(db, query_counter):
+    student_id = seed_enrollments(db)
+    query_counter.count = 0
+
+    enrollment = get_student_enrollment_service(db, student_id, 2)
+
+    assert query_counter.count == 1
+    assert enrollment["course_id"] == 2
+    assert enrollment["course_title"] == "Course 1"
+
+    with pytest.raises(HTTPException) as e:
+        get_student_enrollment_service(db, student_id, 5)
+    assert e.value.status_code == 404
+
+
+def test_batched_enrollment_lookup(db, query_counter):
+    student_id = seed_enrollments(db)
+    query_counter.count = 0
+
+    enrollments = get_student_enrollments_batch_service(db, student_id, [1, 3, 3, 5, 99])
+
+    assert query_counter.count == 1
+    assert sorted(e["course_id"] for e in enrollments) == [1, 3]
+
+    with pytest.raises(HTTPException) as e:
+        get_student_enrollments_batch_service(db, student_id, list(range(101)))
+    assert e.value.status_code == 400
+
+
+# --------------------------------------------------
+# Instructors For Many Courses
+# --------------------------------------------------
+
+def test_instructors_grouped_by_course(db, query_counter):
+    lead = add_user(db, "Instructor", "lead")
+    assistant = add_user(db, "Instructor", "assistant")
+    for title in ("A", "B", "C"):
+        db.add(Course(title=title))
+    db.flush()
+    db.add(Teaching(course_id=1, instructor_user_id=lead, assigned_date=date(2024, 1, 1)))
+    db.add(Teaching(course_id=1, instructor_user_id=assistant, assigned_date=date(2024, 2, 1)))
+    db.add(Teaching(course_id=2, instructor_user_id=assistant, assigned_date=date(2024, 1, 1)))
+    db.commit()
+
+    query_counter.count = 0
+    everything = get_instructors_by_courses_service(db)
+    assert query_counter.count == 1
+    assert {course_id: [i["instructor_name"] for i in instrs] for course_id, instrs in everything.items()} == {
+        1: ["lead", "assistant"],
+        2: ["assistant"],
+    }
+
+    # Requested courses without instructors get an empty list
+    some = get_instructors_by_courses_service(db, [2, 3])
+    assert [i["instructor_user_id"] for i in some[2]] == [assistant]
+    assert some[3] == []
@@ -0,0 +1,129 @@
+import logging
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import query_counter
+from app.core.jwt_handler import create_access_token
+from app.database import get_db
+from app.main import app
+from app.models import User, Student, Instructor, Course, Enrollment, Teaching
+
+
+NUM_STUDENTS = 30
+INSTRUCTOR_ID = NUM_STUDENTS + 1
+
+# Path parameters that need an id other than 1
+PATH_IDS = {"instructor_user_id": INSTRUCTOR_ID}
+
+
+def seed(db, num_students: int = NUM_STUDENTS, num_courses: int = 15):
+    """User 1 is a student and course 1 exists, so most {id} path params can be 1."""
+    for i in range(1, num_students + 1):
+        db.add(User(user_id=i, name=f"Student {i}", email=f"s{i}@test.io", password="x", role="Student"))
+        db.add(Student(user_id=i))
+
+    instructor_id = num_students + 1
+    db.add(User(user_id=instructor_id, name="Instructor", email="i@test.io", password="x", role="Instructor"))
+    db.add(Instructor(user_id=instructor_id))
+
+    for c in range(1, num_courses + 1):
+        db.add(Course(course_id=c, title=f"Course {c}", approval_status="Approved"))
+        db.add(Teaching(course_id=c, instructor_user_id=instructor_id))
+        for s in range(1, num_students + 1):
+            db.add(Enrollment(
+                student_user_id=s,
+                course_id=c,
+                enrollment_date=date.today(),
+                completion_status="Completed" if s % 2 else "In Progress",
+                rating=4,
+                is_review_public=True
+            ))
+
+    db.commit()
+
+
+def get_paths():
+    """Every GET path in the schema with its ids and required query params filled in"""
+    for path, operations in app.openapi()["paths"].items():
+        # Async twins run on their own engine and share the sync budgets
+        if "get" not in operations or path.startswith("/async"):
+            continue
+        query = []
+        for param in operations["get"].get("parameters", []):
+            value = PATH_IDS.get(param["name"], 1)
+            if param["in"] == "path":
+                path = path.replace("{" + param["name"] + "}", str(value))
+            elif param["in"] == "query" and param.get("required"):
+                query.append(f"{param['name']}={value}")
+        yield path + ("?" + "&".join(query) if query else "")
+
+
+@pytest.fixture
+def client(db, engine, monkeypatch):
+    query_counter.instrument_engine(engine)
+    monkeypatch.setattr(query_counter, "QUERY_HEADERS_ENABLED", True)
+
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        # Unbudgeted routes are only probed, so their failures must not abort the sweep
+        yield TestClient(app, raise_server_exceptions=False)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture
+def auth_headers():
+    token = create_access_token({"user_id": 1, "role": "Administrator", "admin_level": "Senior"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+# --------------------------------------------------
+# Query Budgets
+# --------------------------------------------------
+
+def test_budgeted_endpoints_stay_within_budget(db, client, auth_headers):
+    seed(db)
+
+    checked = 0
+    over_budget = []
+    for path in get_paths():
+        response = client.get(path, headers=auth_headers)
+        if "x-db-query-budget" not in response.headers:
+            continue
+
+        assert response.status_code == 200, path
+        checked += 1
+
+        count = int(response.headers["x-db-query-count"])
+        budget = int(response.headers["x-db-query-budget"])
+        if count > budget:
+            over_budget.append(f"{path}: {count} statements (budget {budget})")
+
+    assert checked
+    assert not over_budget, "\n".join(over_budget)
+
+
+# --------------------------------------------------
+# N+1 Detection
+# --------------------------------------------------
+
+def test_repeated_statement_is_flagged(db, client, caplog):
+    seed(db, num_students=2, num_courses=query_counter.N_PLUS_ONE_THRESHOLD)
+
+    @app.get("/_test/n_plus_one")
+    def n_plus_one():
+        for course_id in range(1, query_counter.N_PLUS_ONE_THRESHOLD + 1):
+            db.get(Course, course_id)
+        return {}
+
+    try:
+        with caplog.at_level(logging.WARNING, logger=query_counter.__name__):
+            response = client.get("/_test/n_plus_one")
+    finally:
+        app.router.routes.pop()
+
+    assert int(response.headers["x-db-query-count"]) == query_counter.N_PLUS_ONE_THRESHOLD
+    assert response.headers["x-db-repeated-statements"] == "1"
+    assert "Possible N+1" in caplog.text
@@ -0,0 +1,78 @@
+"""
+EXPLAIN QUERY PLAN checks: the statements issued by the analyst, admin and
+repository read paths are served by the indexes declared on the models
+(and created by backend/database/migrations/002_add_query_indexes.sql).
+"""
+import re
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+
+from app.database import Base
+from app.models import Course
+from app.repositories import participation_repo, course_repo, content_repo
+from app.services import analyst_service, admin_service
+
+MIGRATION = (
+    Path(__file__).parent.parent.parent
+    / "backend" / "database" / "migrations" / "002_add_query_indexes.sql"
+)
+
+
+def query_plans(engine, fn) -> str:
+    """Run fn, then EXPLAIN QUERY PLAN every SELECT it issued; returns all plan lines"""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    lines = []
+    with engine.connect() as conn:
+        for statement, parameters in captured:
+            if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+                plan = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)
+                lines += [row[3] for row in plan]
+    return "\n".join(lines)
+
+
+@pytest.fixture
+def course(db):
+    db.add(Course(course_id=1, title="Course 1", approval_status="Approved"))
+    db.commit()
+
+
+@pytest.mark.parametrize("index, read", [
+    ("idx_enrollment_course_completion", lambda db: analyst_service.get_course_detailed_analytics_service(db, 1)),
+    ("idx_enrollment_course_completion", lambda db: analyst_service.get_all_courses_analytics_service(db)),
+    ("idx_enrollment_course_completion", lambda db: admin_service.get_course_students_service(db, 1)),
+    ("idx_teaching_instructor", lambda db: analyst_service.get_all_instructors_analytics_service(db)),
+    ("idx_teaching_instructor", lambda db: participation_repo.get_courses_by_instructor(db, 1)),
+    ("idx_course_approval_status", lambda db: admin_service.get_pending_courses_service(db)),
+    ("idx_course_approval_status", lambda db: course_repo.get_approved_courses(db)),
+    ("idx_course_created_by_approval", lambda db: course_repo.get_pending_courses_by_instructor(db, 1)),
+    ("idx_enrollment_public_reviews", lambda db: participation_repo.get_public_reviews_by_course(db, 1)),
+    ("idx_course_topic_course_sequence", lambda db: course_repo.get_topics_by_course(db, 1)),
+    ("idx_course_content_course", lambda db: content_repo.get_content_by_course(db, 1)),
+    ("idx_course_content_topic", lambda db: content_repo.get_content_by_topic(db, 1)),
+])
+def test_read_path_uses_index(db, engine, course, index, read):
+    assert index in query_plans(engine, lambda: read(db))
+
+
+def test_migration_matches_model_indexes():
+    declared = {
+        index.name
+        for table in Base.metadata.tables.values()
+        for index in table.indexes
+        if index.name and index.name.startswith("idx_")
+    }
+    migrated = set(re.findall(r"CREATE INDEX CONCURRENTLY IF NOT EXISTS (\w+)", MIGRATION.read_text()))
+
+    assert migrated == declared
@@ -0,0 +1,194 @@
+from datetime import date, datetime, timedelta, timezone
+
+from app.models import (
+    User,
+    Student,
+    Instructor,
+    Course,
+    Enrollment,
+    Teaching,
+    Statistics,
+    StudentStatistics,
+    InstructorStatistics
+)
+from app.repositories import participation_repo
+from app.services.statistics_service import (
+    recompute_platform_service,
+    bulk_recompute_platform_service,
+    record_enrollment_created_service,
+    record_completion_change_service,
+    prepare_enrollment_statistics_service,
+    get_fresh_student_statistics_service,
+    get_fresh_instructor_statistics_service,
+    _is_stale
+)
+
+
+def snapshot(db):
+    return (
+        [
+            (s.course_id, s.total_enrollments, s.active_enrollments, float(s.completion_rate))
+            for s in db.query(Statistics).order_by(Statistics.course_id)
+        ],
+        [
+            (s.student_user_id, s.total_enrollments, s.completed_courses, s.active_courses)
+            for s in db.query(StudentStatistics).order_by(StudentStatistics.student_user_id)
+        ],
+        [
+            (s.instructor_user_id, s.total_courses_taught, s.total_students)
+            for s in db.query(InstructorStatistics).order_by(InstructorStatistics.instructor_user_id)
+        ],
+    )
+
+
+def seed(db):
+    for user_id, role, subtype in ((1, "Student", Student), (2, "Student", Student), (3, "Instructor", Instructor)):
+        db.add(User(user_id=user_id, name=f"user{user_id}", email=f"user{user_id}@test.io", password="x", role=role))
+        db.add(subtype(user_id=user_id))
+    for course_id in (10, 11):
+        db.add(Course(course_id=course_id, title=f"Course {course_id}", approval_status="Approved"))
+        db.add(Teaching(course_id=course_id, instructor_user_id=3))
+    db.add(Enrollment(student_user_id=1, course_id=10, enrollment_date=date.today(), completion_status="In Progress"))
+    db.commit()
+
+
+# --------------------------------------------------
+# Incremental Statistics
+# --------------------------------------------------
+
+def test_deltas_match_full_recount(db):
+    seed(db)
+    recompute_platform_service(db)
+
+    # Student 1 enrolls in a second course of the same instructor (not a new distinct student)
+    participation_repo.create_enrollment(db, 1, 11)
+    record_enrollment_created_service(db, 1, 11)
+
+    # Student 2 is new to the instructor
+    participation_repo.create_enrollment(db, 2, 10)
+    record_enrollment_created_service(db, 2, 10)
+
+    enrollment = participation_repo.get_enrollment(db, 1, 10)
+    participation_repo.update_completion(db, enrollment, "Completed", date.today())
+    record_completion_change_service(db, 1, 10, was_completed=False, is_completed=True)
+
+    incremental = snapshot(db)
+    recompute_platform_service(db)
+
+    assert incremental == snapshot(db)
+    assert incremental[2] == [(3, 2, 2)]
+
+
+def test_enrollment_delta_creates_missing_rows(db):
+    seed(db)
+
+    participation_repo.create_enrollment(db, 2, 11)
+    record_enrollment_created_service(db, 2, 11)
+
+    assert db.query(Statistics).filter(Statistics.course_id == 11).one().total_enrollments == 1
+    assert db.query(StudentStatistics).filter(StudentStatistics.student_user_id == 2).one().active_courses == 1
+    assert db.query(InstructorStatistics).filter(InstructorStatistics.instructor_user_id == 3).one().total_students == 2
+
+
+def test_queued_deltas_on_new_rows_count_each_enrollment_once(db):
+    seed(db)
+
+    # Both enrollments commit before either queued delta runs
+    for student_user_id in (1, 2):
+        prepare_enrollment_statistics_service(db, student_user_id, 11)
+        participation_repo.create_enrollment(db, student_user_id, 11)
+
+    record_enrollment_created_service(db, 1, 11)
+    record_enrollment_created_service(db, 2, 11)
+
+    assert snapshot(db) == (
+        [(11, 2, 2, 0.0)],
+        [(1, 2, 0, 2), (2, 1, 0, 1)],
+        [(3, 2, 2)],
+    )
+
+
+# --------------------------------------------------
+# Bulk Recompute
+# --------------------------------------------------
+
+def test_bulk_recompute_matches_per_entity_recompute(db):
+    seed(db)
+    db.add(Enrollment(student_user_id=2, course_id=10, enrollment_date=date.today(), completion_status="Completed"))
+    db.commit()
+
+    recompute_platform_service(db)
+    expected = snapshot(db)
+
+    # Introduce drift: a missing course row and a wrong instructor counter
+    db.query(Statistics).filter(Statistics.course_id == 10).delete()
+    db.query(InstructorStatistics).update({"total_students": 99})
+    db.commit()
+
+    report = bulk_recompute_platform_service(db)
+    db.expire_all()
+
+    assert snapshot(db) == expected
+    assert report["courses"]["rows_changed"] == 1
+    assert report["instructors"]["rows_changed"] == 1
+    assert report["students"]["rows_changed"] == 0
+
+    # Nothing left to fix on a second run
+    report = bulk_recompute_platform_service(db)
+    assert all(step["rows_changed"] == 0 for step in report.values())
+
+
+# --------------------------------------------------
+# Freshness-Aware Reads
+# --------------------------------------------------
+
+def test_fresh_read_serves_stored_row_without_writing(db, query_counter):
+    seed(db)
+
+    first = get_fresh_student_statistics_service(db, 1)
+    assert first["recomputed"] is True
+    assert first["total_enrollments"] == 1
+    assert first["last_updated"] is not None
+
+    query_counter.count = 0
+    second = get_fresh_student_statistics_service(db, 1)
+
+    assert query_counter.count == 1
+    assert second["recomputed"] is False
+    assert second["total_enrollments"] == 1
+
+
+def test_fresh_read_sees_enrollment_deltas(db):
+    seed(db)
+    get_fresh_student_statistics_service(db, 2)
+
+    participation_repo.create_enrollment(db, 2, 11)
+    record_enrollment_created_service(db, 2, 11)
+
+    stats = get_fresh_student_statistics_service(db, 2)
+    assert stats["recomputed"] is False
+    assert stats["active_courses"] == 1
+
+
+def test_stale_row_is_recomputed(db):
+    seed(db)
+    get_fresh_instructor_statistics_service(db, 3)
+
+    # Drift the stored row; it is only corrected once it counts as stale
+    db.query(InstructorStatistics).update({"total_students": 99})
+    db.commit()
+
+    assert get_fresh_instructor_statistics_service(db, 3)["total_students"] == 99
+
+    stats = get_fresh_instructor_statistics_service(db, 3, max_age=0)
+    assert stats["recomputed"] is True
+    assert stats["total_students"] == 1
+
+
+def test_staleness_with_aware_database_clock():
+    # Postgres: now() is timestamptz, last_updated a naive TIMESTAMP
+    db_now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+
+    assert not _is_stale(datetime(2025, 1, 1, 11, 58), db_now, max_age=300)
+    assert _is_stale(datetime(2025, 1, 1, 11, 50), db_now, max_age=300)
+    assert _is_stale(None, db_now, max_age=300)